@@ -0,0 +1,435 @@
+"""Lazy, epoch-based aging, growth and mortality for animal populations.
+
+Advancing a population a year normally means updating every animal's age
+and weight_kg and checking whether it is still alive. An AgingPopulation
+instead keeps one global epoch (years since the population was created),
+and advance() just moves that counter. Each animal added to the population
+keeps working as a normal object, but its age, weight_kg and is_alive
+become views that are computed when read:
+
+    age        epoch - birth epoch (frozen at the age of death)
+    weight_kg  the weight when added, scaled along the class's growth curve
+               (kept at full precision; round it only for display)
+    is_alive   whether the epoch is still before the animal's death epoch
+
+The death epoch is drawn once per animal when it is added, from the
+class's mortality curve (given the age it has already reached), so
+survival needs no per-year dice rolls. Assigning one of the attributes
+(e.g. after an animal eats) re-anchors that animal alone. Nothing is
+written to the animals as time passes.
+
+Aggregate queries do not visit the animals either. Animals are grouped by
+class and birth epoch. Within a group every animal has the same age and
+growth factor, and the group keeps its death epochs sorted, so counting the
+survivors is a bisection. A census therefore costs O(groups x log size),
+whatever the population.
+"""
+import math
+import random
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from itertools import accumulate
+
+from Animal_kingdom_classes import Animal, Lion, Eagle, Snake
+
+# Growth follows a von Bertalanffy curve, (1 - (1 - h) * exp(-k * age)) ** 3 of
+# the adult weight, where h ** 3 is the share of the adult weight at birth.
+# Mortality follows a Gompertz hazard, a * exp(b * age) deaths per year.
+Curve = namedtuple("Curve", ["growth_rate", "birth_fraction", "mortality", "senescence"])
+
+CURVES = {
+    Lion: Curve(growth_rate=0.5, birth_fraction=0.01, mortality=0.01, senescence=0.22),
+    Eagle: Curve(growth_rate=1.5, birth_fraction=0.03, mortality=0.02, senescence=0.10),
+    Snake: Curve(growth_rate=0.3, birth_fraction=0.005, mortality=0.015, senescence=0.09),
+    Animal: Curve(growth_rate=0.5, birth_fraction=0.05, mortality=0.01, senescence=0.10),
+}
+
+MAX_AGE = 200  # Growth factors are tabulated up to this age; older animals stay at the last one
+
+_NEVER = 2 ** 62  # Death epoch of an animal that is not mortal
+
+Census = namedtuple("Census", ["alive", "dead", "mean_age", "total_weight_kg"])
+
+
+def curve_for(cls):
+    """Return the growth and mortality curve of an animal class."""
+    for klass in cls.__mro__:
+        if klass in CURVES:
+            return CURVES[klass]
+    return CURVES[Animal]
+
+
+def growth_table(curve):
+    """Return the growth factor of every whole age from 0 to MAX_AGE."""
+    h = curve.birth_fraction ** (1 / 3)
+    return array("d", [(1 - (1 - h) * math.exp(-curve.growth_rate * age)) ** 3 for age in range(MAX_AGE + 1)])
+
+
+def years_left(curve, age, draw):
+    """Return how many more whole years an animal of ``age`` lives.
+
+    Args:
+        curve (Curve): The animal's curve
+        age (int): The age it has reached alive
+        draw (float): A uniform random number in (0, 1]
+    """
+    a, b = curve.mortality, curve.senescence
+    if a <= 0:
+        return _NEVER
+    # Invert the Gompertz survival function, conditioned on having reached ``age``
+    hazard = a / b * (math.exp(b * age) - 1) - math.log(draw)
+    death_age = math.log1p(b * hazard / a) / b
+    return max(1, math.ceil(death_age - age))
+
+
+_FIELDS = ("age", "weight_kg", "is_alive")  # The attributes a population computes
+
+
+class _Lazy:
+    """Descriptor that computes an animal attribute from its population."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, animal, owner):
+        if animal is None:
+            return self
+        population = owner._population
+        return getattr(population, "_" + self.name)(population._rows[id(animal)])
+
+    def __set__(self, animal, value):
+        population = type(animal)._population
+        getattr(population, "_set_" + self.name)(population._rows[id(animal)], value)
+
+
+def _aging_class(cls, population):
+    """Return a subclass of an animal class backed by ``population``.
+
+    The subclass keeps the original class name and methods, so printing,
+    str() and method behavior are unchanged. It adds no instance storage
+    (empty __slots__), so animals of slotted classes can switch to it as
+    well; the population finds an animal's row by its id.
+    """
+    namespace = {name: _Lazy(name) for name in _FIELDS}
+    namespace["__module__"] = cls.__module__
+    namespace["__doc__"] = cls.__doc__
+    namespace["__slots__"] = ()
+    namespace["_population"] = population
+    return type(cls.__name__, (cls,), namespace)
+
+
+class _Cohort:
+    """Animals of one class born in the same epoch."""
+
+    __slots__ = ("rows", "deaths", "weights", "dirty")
+
+    def __init__(self):
+        self.rows = set()
+        self.deaths = array("q")  # Sorted
+        self.weights = array("d")  # Suffix sums of birth weights, in death order
+        self.dirty = False
+
+    def rebuild(self, population):
+        """Sort the death epochs and sum the birth weights of the survivors."""
+        death = population.death
+        rows = sorted(self.rows, key=death.__getitem__)
+        self.deaths = array("q", map(death.__getitem__, rows))
+        self.weights = array("d", accumulate(map(population.base.__getitem__, reversed(rows))))
+        self.weights.reverse()
+        self.weights.append(0.0)
+        self.dirty = False
+
+
+class AgingPopulation:
+    """A population whose age, growth and deaths are derived from one epoch."""
+
+    def __init__(self, animals=(), seed=0):
+        """Initialize the population at epoch 0, optionally with animals.
+
+        Args:
+            animals (iterable): Animals to add
+            seed (int): Seed for the drawn lifespans
+        """
+        self.epoch = 0
+        self.animals = []
+        self.cls = []  # Original class of every row
+        self.birth = array("q")
+        self.death = array("q")
+        self.anchor = array("q")  # Epoch at which weight[row] was the animal's weight
+        self.weight = array("d")
+        self.base = array("d")  # Birth weight on the growth curve: weight at any age = base * growth factor
+        self._growth = {}  # Class -> growth table
+        self._curves = {}
+        self._cohorts = {}  # (class, birth epoch) -> _Cohort
+        self._rows = {}  # id(animal) -> row (the animals are held, so their ids stay unique)
+        self._aging = {}  # Original class -> its subclass backed by this population
+        self._random = random.Random(seed)
+        self.extend(animals)
+
+    def __len__(self):
+        return len(self.animals)
+
+    def __iter__(self):
+        return iter(self.animals)
+
+    def __getitem__(self, row):
+        return self.animals[row]
+
+    def _table(self, cls):
+        table = self._growth.get(cls)
+        if table is None:
+            self._curves[cls] = curve_for(cls)
+            table = self._growth[cls] = growth_table(self._curves[cls])
+        return table
+
+    def growth_at(self, row, epoch):
+        """Return the growth factor of an animal at an epoch."""
+        age = min(epoch, self.death[row]) - self.birth[row]
+        return self._table(self.cls[row])[min(max(age, 0), MAX_AGE)]
+
+    def _cohort(self, row):
+        key = (self.cls[row], self.birth[row])
+        cohort = self._cohorts.get(key)
+        if cohort is None:
+            cohort = self._cohorts[key] = _Cohort()
+        return cohort
+
+    def add(self, animal):
+        """Make an animal age with the population.
+
+        The animal object stays usable; afterwards its age, weight_kg and
+        is_alive are computed from the population's epoch.
+
+        Args:
+            animal (Animal): The animal to add
+
+        Returns:
+            int: The row of the animal in the population
+        """
+        self.extend((animal,))
+        return len(self.animals) - 1
+
+    def extend(self, animals):
+        """Add several animals to the population.
+
+        Args:
+            animals (iterable): The animals to add
+
+        Raises:
+            TypeError: If an animal's age is not an int or its weight_kg is
+                not a finite number; that animal is left untouched (the
+                ones before it stay added)
+            ValueError: If an animal already belongs to a population
+        """
+        epoch, draw = self.epoch, self._random.random
+        classes = {}  # Class -> (aging class, curve, growth table), for this call
+        cohorts, rows = self._cohorts, self._rows
+        for animal in animals:
+            if getattr(animal, "_population", None) is not None:
+                raise ValueError(f"{animal} already belongs to an aging population.")
+            cls = type(animal)
+            known = classes.get(cls)
+            if known is None:
+                self._table(cls)
+                aging_cls = self._aging.get(cls)
+                if aging_cls is None:
+                    aging_cls = self._aging[cls] = _aging_class(cls, self)
+                known = classes[cls] = (aging_cls, self._curves[cls], self._growth[cls])
+            aging_cls, curve, table = known
+            age, weight, alive = [getattr(animal, name) for name in _FIELDS]
+            if not isinstance(age, int) or isinstance(age, bool):
+                raise TypeError(f"{animal}: age must be a whole number of years, not {age!r}.")
+            if not isinstance(weight, (int, float)) or isinstance(weight, bool) or not math.isfinite(weight):
+                raise TypeError(f"{animal}: weight_kg must be a finite number, not {weight!r}.")
+            # Every value of the row is known before the animal or a column changes
+            birth = epoch - age
+            death = epoch + years_left(curve, age, 1.0 - draw()) if alive else epoch
+            base = weight / table[min(max(age, 0), MAX_AGE)]
+            state = getattr(animal, "__dict__", None)
+            if state is not None:  # The views hide these from now on
+                for name in _FIELDS:
+                    state.pop(name, None)
+            row = len(self.animals)
+            self.cls.append(cls)
+            self.birth.append(birth)
+            self.death.append(death)
+            self.anchor.append(epoch)
+            self.weight.append(weight)
+            self.base.append(base)
+            rows[id(animal)] = row
+            animal.__class__ = aging_cls
+            self.animals.append(animal)
+            cohort = cohorts.get((cls, birth))
+            if cohort is None:
+                cohort = cohorts[(cls, birth)] = _Cohort()
+            cohort.rows.add(row)
+            cohort.dirty = True
+
+    def advance(self, years=1):
+        """Move the whole population forward in time.
+
+        Args:
+            years (int): The number of years to advance
+
+        Returns:
+            int: The number of animals that died meanwhile
+        """
+        if years < 0:
+            raise ValueError("A population cannot go back in time.")
+        alive = self.count()
+        self.epoch += years
+        return alive - self.count()
+
+    # Attribute views
+
+    def _age(self, row):
+        return min(self.epoch, self.death[row]) - self.birth[row]
+
+    def _weight_kg(self, row):
+        anchor = self.anchor[row]
+        if min(self.epoch, self.death[row]) == min(anchor, self.death[row]):
+            return self.weight[row]
+        return self.weight[row] * self.growth_at(row, self.epoch) / self.growth_at(row, anchor)
+
+    def _is_alive(self, row):
+        return self.epoch < self.death[row]
+
+    def _moved(self, row, change):
+        """Apply ``change`` to a row, keeping its cohort up to date."""
+        cohort = self._cohort(row)
+        cohort.rows.discard(row)
+        cohort.dirty = True
+        change()
+        cohort = self._cohort(row)
+        cohort.rows.add(row)
+        cohort.dirty = True
+
+    def _reanchor(self, row, weight):
+        """Make ``weight`` the animal's weight now; its growth continues from it."""
+        self.anchor[row], self.weight[row] = self.epoch, weight
+        self.base[row] = weight / self.growth_at(row, self.epoch)
+
+    def _set_age(self, row, age):
+        def change():
+            weight = self._weight_kg(row)
+            self.birth[row] = min(self.epoch, self.death[row]) - age
+            self._reanchor(row, weight)  # Keep the current weight
+        self._moved(row, change)
+
+    def _set_weight_kg(self, row, weight):
+        def change():
+            self._reanchor(row, weight)
+        self._moved(row, change)
+
+    def _set_is_alive(self, row, alive):
+        if alive == self._is_alive(row):
+            return
+
+        def change():
+            weight = self._weight_kg(row)
+            if alive:
+                curve = self._curves[self.cls[row]]
+                self.death[row] = self.epoch + years_left(curve, self._age(row), 1.0 - self._random.random())
+            else:
+                self.death[row] = self.epoch
+            self._reanchor(row, weight)
+        self._moved(row, change)
+
+    # Aggregates
+
+    def _matching(self, cls):
+        for (cohort_cls, birth), cohort in self._cohorts.items():
+            if cls is None or issubclass(cohort_cls, cls):
+                if cohort.dirty:
+                    cohort.rebuild(self)
+                yield cohort_cls, birth, cohort
+
+    def count(self, cls=None):
+        """Return the number of living animals (of a class, if given)."""
+        epoch = self.epoch
+        return sum(len(cohort.deaths) - bisect_right(cohort.deaths, epoch) for _, _, cohort in self._matching(cls))
+
+    def census(self, cls=None):
+        """Summarize the living animals (of a class, if given).
+
+        Returns:
+            Census: alive, dead, mean_age and total_weight_kg
+        """
+        epoch = self.epoch
+        alive = dead = age_total = 0
+        weight_total = 0.0
+        for cohort_cls, birth, cohort in self._matching(cls):
+            dead_here = bisect_right(cohort.deaths, epoch)
+            alive_here = len(cohort.deaths) - dead_here
+            dead += dead_here
+            if alive_here:
+                alive += alive_here
+                age = epoch - birth
+                age_total += alive_here * age
+                weight_total += cohort.weights[dead_here] * self._table(cohort_cls)[min(max(age, 0), MAX_AGE)]
+        return Census(alive, dead, age_total / alive if alive else 0.0, weight_total)
+
+    def detach(self):
+        """Write the current values back onto every animal and release them.
+
+        Afterwards the animals are plain objects again and no longer age,
+        and the population is empty.
+        """
+        for row, animal in enumerate(self.animals):
+            values = self._age(row), self._weight_kg(row), self._is_alive(row)
+            animal.__class__ = self.cls[row]
+            for name, value in zip(_FIELDS, values):
+                setattr(animal, name, value)
+        self.animals, self.cls, self._cohorts, self._rows, self._aging = [], [], {}, {}, {}
+        for column in (self.birth, self.death, self.anchor, self.weight, self.base):
+            del column[:]
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    def describe(animal):
+        """Like str(animal), with the weight rounded for display."""
+        return f"{animal.name}, {animal.age} years old, {animal.weight_kg:.1f}kg"
+
+    pride = [Lion("Simba", 5, 190.5, "golden", "large"), Lion("Nala", 4, 126.0, "tawny")]
+    population = AgingPopulation(pride, seed=1)
+    print("=== Pride ===")
+    for year in range(0, 16, 5):
+        print(f"Year {population.epoch}: " + "; ".join(
+            f"{describe(lion)} ({'alive' if lion.is_alive else 'dead'})" for lion in pride))
+        population.advance(5)
+
+    print("\n=== Re-anchoring One Animal ===")
+    population = AgingPopulation([Lion("Kiara", 0, 1.5, "golden")], seed=1)
+    kiara = population[0]
+    population.advance(2)
+    print(describe(kiara))
+    kiara.weight_kg = 60.0  # She was weighed: the curve continues from here
+    population.advance(1)
+    print(describe(kiara))
+
+    print("\n=== A Million Animals ===")
+    rng = random.Random(0)
+    animals = []
+    for i in range(1_000_000):
+        kind = i % 3
+        if kind == 0:
+            animals.append(Lion("Simba", rng.randrange(15), 190.5, "golden", "large"))
+        elif kind == 1:
+            animals.append(Eagle("Hedwig", rng.randrange(20), 6.2, 2.1, 3.0))
+        else:
+            animals.append(Snake("Nagini", rng.randrange(25), 45.0, "smooth", True, 4.5))
+    start = time.perf_counter()
+    population = AgingPopulation(animals)
+    print(f"Added in {time.perf_counter() - start:.2f} s")
+    for years in (1, 10, 10):
+        start = time.perf_counter()
+        died = population.advance(years)
+        census = population.census()
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Year {population.epoch}: {died:,} died, {census.alive:,} alive, mean age {census.mean_age:.1f}, "
+              f"{census.total_weight_kg / 1000:,.0f} t ({elapsed:.1f} ms)")
+    print(f"Lions alive: {population.count(Lion):,}")
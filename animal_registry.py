@@ -0,0 +1,230 @@
+"""Indexed collection of animals with fast attribute queries.
+
+AnimalRegistry keeps hash indexes on species, is_carnivore, is_venomous,
+can_fly and is_alive, and sorted indexes on age and weight_kg. A query
+starts from its most selective index and only checks the remaining
+conditions on those candidates, so it never scans the whole population.
+Indexes follow attribute changes on registered animals automatically.
+"""
+from bisect import bisect_left, bisect_right, insort
+
+from observers import watch, unwatch
+
+EQUALITY_FIELDS = ("species", "is_carnivore", "is_venomous", "can_fly", "is_alive")
+RANGE_FIELDS = ("age", "weight_kg")
+INDEXED_FIELDS = EQUALITY_FIELDS + RANGE_FIELDS
+
+
+class AnimalRegistry:
+    """A collection of animals with secondary indexes for fast queries."""
+
+    def __init__(self, animals=()):
+        """Initialize the registry, optionally with an initial population.
+
+        Args:
+            animals (iterable): Animals to register
+        """
+        self._keys = {}  # id(animal) -> key
+        self._animals = {}  # key -> animal
+        self._values = {}  # key -> {field: indexed value}
+        self._equality = {field: {} for field in EQUALITY_FIELDS}  # field -> value -> keys
+        self._sorted = {field: [] for field in RANGE_FIELDS}  # field -> sorted [(value, key)]
+        self._next_key = 0
+        for animal in animals:
+            self.add(animal)
+
+    def __len__(self):
+        return len(self._animals)
+
+    def __iter__(self):
+        return iter(self._animals.values())
+
+    def __contains__(self, animal):
+        return id(animal) in self._keys
+
+    def add(self, animal):
+        """Register an animal and index its attributes.
+
+        Args:
+            animal (Animal): The animal to register
+        """
+        if id(animal) in self._keys:
+            raise ValueError(f"{animal} is already registered.")
+        key = self._next_key
+        self._next_key += 1
+        self._keys[id(animal)] = key
+        self._animals[key] = animal
+        self._values[key] = {}
+        self._index(key, animal)
+        watch(animal, self._on_change)
+
+    def remove(self, animal):
+        """Unregister an animal and drop it from every index.
+
+        Args:
+            animal (Animal): The animal to remove
+        """
+        key = self._keys.pop(id(animal))
+        unwatch(animal, self._on_change)
+        for field in INDEXED_FIELDS:
+            self._unindex_field(key, field)
+        del self._values[key]
+        del self._animals[key]
+
+    def close(self):
+        """Unregister every animal, so the registry no longer follows their changes."""
+        for animal in self._animals.values():
+            unwatch(animal, self._on_change)
+        self._keys.clear()
+        self._animals.clear()
+        self._values.clear()
+        for index in self._equality.values():
+            index.clear()
+        for index in self._sorted.values():
+            index.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def _index(self, key, animal):
+        """Bring every index entry of one animal up to date."""
+        values = self._values[key]
+        for field in INDEXED_FIELDS:
+            value = getattr(animal, field, None)
+            if field in values and values[field] == value:
+                continue
+            self._unindex_field(key, field)
+            if value is None:
+                continue
+            values[field] = value
+            if field in self._equality:
+                self._equality[field].setdefault(value, set()).add(key)
+            else:
+                insort(self._sorted[field], (value, key))
+
+    def _unindex_field(self, key, field):
+        """Remove one animal's entry from one index, if it has one."""
+        values = self._values[key]
+        if field not in values:
+            return
+        value = values.pop(field)
+        if field in self._equality:
+            keys = self._equality[field][value]
+            keys.discard(key)
+            if not keys:
+                del self._equality[field][value]
+        else:
+            entries = self._sorted[field]
+            del entries[bisect_left(entries, (value, key))]
+
+    def _on_change(self, animal, name, old, new):
+        """Re-index an animal after one of its attributes was assigned."""
+        # A changed attribute may also change derived values such as
+        # CompactSnake.species, so every field of the animal is re-checked.
+        self._index(self._keys[id(animal)], animal)
+
+    def _range_keys(self, field, bounds):
+        """Return the keys whose value of ``field`` lies within ``bounds``."""
+        low, high = bounds
+        entries = self._sorted[field]
+        start = 0 if low is None else bisect_left(entries, (low, -1))
+        stop = len(entries) if high is None else bisect_right(entries, (high, float("inf")))
+        return [key for _, key in entries[start:stop]]
+
+    def _range_size(self, field, bounds):
+        """Count the entries of a range without building the key list."""
+        low, high = bounds
+        entries = self._sorted[field]
+        start = 0 if low is None else bisect_left(entries, (low, -1))
+        stop = len(entries) if high is None else bisect_right(entries, (high, float("inf")))
+        return max(stop - start, 0)
+
+    def _matches(self, key, criteria):
+        """Check an animal's indexed values against every criterion."""
+        values = self._values[key]
+        for field, wanted in criteria.items():
+            if field not in values:
+                return False
+            value = values[field]
+            if field in self._sorted:
+                low, high = wanted
+                if (low is not None and value < low) or (high is not None and value > high):
+                    return False
+            elif value != wanted:
+                return False
+        return True
+
+    def query(self, **criteria):
+        """Find the animals matching every given criterion.
+
+        Equality criteria (species, is_carnivore, is_venomous, can_fly,
+        is_alive) take a value. Range criteria (age, weight_kg) take a
+        ``(low, high)`` pair of inclusive bounds, where None leaves that side
+        open. Animals without an attribute (e.g. a Lion and is_venomous)
+        never match a criterion on it.
+
+        Example:
+            registry.query(species="Naja naja", age=(6, None))
+            registry.query(is_carnivore=True, weight_kg=(100, 200))
+
+        Returns:
+            list: The matching animals, in registration order
+        """
+        unknown = set(criteria) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot query on {', '.join(sorted(unknown))}.")
+        if not criteria:
+            return list(self._animals.values())
+
+        # Start from the smallest candidate set any single index can give
+        best_field, best_size = None, None
+        for field, wanted in criteria.items():
+            if field in self._sorted:
+                size = self._range_size(field, wanted)
+            else:
+                size = len(self._equality[field].get(wanted, ()))
+            if best_size is None or size < best_size:
+                best_field, best_size = field, size
+        if not best_size:
+            return []
+        if best_field in self._sorted:
+            candidates = self._range_keys(best_field, criteria[best_field])
+        else:
+            candidates = self._equality[best_field][criteria[best_field]]
+
+        rest = {field: wanted for field, wanted in criteria.items() if field != best_field}
+        keys = sorted(key for key in candidates if self._matches(key, rest))
+        return [self._animals[key] for key in keys]
+
+    def count(self, **criteria):
+        """Count the animals matching every given criterion (see query)."""
+        return len(self.query(**criteria))
+
+
+# Example usage
+if __name__ == "__main__":
+    from Animal_kingdom_classes import Lion, Eagle, Snake
+
+    registry = AnimalRegistry([
+        Lion("Simba", 5, 190.5, "golden", "large"),
+        Lion("Nala", 4, 126.0, "golden"),
+        Eagle("Hedwig", 3, 6.2, 2.1, 3.0),
+        Snake("Nagini", 8, 45.0, "smooth", True, 4.5),
+        Snake("Kaa", 12, 70.0, "smooth", False, 6.0),
+    ])
+
+    print("=== Venomous Snakes Older Than 5 ===")
+    for animal in registry.query(species="Naja naja", age=(6, None)):
+        print(animal)
+
+    print("\n=== Carnivores Between 100 and 200 kg ===")
+    for animal in registry.query(is_carnivore=True, weight_kg=(100, 200)):
+        print(animal)
+
+    print("\n=== Indexes Follow Changes ===")
+    nala = registry.query(weight_kg=(126.0, 126.0))[0]
+    nala.weight_kg = 95.0
+    print(f"Carnivores between 100 and 200 kg: {registry.count(is_carnivore=True, weight_kg=(100, 200))}")
@@ -0,0 +1,343 @@
+"""Type-grouped batch dispatch of polymorphic methods over mixed collections.
+
+dispatch() groups a heterogeneous collection by concrete class, resolves the
+method once per class and, where a batch implementation is registered for
+exactly that method, produces all of the group's events in one call.
+Batch implementations are keyed by the method function itself, so a
+subclass that overrides a method never picks up its parent's batch
+version; such classes fall back to calling their own method per object.
+
+Batch versions of vehicle commands take each vehicle's outcome from
+vehicle_transitions.check(), exactly as the methods do, and report refused
+commands through emit_rejected(), so sinks and the rejection hook see the
+same events as with one call per vehicle.
+"""
+import gc
+from contextlib import contextmanager
+from itertools import repeat
+
+from Animal_kingdom_classes import Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Vehicle, Car, Motorcycle, Boat, Plane
+from event_sink import Event, emit_many, emit_rejected, set_rejection_hook, using
+from vehicle_transitions import check, OK, NOT_RUNNING, NOT_AIRBORNE, ANCHORED, MOVE
+
+_batch_implementations = {}  # method function -> batch function
+
+
+def register_batch(method):
+    """Register a batch implementation of a method (used as a decorator).
+
+    The batch function receives a list of objects (and the call's
+    arguments) and returns one message per object, exactly as ``method``
+    would have emitted them.
+
+    Args:
+        method (function): The plain method, e.g. ``Boat.move``
+    """
+    def decorator(batch):
+        _batch_implementations[method] = lambda objects, *args: (batch(objects, *args), None)
+        return batch
+    return decorator
+
+
+def register_command(method, command, messages):
+    """Register the batch version of a vehicle command.
+
+    Each vehicle's outcome comes from vehicle_transitions.check(), so the
+    batch version takes the same branch as the method; only the messages
+    are given here.
+
+    Args:
+        method (function): The plain method, e.g. ``Boat.move``
+        command (int): Its command code, e.g. MOVE
+        messages (dict): Outcome code -> function(vehicle) building the
+            message of that branch; outcomes other than OK are rejections
+    """
+    def batch(vehicles, *args):
+        outcomes = [check(vehicle, command, *args[:1]) for vehicle in vehicles]
+        return [messages[outcome](vehicle) for vehicle, outcome in zip(vehicles, outcomes)], outcomes
+    _batch_implementations[method] = batch
+
+
+_CHUNK = 4096  # Events built and handed to the sink at a time
+_GC_THRESHOLDS = (100_000, 100, 100)  # Lowest collector thresholds while building in bulk
+
+
+def _events(actors, method, args, messages):
+    """Build Events without going through the namedtuple constructor."""
+    return list(map(tuple.__new__, repeat(Event), zip(actors, repeat(method), repeat(args), messages)))
+
+
+def _emit(events, outcomes):
+    """Report events in order, sending those with a non-OK outcome to emit_rejected()."""
+    if not outcomes or not any(outcomes):
+        emit_many(events)
+        return
+    start = 0
+    for position, outcome in enumerate(outcomes):
+        if outcome:
+            emit_many(events[start:position])
+            emit_rejected(*events[position])
+            start = position + 1
+    emit_many(events[start:])
+
+
+class _CapturingSink:
+    """Keeps (event, rejected) pairs so they can be reported later in order."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def write(self, event):
+        self.events.append((event, False))
+
+    def write_rejected(self, event):
+        self.events.append((event, True))
+
+    def flush(self):
+        pass
+
+
+@contextmanager
+def _collecting_less():
+    """Raise the garbage collector's thresholds until the block exits.
+
+    The objects built in bulk here (events, timers) form no cycles, yet with
+    the default thresholds every few hundred of them start a collection, and
+    every hundred thousand or so a full one that rescans all that survived.
+    """
+    thresholds = gc.get_threshold()
+    gc.set_threshold(*map(max, thresholds, _GC_THRESHOLDS))
+    try:
+        yield
+    finally:
+        gc.set_threshold(*thresholds)
+
+
+def dispatch(objects, method, *args, preserve_order=False):
+    """Call a method on every object, one group of same-class objects at a time.
+
+    Args:
+        objects (iterable): The animals and/or vehicles
+        method (str): The method name, e.g. "move" or "make_sound"
+        *args: Arguments passed to every call
+        preserve_order (bool): Emit events in the order of ``objects``
+            rather than grouped by class
+
+    Returns:
+        int: The number of objects the method was called on
+    """
+    objects = list(objects)
+    with _collecting_less():
+        _dispatch(objects, method, args, preserve_order)
+    return len(objects)
+
+
+def _dispatch(objects, method, args, preserve_order):
+    groups = {}  # class -> positions of its objects, in order of first appearance
+    for position, cls in enumerate(map(type, objects)):
+        groups.setdefault(cls, []).append(position)
+    messages = [None] * len(objects) if preserve_order else None
+    outcomes = [OK] * len(objects) if preserve_order else None
+    captured = {}  # position -> events of objects without a batch implementation
+    for cls, positions in groups.items():
+        members = list(map(objects.__getitem__, positions))
+        function = getattr(cls, method)
+        batch = _batch_implementations.get(function)
+        if batch is None:
+            if not preserve_order:
+                for obj in members:
+                    function(obj, *args)
+                continue
+            # The rejection hook runs when the events are reported below
+            hook = set_rejection_hook(None)
+            try:
+                for position, obj in zip(positions, members):
+                    events = captured[position] = []
+                    with using(_CapturingSink(events)):
+                        function(obj, *args)
+            finally:
+                set_rejection_hook(hook)
+        elif preserve_order:
+            group_messages, group_outcomes = batch(members, *args)
+            for position, message in zip(positions, group_messages):
+                messages[position] = message
+            if group_outcomes is not None:
+                for position, outcome in zip(positions, group_outcomes):
+                    outcomes[position] = outcome
+        else:
+            for start in range(0, len(members), _CHUNK):
+                chunk = members[start:start + _CHUNK]
+                chunk_messages, chunk_outcomes = batch(chunk, *args)
+                _emit(_events(chunk, method, args, chunk_messages), chunk_outcomes)
+
+    if preserve_order:
+        for start in range(0, len(objects), _CHUNK):
+            stop = min(start + _CHUNK, len(objects))
+            if not captured:
+                _emit(_events(objects[start:stop], method, args, messages[start:stop]), outcomes[start:stop])
+                continue
+            # Captured events were already sorted into rejections by their
+            # methods; replay them as they were reported
+            for position in range(start, stop):
+                if position in captured:
+                    for event, rejected in captured[position]:
+                        if rejected:
+                            emit_rejected(*event)
+                        else:
+                            emit_many([event])
+                else:
+                    _emit([Event(objects[position], method, args, messages[position])], outcomes[position:position + 1])
+
+
+def _not_started(v):
+    return f"You need to start the {v.make} {v.model} first."
+
+
+register_command(Vehicle.move, MOVE, {
+    OK: lambda v: f"The {v.make} {v.model} is moving.",
+    NOT_RUNNING: _not_started,
+})
+register_command(Car.move, MOVE, {
+    OK: lambda c: f"The {c.color} {c.make} {c.model} is driving on the road. 🚗",
+    NOT_RUNNING: _not_started,
+})
+register_command(Motorcycle.move, MOVE, {
+    OK: lambda m: f"The {m.engine_size}cc {m.make} {m.model} is zooming through traffic. 🏍️",
+    NOT_RUNNING: _not_started,
+})
+register_command(Boat.move, MOVE, {
+    OK: lambda b: f"The {b.length}m {b.boat_type} {b.make} {b.model} is sailing across the water. ⛵",
+    ANCHORED: lambda b: f"The {b.make} {b.model} is anchored and cannot move.",
+    NOT_RUNNING: _not_started,
+})
+register_command(Plane.move, MOVE, {
+    OK: lambda p: f"The {p.make} {p.model} with {p.num_engines} engines is flying through the sky "
+                  f"at {p.altitude} feet. ✈️",
+    NOT_AIRBORNE: lambda p: f"The {p.make} {p.model} needs to take off first.",
+    NOT_RUNNING: _not_started,
+})
+
+
+def _advance_all(animals):
+    """Apply the position update every animal move() starts with."""
+    for animal in animals:
+        animal.advance()
+
+
+@register_batch(Animal.move)
+def _animal_move(animals):
+    _advance_all(animals)
+    return [f"{a.name} is moving." for a in animals]
+
+
+@register_batch(Animal.make_sound)
+def _animal_make_sound(animals):
+    return ["Some generic animal sound"] * len(animals)
+
+
+@register_batch(Animal.eat)
+def _animal_eat(animals, food):
+    return [f"{a.name} is eating {food}." for a in animals]
+
+
+@register_batch(Animal.sleep)
+def _animal_sleep(animals, hours):
+    return [f"{a.name} is sleeping for {hours} hours." for a in animals]
+
+
+@register_batch(Mammal.regulate_temperature)
+def _mammal_regulate_temperature(mammals):
+    return [f"{m.name} is maintaining a body temperature of {m.body_temperature}°C." for m in mammals]
+
+
+@register_batch(Bird.move)
+def _bird_move(birds):
+    _advance_all(birds)
+    return [
+        f"{b.name} is flying through the air." if b.can_fly else f"{b.name} is walking, as it cannot fly."
+        for b in birds
+    ]
+
+
+@register_batch(Bird.make_sound)
+def _bird_make_sound(birds):
+    return [f"{b.name} is chirping." for b in birds]
+
+
+@register_batch(Reptile.move)
+def _reptile_move(reptiles):
+    _advance_all(reptiles)
+    return [f"{r.name} is slithering across the ground." for r in reptiles]
+
+
+@register_batch(Reptile.make_sound)
+def _reptile_make_sound(reptiles):
+    return [f"{r.name} is hissing." for r in reptiles]
+
+
+@register_batch(Reptile.bask)
+def _reptile_bask(reptiles):
+    return [f"{r.name} is basking in the sun to warm up." for r in reptiles]
+
+
+@register_batch(Reptile.shed_skin)
+def _reptile_shed_skin(reptiles):
+    return [f"{r.name} is shedding its {r.scale_type} scales." for r in reptiles]
+
+
+@register_batch(Lion.move)
+def _lion_move(lions):
+    _advance_all(lions)
+    return [f"{lion.name} is prowling through the savanna." for lion in lions]
+
+
+@register_batch(Lion.make_sound)
+def _lion_make_sound(lions):
+    return [f"{lion.name} is ROARING loudly!" for lion in lions]
+
+
+@register_batch(Eagle.move)
+def _eagle_move(eagles):
+    _advance_all(eagles)
+    return [f"{e.name} is soaring majestically high above the mountains." for e in eagles]
+
+
+@register_batch(Eagle.make_sound)
+def _eagle_make_sound(eagles):
+    return [f"{e.name} is screeching!" for e in eagles]
+
+
+@register_batch(Snake.move)
+def _snake_move(snakes):
+    _advance_all(snakes)
+    return [f"{s.name} is slithering silently through the grass." for s in snakes]
+
+
+@register_batch(Snake.make_sound)
+def _snake_make_sound(snakes):
+    return [f"{s.name} is hissing quietly." for s in snakes]
+
+
+# Example usage
+if __name__ == "__main__":
+    zoo = [
+        Lion("Simba", 5, 190.5, "golden", "large"),
+        Eagle("Hedwig", 3, 6.2, 2.1, 3.0),
+        Snake("Nagini", 8, 45.0, "smooth", True, 4.5),
+        Lion("Nala", 4, 126.0, "golden"),
+    ]
+    fleet = [
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+    ]
+
+    print("=== Setup ===")
+    fleet[0].anchor()
+
+    print("\n=== Grouped by Class ===")
+    dispatch(zoo, "make_sound")
+
+    print("\n=== In Original Order ===")
+    dispatch(zoo + fleet, "move", preserve_order=True)
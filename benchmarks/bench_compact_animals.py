@@ -0,0 +1,59 @@
+"""Compare memory use and construction speed of regular and compact animals.
+
+Usage:
+    python benchmarks/bench_compact_animals.py [--count N]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Animal_kingdom_classes import Lion, Eagle, Snake  # noqa: E402
+from compact_animals import CompactLion, CompactEagle, CompactSnake  # noqa: E402
+
+CASES = [
+    ("Lion", Lion, CompactLion, lambda i: ("Simba", i % 20, 190.5, "golden", "large")),
+    ("Eagle", Eagle, CompactEagle, lambda i: ("Hedwig", i % 20, 6.2, 2.1, 3.0)),
+    ("Snake", Snake, CompactSnake, lambda i: ("Nagini", i % 20, 45.0, "smooth", i % 2 == 0, 4.5)),
+]
+
+
+def bytes_per_instance(cls, make_args, count):
+    """Measure the memory held by ``count`` instances, divided by ``count``."""
+    argument_lists = [make_args(i) for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    animals = [cls(*args) for args in argument_lists]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the animals costs one pointer per instance
+    return (after - before) / len(animals) - 8
+
+
+def construction_rate(cls, make_args, count):
+    """Measure how many instances per second can be constructed."""
+    argument_lists = [make_args(i) for i in range(count)]
+    start = time.perf_counter()
+    for args in argument_lists:
+        cls(*args)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000, help="instances per measurement")
+    options = parser.parse_args()
+
+    print(f"{'class':<8}{'mode':<10}{'bytes/instance':>16}{'constructions/s':>18}")
+    for name, regular, compact, make_args in CASES:
+        for mode, cls in (("regular", regular), ("compact", compact)):
+            size = bytes_per_instance(cls, make_args, options.count)
+            rate = construction_rate(cls, make_args, options.count)
+            print(f"{name:<8}{mode:<10}{size:>16.1f}{rate:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
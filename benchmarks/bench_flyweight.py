@@ -0,0 +1,108 @@
+"""Compare the memory held by regular and flyweight populations.
+
+Every object is built from its own parsed CSV row, as a loader would, so
+regular instances keep their own copies of the descriptive strings while
+flyweights share an interned spec. The bytes per instance are measured on
+--count objects per class and scaled to --population objects; the cost per
+instance does not depend on the population size.
+
+Usage:
+    python benchmarks/bench_flyweight.py [--count N] [--population N]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Animal_kingdom_classes import Lion, Snake  # noqa: E402
+from Vehicle_polymorphism_challenge import Car, Plane  # noqa: E402
+from flyweight import FlyweightCar, FlyweightPlane, FlyweightLion, FlyweightSnake  # noqa: E402
+
+MAKES = ["Tesla", "Toyota", "Ford", "BMW", "Honda", "Audi", "Kia", "Volvo"]
+MODELS = ["Model S", "Corolla", "Focus", "X5", "Civic"]
+COLORS = ["red", "white", "black", "silver", "blue"]
+FUELS = ["electric", "gasoline", "diesel"]
+
+
+def car_row(i):
+    # 8 * 5 * 4 * 5 * 3 = 2,400 combinations at most
+    return f"{MAKES[i % 8]},{MODELS[i % 5]},{2020 + i % 4},{COLORS[i % 7 % 5]},{FUELS[i % 3]},4"
+
+
+def parse_car(row):
+    make, model, year, color, fuel_type, doors = row.split(",")
+    return make, model, int(year), color, fuel_type, int(doors)
+
+
+def plane_row(i):
+    return f"Boeing,{('737', '747', '787')[i % 3]},{2015 + i % 8},blue and white,{41000 + i % 3 * 2000},{2 + i % 2 * 2}"
+
+
+def parse_plane(row):
+    make, model, year, color, max_altitude, engines = row.split(",")
+    return make, model, int(year), color, int(max_altitude), int(engines)
+
+
+def lion_row(i):
+    return f"Lion{i % 1000},{i % 20},190.5,{('golden', 'tawny')[i % 2]},{('large', 'small')[i % 3 % 2]}"
+
+
+def parse_lion(row):
+    name, age, weight, fur_color, mane_size = row.split(",")
+    return name, int(age), float(weight), fur_color, mane_size
+
+
+def snake_row(i):
+    return f"Snake{i % 1000},{i % 20},45.0,{('smooth', 'keeled')[i % 2]},{i % 3 == 0},{4.5 if i % 2 else 2.0}"
+
+
+def parse_snake(row):
+    name, age, weight, scale_type, venomous, length = row.split(",")
+    return name, int(age), float(weight), scale_type, venomous == "True", float(length)
+
+
+CASES = [
+    ("Car", Car, FlyweightCar, car_row, parse_car),
+    ("Plane", Plane, FlyweightPlane, plane_row, parse_plane),
+    ("Lion", Lion, FlyweightLion, lion_row, parse_lion),
+    ("Snake", Snake, FlyweightSnake, snake_row, parse_snake),
+]
+
+
+def bytes_per_instance(cls, make_row, parse, count):
+    """Measure the memory still held after loading ``count`` rows, per instance."""
+    rows = [make_row(i) for i in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(*parse(row)) for row in rows]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the objects costs one pointer per instance
+    result = (after - before) / len(objects) - 8
+    del objects
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000, help="instances measured per class")
+    parser.add_argument("--population", type=int, default=10_000_000, help="population to scale the results to")
+    options = parser.parse_args()
+
+    print(f"{'class':<8}{'regular B':>11}{'flyweight B':>13}{'saved':>8}"
+          f"{'regular @ N':>14}{'flyweight @ N':>15}   (N = {options.population:,})")
+    for name, regular, flyweight, make_row, parse in CASES:
+        regular_size = bytes_per_instance(regular, make_row, parse, options.count)
+        flyweight_size = bytes_per_instance(flyweight, make_row, parse, options.count)
+        scale = options.population / 2 ** 30
+        print(f"{name:<8}{regular_size:>11.1f}{flyweight_size:>13.1f}{1 - flyweight_size / regular_size:>8.0%}"
+              f"{regular_size * scale:>12.2f}GB{flyweight_size * scale:>13.2f}GB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure route-cost estimation for large mixed fleets.
+
+Every vehicle gets its own random route length (a tenth of them short
+enough to end before reaching cruising speed). route_costs() is timed with
+fixed one-second steps and with adaptive steps, next to integrating every
+route separately with drive() (timed on a sample and scaled up).
+
+Usage:
+    python benchmarks/bench_kinematics.py [--count N] [--sample N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane  # noqa: E402
+from kinematics import drive, profile, route_costs  # noqa: E402
+
+
+def make_fleet(count, seed=0):
+    rng = random.Random(seed)
+    fleet, distances = [], []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.7:
+            vehicle = Car("Toyota", "Corolla", 2020, "white", rng.choice(["electric", "gasoline", "diesel", "hybrid"]),
+                          rng.choice([2, 4]))
+            distance = rng.uniform(1, 500)
+        elif kind < 0.85:
+            vehicle = Motorcycle("Ducati", "Monster", 2022, "red", rng.choice([125, 300, 600, 937, 1200]),
+                                 rng.random() < 0.1)
+            distance = rng.uniform(1, 300)
+        elif kind < 0.95:
+            vehicle = Boat("Sunseeker", "Predator", 2021, "white", "yacht", rng.choice([6.0, 8.5, 12.0, 24.5]))
+            distance = rng.uniform(1, 100)
+        else:
+            vehicle = Plane("Boeing", "747", 2020, "blue and white", 45000, rng.choice([2, 4]))
+            distance = rng.uniform(300, 10_000)
+        if rng.random() < 0.1:
+            distance = rng.uniform(0.01, 0.5)
+        fleet.append(vehicle)
+        distances.append(distance)
+    return fleet, distances
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=300_000, help="vehicles in the fleet")
+    parser.add_argument("--sample", type=int, default=2_000, help="routes integrated one by one")
+    options = parser.parse_args()
+
+    fleet, distances = make_fleet(options.count)
+    print(f"{options.count:,} vehicles")
+    print(f"{'case':<26}{'seconds':>9}{'routes/s':>12}{'steps/route':>13}")
+    for name, adaptive in (("route_costs, 1 s steps", False), ("route_costs, adaptive", True)):
+        start = time.perf_counter()
+        costs = route_costs(fleet, distances, adaptive=adaptive)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<26}{elapsed:>9.2f}{options.count / elapsed:>12,.0f}"
+              f"{sum(costs.steps) / options.count:>13.0f}")
+    for name, adaptive in (("drive() each, 1 s steps", False), ("drive() each, adaptive", True)):
+        start = time.perf_counter()
+        for vehicle, distance in zip(fleet[:options.sample], distances[:options.sample]):
+            drive(profile(vehicle), distance, adaptive=adaptive)
+        elapsed = (time.perf_counter() - start) * options.count / options.sample
+        print(f"{name:<26}{elapsed:>9.2f}{options.count / elapsed:>12,.0f}{'':>13}  (scaled from a sample)")
+
+
+if __name__ == "__main__":
+    main()
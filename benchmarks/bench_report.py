@@ -0,0 +1,102 @@
+"""Compare streamed reports with joining one __str__ per object.
+
+The baseline builds the whole report as "\\n".join(str(obj) ...) and writes
+it at once, as the nightly reports did. write_report() is run in each
+format on the same vehicles. Every case reports its wall time and the peak
+memory traced while it ran (a separate, untimed run, since tracing slows
+Python down). The "disk" line writes the finished text report in 4 MB
+blocks, the fastest the file could be written.
+
+--rows can exceed --count: the objects are then reused in turn, so a 10M
+row report needs only --count objects in memory.
+
+Usage:
+    python benchmarks/bench_report.py [--count N] [--rows N] [--directory DIR]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import cycle, islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Vehicle_polymorphism_challenge import Car, Boat, Plane  # noqa: E402
+from report import write_report  # noqa: E402
+
+
+def make_fleet(count):
+    fleet = []
+    for i in range(count):
+        if i % 3 == 0:
+            vehicle = Car("Tesla", "Model S", 2000 + i % 24, "red", "electric", 4)
+        elif i % 3 == 1:
+            vehicle = Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5)
+        else:
+            vehicle = Plane("Boeing", "747", 2020, "blue and white", 45000, 4)
+        vehicle.speed = i % 120
+        vehicle.is_running = i % 2 == 0
+        fleet.append(vehicle)
+    return fleet
+
+
+def joined(fleet, rows, path):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(str(vehicle) for vehicle in islice(cycle(fleet), rows)) + "\n")
+
+
+def streamed(format):
+    def run(fleet, rows, path):
+        write_report(islice(cycle(fleet), rows), path, format)
+    return run
+
+
+def disk(fleet, rows, path, source):
+    with open(source, "rb") as file, open(path, "wb") as out:
+        while True:
+            block = file.read(4 << 20)
+            if not block:
+                break
+            out.write(block)
+
+
+def measure(case, fleet, rows, path):
+    start = time.perf_counter()
+    case(fleet, rows, path)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(path)
+    tracemalloc.start()
+    case(fleet, rows, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000, help="vehicles in memory")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows per report")
+    parser.add_argument("--directory", default=None, help="where to write the reports")
+    options = parser.parse_args()
+
+    fleet = make_fleet(options.count)
+    with tempfile.TemporaryDirectory(dir=options.directory) as directory:
+        text = os.path.join(directory, "report.txt")
+        cases = [("join + write", joined), ("text", streamed("text")), ("csv", streamed("csv")),
+                 ("jsonl", streamed("jsonl")),
+                 ("disk", lambda fleet, rows, path: disk(fleet, rows, path, text))]
+        print(f"{options.rows:,} rows from {options.count:,} vehicles")
+        print(f"{'case':<14}{'seconds':>9}{'rows/s':>13}{'MB/s':>8}{'peak MB':>10}")
+        for name, case in cases:
+            path = os.path.join(directory, "copy.txt" if name == "disk" else "report." + name.split()[0])
+            elapsed, size, peak = measure(case, fleet, options.rows, path)
+            print(f"{name:<14}{elapsed:>9.2f}{options.rows / elapsed:>13,.0f}"
+                  f"{size / elapsed / 1e6:>8.0f}{peak / 1e6:>10.1f}")
+            if name == "join + write":
+                os.replace(path, text)
+
+
+if __name__ == "__main__":
+    main()
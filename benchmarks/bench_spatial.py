@@ -0,0 +1,80 @@
+"""Compare SpatialIndex range queries with a brute-force scan.
+
+Animals are scattered uniformly over a square whose size grows with the
+population, so each eagle sees roughly the same number of animals at every
+scale.
+
+Usage:
+    python benchmarks/bench_spatial.py [--sizes 10000,100000,1000000] [--queries 200]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import event_sink  # noqa: E402
+from Animal_kingdom_classes import Lion, Eagle, Snake  # noqa: E402
+from spatial_index import SpatialIndex, brute_force_within  # noqa: E402
+
+DENSITY = 20.0  # animals per square kilometer
+EYESIGHT = 3.0  # kilometers
+
+
+def populate(count, rng):
+    """Build ``count`` animals at random positions, every tenth an eagle."""
+    side = math.sqrt(count / DENSITY)
+    animals = []
+    for i in range(count):
+        if i % 10 == 0:
+            animal = Eagle("Hedwig", 3, 6.2, 2.1, EYESIGHT)
+        elif i % 2:
+            animal = Lion("Simba", 5, 190.5, "golden")
+        else:
+            animal = Snake("Nagini", 8, 45.0, "smooth", True, 4.5)
+        animal.position = (rng.uniform(0, side), rng.uniform(0, side))
+        animal.velocity = (rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5))
+        animals.append(animal)
+    return animals
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma-separated population sizes")
+    parser.add_argument("--queries", type=int, default=200, help="eagle queries per size")
+    options = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'animals':>10}{'build s':>10}{'grid ms/query':>15}{'scan ms/query':>15}"
+          f"{'speedup':>9}{'move() us/animal':>18}")
+    for count in (int(size) for size in options.sizes.split(",")):
+        animals = populate(count, rng)
+        eagles = [animal for animal in animals if isinstance(animal, Eagle)][:options.queries]
+        index, build_time = timed(SpatialIndex, animals, EYESIGHT)
+
+        _, grid_time = timed(lambda: [index.prey_in_sight(eagle) for eagle in eagles])
+        _, scan_time = timed(lambda: [brute_force_within(animals, eagle.position, eagle.eyesight_distance)
+                                      for eagle in eagles])
+        with event_sink.using(event_sink.NullSink()):
+            _, move_time = timed(lambda: [animal.move() for animal in animals])
+
+        for eagle in eagles[:5]:
+            expected = {id(a) for a in brute_force_within(animals, eagle.position, EYESIGHT) if a is not eagle}
+            assert {id(a) for a in index.prey_in_sight(eagle)} == expected
+
+        print(f"{count:>10,}{build_time:>10.2f}{grid_time / len(eagles) * 1000:>15.3f}"
+              f"{scan_time / len(eagles) * 1000:>15.3f}{scan_time / grid_time:>8.0f}x"
+              f"{move_time / count * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure the cold start time of the oop-demos command line.
+
+Each case starts a fresh interpreter from the repository root (with -E, so
+PYTHON* environment variables do not skew the numbers) several times and
+reports the fastest and median wall time, next to a bare ``python -c pass``
+for reference.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 20]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIO = """\
+tesla = Car Tesla "Model S" 2023 red electric 4
+tesla.start
+tesla.accelerate 60
+tesla.move
+"""
+
+
+def timed_runs(command, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="interpreter starts per case")
+    options = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        file.write(SCENARIO)
+    cases = [
+        ("python -c pass", [sys.executable, "-E", "-c", "pass"]),
+        ("import oop_demos", [sys.executable, "-E", "-c", "import oop_demos"]),
+        ("import oop_demos.vehicles", [sys.executable, "-E", "-c", "import oop_demos.vehicles"]),
+        ("oop_demos.cli scenario", [sys.executable, "-E", "-c",
+                                    "import sys; from oop_demos.cli import main; sys.exit(main())", file.name]),
+        ("python -m oop_demos scenario", [sys.executable, "-E", "-m", "oop_demos", file.name]),
+    ]
+    try:
+        print(f"{'case':<32}{'min ms':>10}{'median ms':>12}")
+        for label, command in cases:
+            fastest, median = timed_runs(command, options.runs)
+            print(f"{label:<32}{fastest * 1000:>10.1f}{median * 1000:>12.1f}")
+    finally:
+        os.remove(file.name)
+
+
+if __name__ == "__main__":
+    main()
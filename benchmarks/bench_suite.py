@@ -0,0 +1,202 @@
+"""Benchmark suite for both class hierarchies.
+
+Measures construction of every class, polymorphic move()/make_sound()
+dispatch over mixed collections, __str__ formatting and the vehicle state
+transitions, each at several population sizes. Results are written as JSON
+so that runs from different commits can be compared.
+
+Usage:
+    python benchmarks/bench_suite.py [--scales 1000,100000,1000000] [--output results.json]
+    python benchmarks/bench_suite.py --compare old.json new.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import event_sink  # noqa: E402
+from Animal_kingdom_classes import Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake  # noqa: E402
+from Vehicle_polymorphism_challenge import Vehicle, Car, Motorcycle, Boat, Plane  # noqa: E402
+
+DEFAULT_SCALES = (1_000, 100_000, 1_000_000)
+
+CONSTRUCTORS = {
+    "Vehicle": (Vehicle, ("Ford", "Model T", 1908, "black")),
+    "Car": (Car, ("Tesla", "Model S", 2023, "red", "electric", 4)),
+    "Motorcycle": (Motorcycle, ("Harley-Davidson", "Street Glide", 2022, "black", 1868, False)),
+    "Boat": (Boat, ("Sunseeker", "Predator", 2021, "white", "yacht", 24.5)),
+    "Plane": (Plane, ("Boeing", "747", 2020, "blue and white", 45000, 4)),
+    "Animal": (Animal, ("Generic", 1, 10.0)),
+    "Mammal": (Mammal, ("Bessie", 4, 600.0, "brown", False)),
+    "Bird": (Bird, ("Tweety", 1, 0.1, 0.2, True)),
+    "Reptile": (Reptile, ("Rex", 2, 1.5, "rough", False)),
+    "Lion": (Lion, ("Simba", 5, 190.5, "golden", "large")),
+    "Eagle": (Eagle, ("Hedwig", 3, 6.2, 2.1, 3.0)),
+    "Snake": (Snake, ("Nagini", 8, 45.0, "smooth", True, 4.5)),
+}
+
+
+def _build(names, count):
+    """Build ``count`` objects cycling through the given classes."""
+    specs = [CONSTRUCTORS[name] for name in names]
+    return [cls(*args) for cls, args in (specs[i % len(specs)] for i in range(count))]
+
+
+def _running_vehicles(count):
+    vehicles = _build(("Car", "Motorcycle", "Boat", "Plane"), count)
+    for vehicle in vehicles:
+        vehicle.start()
+    return vehicles
+
+
+def _construct(name):
+    cls, args = CONSTRUCTORS[name]
+
+    def setup(count):
+        return count
+
+    def run(count):
+        for _ in range(count):
+            cls(*args)
+    return setup, run
+
+
+def _call_each(method, *args):
+    def run(objects):
+        for obj in objects:
+            getattr(obj, method)(*args)
+    return run
+
+
+def _format_each(objects):
+    for obj in objects:
+        str(obj)
+
+
+def _planes_ready_for_take_off(count):
+    planes = _build(("Plane",), count)
+    for plane in planes:
+        plane.start()
+        plane.accelerate(150)
+    return planes
+
+
+def _airborne_planes(count):
+    planes = _planes_ready_for_take_off(count)
+    for plane in planes:
+        plane.take_off()
+    return planes
+
+
+# Case name -> (setup(count) -> data, run(data))
+CASES = {f"construct.{name}": _construct(name) for name in CONSTRUCTORS}
+CASES.update({
+    "dispatch.animals.move": (lambda n: _build(("Lion", "Eagle", "Snake", "Bird", "Reptile"), n), _call_each("move")),
+    "dispatch.animals.make_sound": (lambda n: _build(("Lion", "Eagle", "Snake", "Bird", "Reptile"), n),
+                                    _call_each("make_sound")),
+    "dispatch.vehicles.move": (_running_vehicles, _call_each("move")),
+    "str.animals": (lambda n: _build(("Lion", "Eagle", "Snake"), n), _format_each),
+    "str.vehicles": (lambda n: _build(("Car", "Motorcycle", "Boat", "Plane"), n), _format_each),
+    "transition.start": (lambda n: _build(("Car", "Motorcycle", "Boat", "Plane"), n), _call_each("start")),
+    "transition.accelerate": (_running_vehicles, _call_each("accelerate", 10)),
+    "transition.brake": (_running_vehicles, _call_each("brake", 10)),
+    "transition.stop": (_running_vehicles, _call_each("stop")),
+    "transition.anchor": (lambda n: _build(("Boat",), n), _call_each("anchor")),
+    "transition.take_off": (_planes_ready_for_take_off, _call_each("take_off")),
+    "transition.change_altitude": (_airborne_planes, _call_each("change_altitude", 500)),
+    "transition.land": (_airborne_planes, _call_each("land")),
+})
+
+
+def run_case(name, count, repeat):
+    """Time one case at one scale.
+
+    Returns:
+        dict: The best and mean wall time in seconds and the best rate in
+        operations per second
+    """
+    setup, run = CASES[name]
+    times = []
+    for _ in range(repeat):
+        data = setup(count)
+        start = time.perf_counter()
+        run(data)
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        "case": name,
+        "count": count,
+        "best_s": best,
+        "mean_s": sum(times) / len(times),
+        "ops_per_s": count / best if best else None,
+    }
+
+
+def run_suite(scales, repeat, pattern=None):
+    """Run every case (optionally filtered by a substring) at every scale."""
+    results = []
+    with event_sink.using(event_sink.NullSink()):
+        for name in CASES:
+            if pattern and pattern not in name:
+                continue
+            for count in scales:
+                result = run_case(name, count, repeat)
+                results.append(result)
+                print(f"{name:<32}{count:>10,}{_rate(result['ops_per_s']):>16} ops/s", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.time(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(old_path, new_path):
+    """Print the relative change in throughput between two result files."""
+    with open(old_path) as file:
+        old = {(r["case"], r["count"]): r for r in json.load(file)["results"]}
+    with open(new_path) as file:
+        new = {(r["case"], r["count"]): r for r in json.load(file)["results"]}
+    print(f"{'case':<32}{'count':>10}{'old ops/s':>14}{'new ops/s':>14}{'change':>9}")
+    for key in sorted(old.keys() & new.keys()):
+        # A rate is None (or 0) when the case ran too fast for the clock to time
+        before, after = old[key]["ops_per_s"], new[key]["ops_per_s"]
+        change = f"{after / before - 1:+.1%}" if before and after is not None else "n/a"
+        print(f"{key[0]:<32}{key[1]:>10,}{_rate(before):>14}{_rate(after):>14}{change:>9}")
+
+
+def _rate(ops_per_s):
+    return "n/a" if ops_per_s is None else f"{ops_per_s:,.0f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help="comma-separated population sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best is reported")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--output", help="write JSON results to this file instead of standard output")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files")
+    options = parser.parse_args()
+
+    if options.compare:
+        compare(*options.compare)
+        return
+    scales = [int(scale) for scale in options.scales.split(",")]
+    results = run_suite(scales, options.repeat, options.filter)
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
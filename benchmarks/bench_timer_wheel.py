@@ -0,0 +1,102 @@
+"""Compare the timing wheel with a heap of timers.
+
+The heap baseline is what the routines used before: heapq entries of
+[due, sequence, timer], with cancelled timers marked and skipped when they
+reach the top (removing them from the middle of the heap would cost O(n)
+each). Both schedulers get the same timers, spread over a week of minutes;
+then half of them are cancelled, and the clock is run forward one day. The
+fired calls go to an object whose method does nothing, so the times are
+those of the schedulers, not of the routines. The last case schedules the
+timers in one schedule_many() call, spread evenly over the week; "held" is
+the number of entries each scheduler still keeps after the run.
+
+Usage:
+    python benchmarks/bench_timer_wheel.py [--count N]
+"""
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+from itertools import repeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timer_wheel import DAY, TimerWheel  # noqa: E402
+
+
+class Target:
+    def ping(self):
+        pass
+
+
+class HeapScheduler:
+    def __init__(self):
+        self.now = 0
+        self.heap = []
+        self.sequence = 0
+
+    def schedule(self, target, method, delay=0):
+        entry = [self.now + delay, self.sequence, target, method]
+        self.sequence += 1
+        heapq.heappush(self.heap, entry)
+        return entry
+
+    def cancel(self, entry):
+        entry[2] = None
+
+    def __len__(self):
+        return len(self.heap)
+
+    def advance(self, ticks):
+        end, heap, fired = self.now + ticks, self.heap, 0
+        while heap and heap[0][0] < end:
+            _, _, target, method = heapq.heappop(heap)
+            if target is not None:
+                getattr(target, method)()
+                fired += 1
+        self.now = end
+        return fired
+
+
+def one_by_one(scheduler, target, delays):
+    return [scheduler.schedule(target, "ping", delay=delay) for delay in delays]
+
+
+def all_at_once(scheduler, target, delays):
+    return scheduler.schedule_many(repeat(target, len(delays)), "ping", spread=7 * DAY)
+
+
+def run(scheduler, insert, delays, cancelled):
+    target = Target()
+    start = time.perf_counter()
+    timers = insert(scheduler, target, delays)
+    inserted = time.perf_counter()
+    for index in cancelled:
+        scheduler.cancel(timers[index])
+    done = time.perf_counter()
+    fired = scheduler.advance(DAY)
+    end = time.perf_counter()
+    return inserted - start, done - inserted, end - done, fired, len(scheduler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000, help="timers to schedule")
+    options = parser.parse_args()
+
+    rng = random.Random(0)
+    delays = [rng.randrange(7 * DAY) for _ in range(options.count)]
+    cancelled = rng.sample(range(options.count), options.count // 2)
+    print(f"{options.count:,} timers, {len(cancelled):,} cancelled, one day run")
+    print(f"{'case':<22}{'insert s':>10}{'cancel s':>10}{'run s':>8}{'fired':>10}{'held':>11}")
+    cases = [("heap", HeapScheduler(), one_by_one), ("wheel", TimerWheel(), one_by_one),
+             ("wheel, schedule_many", TimerWheel(), all_at_once)]
+    for name, scheduler, insert in cases:
+        inserting, cancelling, advancing, fired, held = run(scheduler, insert, delays, cancelled)
+        print(f"{name:<22}{inserting:>10.2f}{cancelling:>10.2f}{advancing:>8.2f}{fired:>10,}{held:>11,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Memory-compact versions of the animal kingdom classes.
+
+The classes here mirror Animal, Mammal, Bird, Reptile, Lion, Eagle and Snake
+but store their attributes in __slots__ instead of a per-instance __dict__,
+and keep attributes that never vary (species, body_temperature,
+has_feathers, cold_blooded) on the class. Behavior methods are shared with
+the regular classes, so both produce exactly the same events.
+
+Because the constants live on the class, assigning to them on an instance
+(e.g. ``lion.body_temperature = 38``) raises AttributeError, as does adding
+attributes that are not declared in the slots.
+"""
+from Animal_kingdom_classes import Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake
+
+
+class CompactAnimal:
+    """Slotted counterpart of Animal."""
+
+    __slots__ = ("name", "age", "weight_kg", "is_alive", "position", "velocity")
+
+    def __init__(self, name, age, weight_kg):
+        """Initialize an animal with basic attributes.
+
+        Args:
+            name (str): The animal's name
+            age (int): The animal's age in years
+            weight_kg (float): The animal's weight in kilograms
+        """
+        self.name = name
+        self.age = age
+        self.weight_kg = weight_kg
+        self.is_alive = True
+        self.position = (0.0, 0.0)
+        self.velocity = (0.0, 0.0)
+
+    advance = Animal.advance
+    eat = Animal.eat
+    sleep = Animal.sleep
+    make_sound = Animal.make_sound
+    move = Animal.move
+    __str__ = Animal.__str__
+
+
+class CompactMammal(CompactAnimal):
+    """Slotted counterpart of Mammal."""
+
+    __slots__ = ("fur_color", "is_carnivore")
+    body_temperature = 37.0  # Celsius, typical for mammals
+
+    def __init__(self, name, age, weight_kg, fur_color, is_carnivore):
+        """Initialize a mammal with mammal-specific attributes.
+
+        Args:
+            name (str): The mammal's name
+            age (int): The mammal's age in years
+            weight_kg (float): The mammal's weight in kilograms
+            fur_color (str): The color of the mammal's fur
+            is_carnivore (bool): Whether the mammal is a carnivore
+        """
+        super().__init__(name, age, weight_kg)
+        self.fur_color = fur_color
+        self.is_carnivore = is_carnivore
+
+    give_birth = Mammal.give_birth
+    regulate_temperature = Mammal.regulate_temperature
+
+
+class CompactBird(CompactAnimal):
+    """Slotted counterpart of Bird."""
+
+    __slots__ = ("wingspan", "can_fly")
+    has_feathers = True
+
+    def __init__(self, name, age, weight_kg, wingspan, can_fly):
+        """Initialize a bird with bird-specific attributes.
+
+        Args:
+            name (str): The bird's name
+            age (int): The bird's age in years
+            weight_kg (float): The bird's weight in kilograms
+            wingspan (float): The bird's wingspan in meters
+            can_fly (bool): Whether the bird can fly
+        """
+        super().__init__(name, age, weight_kg)
+        self.wingspan = wingspan
+        self.can_fly = can_fly
+
+    lay_eggs = Bird.lay_eggs
+    move = Bird.move
+    make_sound = Bird.make_sound
+
+
+class CompactReptile(CompactAnimal):
+    """Slotted counterpart of Reptile."""
+
+    __slots__ = ("scale_type", "is_venomous")
+    cold_blooded = True
+
+    def __init__(self, name, age, weight_kg, scale_type, is_venomous):
+        """Initialize a reptile with reptile-specific attributes.
+
+        Args:
+            name (str): The reptile's name
+            age (int): The reptile's age in years
+            weight_kg (float): The reptile's weight in kilograms
+            scale_type (str): The type of scales the reptile has
+            is_venomous (bool): Whether the reptile is venomous
+        """
+        super().__init__(name, age, weight_kg)
+        self.scale_type = scale_type
+        self.is_venomous = is_venomous
+
+    bask = Reptile.bask
+    move = Reptile.move
+    make_sound = Reptile.make_sound
+    shed_skin = Reptile.shed_skin
+
+
+class CompactLion(CompactMammal):
+    """Slotted counterpart of Lion."""
+
+    __slots__ = ("mane_size",)
+    species = "Panthera leo"
+
+    def __init__(self, name, age, weight_kg, fur_color, mane_size=None):
+        """Initialize a lion with lion-specific attributes.
+
+        Args:
+            name (str): The lion's name
+            age (int): The lion's age in years
+            weight_kg (float): The lion's weight in kilograms
+            fur_color (str): The color of the lion's fur
+            mane_size (str, optional): Size of the lion's mane (if male)
+        """
+        # Assign every slot here instead of chaining through super().__init__;
+        # the three-level constructor chain costs about half of construction time.
+        self.name = name
+        self.age = age
+        self.weight_kg = weight_kg
+        self.is_alive = True
+        self.position = (0.0, 0.0)
+        self.velocity = (0.0, 0.0)
+        self.fur_color = fur_color
+        self.is_carnivore = True  # Lions are carnivores
+        self.mane_size = mane_size
+
+    make_sound = Lion.make_sound
+    move = Lion.move
+    hunt = Lion.hunt
+
+
+class CompactEagle(CompactBird):
+    """Slotted counterpart of Eagle."""
+
+    __slots__ = ("eyesight_distance",)
+    species = "Aquila chrysaetos"  # Golden eagle
+
+    def __init__(self, name, age, weight_kg, wingspan, eyesight_distance):
+        """Initialize an eagle with eagle-specific attributes.
+
+        Args:
+            name (str): The eagle's name
+            age (int): The eagle's age in years
+            weight_kg (float): The eagle's weight in kilograms
+            wingspan (float): The eagle's wingspan in meters
+            eyesight_distance (float): How far the eagle can see in kilometers
+        """
+        # Flattened like CompactLion.__init__
+        self.name = name
+        self.age = age
+        self.weight_kg = weight_kg
+        self.is_alive = True
+        self.position = (0.0, 0.0)
+        self.velocity = (0.0, 0.0)
+        self.wingspan = wingspan
+        self.can_fly = True  # Eagles can fly
+        self.eyesight_distance = eyesight_distance
+
+    make_sound = Eagle.make_sound
+    move = Eagle.move
+    hunt_from_above = Eagle.hunt_from_above
+
+
+class CompactSnake(CompactReptile):
+    """Slotted counterpart of Snake."""
+
+    __slots__ = ("length",)
+
+    def __init__(self, name, age, weight_kg, scale_type, is_venomous, length):
+        """Initialize a snake with snake-specific attributes.
+
+        Args:
+            name (str): The snake's name
+            age (int): The snake's age in years
+            weight_kg (float): The snake's weight in kilograms
+            scale_type (str): The type of scales the snake has
+            is_venomous (bool): Whether the snake is venomous
+            length (float): The snake's length in meters
+        """
+        # Flattened like CompactLion.__init__
+        self.name = name
+        self.age = age
+        self.weight_kg = weight_kg
+        self.is_alive = True
+        self.position = (0.0, 0.0)
+        self.velocity = (0.0, 0.0)
+        self.scale_type = scale_type
+        self.is_venomous = is_venomous
+        self.length = length
+
+    @property
+    def species(self):
+        """The snake's species, derived from whether it is venomous."""
+        return "Python bivittatus" if not self.is_venomous else "Naja naja"  # Python or Cobra
+
+    make_sound = Snake.make_sound
+    move = Snake.move
+    constrict = Snake.constrict
+    inject_venom = Snake.inject_venom
+
+
+COMPACT_CLASSES = {
+    Animal: CompactAnimal,
+    Mammal: CompactMammal,
+    Bird: CompactBird,
+    Reptile: CompactReptile,
+    Lion: CompactLion,
+    Eagle: CompactEagle,
+    Snake: CompactSnake,
+}
+
+
+def to_compact(animal):
+    """Build the compact equivalent of a regular animal.
+
+    Args:
+        animal (Animal): An instance of one of the regular animal classes
+
+    Returns:
+        CompactAnimal: A compact animal with the same attribute values
+    """
+    compact_cls = COMPACT_CLASSES[type(animal)]
+    compact = compact_cls.__new__(compact_cls)
+    for cls in compact_cls.__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            setattr(compact, name, getattr(animal, name))
+    return compact
+
+
+# Example usage
+if __name__ == "__main__":
+    simba = CompactLion("Simba", 5, 190.5, "golden", "large")
+    hedwig = CompactEagle("Hedwig", 3, 6.2, 2.1, 3.0)
+    nagini = to_compact(Snake("Nagini", 8, 45.0, "smooth", True, 4.5))
+
+    print("=== Compact Animals ===")
+    for animal in (simba, hedwig, nagini):
+        print(f"{animal} ({animal.species})")
+        animal.move()
+
+    print("\n=== Shared Constants ===")
+    simba.regulate_temperature()
+    print(f"Hedwig has feathers: {hedwig.has_feathers}")
+    print(f"Nagini is cold-blooded: {nagini.cold_blooded}")
@@ -0,0 +1,214 @@
+"""Predator-prey ecosystem built on the Lion, Eagle and Snake behaviors.
+
+Ecosystem turns Lion.hunt, Eagle.hunt_from_above, Snake.constrict and
+Snake.inject_venom, Animal.eat and Animal.sleep into state changes over a
+whole population. The population is kept as columns (one array per
+attribute) and each timestep updates the columns in a few passes:
+
+    1. Rested animals sleep and burn energy slowly; hungry ones burn it at
+       full rate and lose some weight.
+    2. Every hungry predator attempts one kill on a random animal. A kill
+       marks the prey dead and the predator eats it, gaining energy and
+       weight.
+    3. Animals whose energy ran out starve.
+
+The existing rules still hold: snakes kill by constricting unless they are
+venomous, in which case they inject venom (and can take bigger prey);
+venomous snakes never constrict and non-venomous ones never use venom.
+Nothing is printed; write_back() copies weight_kg and is_alive back onto
+the animal objects.
+
+Scope: the steps are not vectorized. The standard library has no array
+arithmetic, so passes 1 and 3 are per-element list comprehensions over the
+array columns, and the hunt is a plain loop over the hungry predators
+(map() with operator functions was tried and was no faster on CPython
+3.11). A step is linear in the population but runs at Python speed: on
+CPython 3.11 it took about 70 ms for 100,000 animals and 0.65 s for
+1,000,000 (about 1.5 million animal-steps per second). A thousand steps of
+a million animals therefore take around 11 minutes, so that scale is out
+of reach; populations of up to about 100,000 animals run interactively.
+"""
+import random
+from array import array
+from collections import namedtuple
+
+from Animal_kingdom_classes import Lion, Eagle, Snake
+
+# Population kinds
+LION, EAGLE, SNAKE, OTHER = range(4)
+
+# Per-kind parameters: energy burned per step, full energy reserve, chance a
+# hunt succeeds, kinds it preys on and the heaviest prey relative to its own
+# weight (for snakes: when constricting; venom raises it to VENOM_PREY_RATIO).
+# Animals of other kinds graze and never go hungry.
+Profile = namedtuple("Profile", ["cost", "reserve", "success", "prey", "prey_ratio"])
+
+PROFILES = {
+    LION: Profile(cost=1.0, reserve=30.0, success=0.3, prey=(SNAKE, OTHER), prey_ratio=3.0),
+    EAGLE: Profile(cost=1.0, reserve=10.0, success=0.4, prey=(SNAKE, OTHER), prey_ratio=1.0),
+    SNAKE: Profile(cost=0.3, reserve=15.0, success=0.5, prey=(EAGLE, OTHER), prey_ratio=1.0),
+    OTHER: Profile(cost=0.0, reserve=20.0, success=0.0, prey=(), prey_ratio=0.0),
+}
+
+VENOM_PREY_RATIO = 3.0
+HUNGRY = 0.5  # Animals hunt below this fraction of their reserve
+SLEEP_FACTOR = 0.4  # Share of the energy cost burned while sleeping
+STARVING_WEIGHT_LOSS = 0.002  # Fraction of body weight lost per hungry step
+FOOD_ENERGY = 0.5  # Energy gained per kilogram eaten
+WEIGHT_GAIN = 0.05  # Share of the prey's weight the predator puts on
+
+# hunts counts the predators that attempted a kill: hungry ones still alive at their turn
+StepStats = namedtuple("StepStats", [
+    "step", "alive", "hunts", "hunt", "hunt_from_above", "constrict", "inject_venom", "starved",
+])
+
+
+def _kind(animal):
+    if isinstance(animal, Lion):
+        return LION
+    if isinstance(animal, Eagle):
+        return EAGLE
+    if isinstance(animal, Snake):
+        return SNAKE
+    return OTHER
+
+
+class Ecosystem:
+    """A population of animals advanced one timestep at a time."""
+
+    def __init__(self, animals, seed=0):
+        """Load a population into columns.
+
+        Args:
+            animals (sequence): The animals; every animal starts with a full
+                energy reserve
+            seed (int): Seed for the hunts' random choices
+        """
+        self.animals = list(animals)
+        self.kind = array("b", [_kind(animal) for animal in self.animals])
+        self.alive = array("b", [bool(animal.is_alive) for animal in self.animals])
+        self.weight = array("d", [animal.weight_kg for animal in self.animals])
+        self.venomous = array("b", [bool(getattr(animal, "is_venomous", False)) for animal in self.animals])
+        self.reserve = array("d", [PROFILES[kind].reserve for kind in self.kind])
+        self.cost = array("d", [PROFILES[kind].cost for kind in self.kind])
+        self.energy = array("d", self.reserve)
+        self.step_count = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self):
+        return len(self.animals)
+
+    def step(self):
+        """Advance the whole population by one timestep.
+
+        Returns:
+            StepStats: Population size and what happened during the step
+        """
+        alive, energy, weight = self.alive, self.energy, self.weight
+        hungry = [a and e < HUNGRY * r for a, e, r in zip(alive, energy, self.reserve)]
+
+        # 1. Sleep or go hungry
+        energy[:] = array("d", [
+            e - (c if h else c * SLEEP_FACTOR) if a else e
+            for e, c, a, h in zip(energy, self.cost, alive, hungry)
+        ])
+        weight[:] = array("d", [w * (1 - STARVING_WEIGHT_LOSS) if h else w for w, h in zip(weight, hungry)])
+
+        # 2. Hunt
+        counts = {"hunt": 0, "hunt_from_above": 0, "constrict": 0, "inject_venom": 0}
+        hunters = [i for i, (h, k) in enumerate(zip(hungry, self.kind)) if h and k != OTHER]
+        self._rng.shuffle(hunters)
+        random_index = self._rng.randrange
+        roll = self._rng.random
+        size = len(self.animals)
+        attempts = 0
+        for hunter in hunters:
+            if not alive[hunter]:
+                continue  # Killed earlier in this step
+            attempts += 1
+            prey = random_index(size)
+            kind = self.kind[hunter]
+            profile = PROFILES[kind]
+            if kind == SNAKE:
+                method = "inject_venom" if self.venomous[hunter] else "constrict"
+                ratio = VENOM_PREY_RATIO if self.venomous[hunter] else profile.prey_ratio
+            else:
+                method = "hunt" if kind == LION else "hunt_from_above"
+                ratio = profile.prey_ratio
+            if (prey == hunter or not alive[prey] or self.kind[prey] not in profile.prey
+                    or weight[prey] > ratio * weight[hunter] or roll() >= profile.success):
+                continue
+            alive[prey] = False
+            energy[hunter] = min(self.reserve[hunter], energy[hunter] + FOOD_ENERGY * weight[prey])
+            weight[hunter] += WEIGHT_GAIN * weight[prey]
+            counts[method] += 1
+
+        # 3. Starve
+        starving = [a and e <= 0 for a, e in zip(alive, energy)]
+        starved = sum(starving)
+        if starved:
+            alive[:] = array("b", [a and not s for a, s in zip(alive, starving)])
+
+        self.step_count += 1
+        return StepStats(
+            step=self.step_count,
+            alive=sum(alive),
+            hunts=attempts,
+            starved=starved,
+            **counts,
+        )
+
+    def run(self, steps):
+        """Advance the population by several timesteps.
+
+        Args:
+            steps (int): The number of timesteps
+
+        Returns:
+            list: One StepStats per timestep
+        """
+        return [self.step() for _ in range(steps)]
+
+    def write_back(self):
+        """Copy weight_kg and is_alive from the columns onto the animals."""
+        for animal, alive, weight in zip(self.animals, self.alive, self.weight):
+            if animal.weight_kg != weight:
+                animal.weight_kg = weight
+            if animal.is_alive != bool(alive):
+                animal.is_alive = bool(alive)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    from Animal_kingdom_classes import Mammal
+
+    rng = random.Random(1)
+    population = []
+    for i in range(100_000):
+        choice = i % 10
+        if choice == 0:
+            population.append(Lion("Simba", 5, rng.uniform(120, 200), "golden"))
+        elif choice < 3:
+            population.append(Eagle("Hedwig", 3, rng.uniform(3, 7), 2.1, 3.0))
+        elif choice < 6:
+            population.append(Snake("Kaa", 8, rng.uniform(5, 60), "smooth", choice % 2 == 0, 4.5))
+        elif choice < 8:
+            population.append(Mammal("Gazelle", 2, rng.uniform(15, 40), "tan", False))
+        else:
+            population.append(Mammal("Rabbit", 1, rng.uniform(1, 4), "brown", False))
+
+    ecosystem = Ecosystem(population, seed=7)
+    start = time.perf_counter()
+    history = ecosystem.run(100)
+    elapsed = time.perf_counter() - start
+
+    print("=== Ecosystem ===")
+    for stats in history[::20] + history[-1:]:
+        print(f"step {stats.step:3}: {stats.alive:6} alive, {stats.hunt} hunt, {stats.hunt_from_above} from above, "
+              f"{stats.constrict} constrict, {stats.inject_venom} venom, {stats.starved} starved")
+    print(f"\n{len(history)} steps of {len(population):,} animals in {elapsed:.2f}s")
+
+    ecosystem.write_back()
+    print(f"Animals still alive: {sum(animal.is_alive for animal in population):,}")
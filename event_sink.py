@@ -0,0 +1,2 @@
+# Moved to oop_demos/event_sink.py; kept so existing imports keep working
+from oop_demos.event_sink import *  # noqa: F401,F403
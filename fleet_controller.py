@@ -0,0 +1,324 @@
+"""asyncio controller that dispatches commands to many vehicles at once.
+
+Every vehicle gets its own ordered command queue served by its own task, so
+commands for one vehicle run in submission order while different vehicles
+are served concurrently. A global in-flight limit applies backpressure:
+submit() waits while too many commands are queued or running. The
+controller keeps throughput, latency and queue-depth statistics.
+
+With an executor, the vehicle methods run on worker threads but the event
+sinks are not thread-safe. While it is open, such a controller therefore
+installs a sink (and rejection hook) that hands every event to the event
+loop's thread, where it reaches the sink that was current before.
+"""
+import asyncio
+import random
+import threading
+from collections import deque, namedtuple
+
+from event_sink import get_sink, set_sink, set_rejection_hook
+
+ControllerStats = namedtuple("ControllerStats", [
+    "submitted", "completed", "failed", "cancelled", "in_flight", "queued", "max_queued",
+    "mean_latency", "p50_latency", "p99_latency",
+])
+
+
+class _LoopSink:
+    """Passes events written on other threads to the event loop's thread."""
+
+    def __init__(self, sink, hook, loop):
+        self.sink = sink
+        self.hook = hook
+        self.loop = loop
+        self.thread = threading.get_ident()
+
+    def _call(self, function, *args):
+        if threading.get_ident() == self.thread:
+            function(*args)
+        else:
+            self.loop.call_soon_threadsafe(function, *args)
+
+    def write(self, event):
+        self._call(self.sink.write, event)
+
+    def write_many(self, events):
+        write_many = getattr(self.sink, "write_many", None)
+        if write_many is not None:
+            self._call(write_many, events)
+        else:
+            for event in events:
+                self._call(self.sink.write, event)
+
+    def write_rejected(self, event):
+        self._call(getattr(self.sink, "write_rejected", self.sink.write), event)
+
+    def flush(self):
+        self._call(self.sink.flush)
+
+    def rejected(self, actor, action):
+        """Rejection hook forwarding to the hook installed before."""
+        if self.hook is not None:
+            self._call(self.hook, actor, action)
+
+
+def _consume(future):
+    """Retrieve a command's exception so unawaited failures are not logged as lost."""
+    if not future.cancelled():
+        future.exception()
+
+
+class FleetController:
+    """Dispatches vehicle commands concurrently with a bounded in-flight count."""
+
+    def __init__(self, vehicles, max_in_flight=1000, queue_size=100, executor=None, latency_samples=10000):
+        """Initialize the controller.
+
+        Args:
+            vehicles (sequence): The vehicles to control, addressed by index
+            max_in_flight (int): Commands that may be queued or running at once
+            queue_size (int): Capacity of each vehicle's command queue
+            executor (Executor, optional): Runs the vehicle methods off the
+                event loop; by default they are called directly
+            latency_samples (int): Number of recent latencies kept for percentiles
+        """
+        self.vehicles = vehicles
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size
+        self.executor = executor
+        self._slots = None
+        self._loop_sink = None  # Installed while an executor is in use
+        self._queues = {}
+        self._workers = []
+        self._closed = False
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._latency_total = 0.0
+        self._latencies = deque(maxlen=latency_samples)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            await self.join()
+        await self.close()
+
+    async def submit(self, index, command, *args):
+        """Queue a command for a vehicle, waiting if the controller is saturated.
+
+        Args:
+            index (int): The vehicle's index in ``vehicles``
+            command (str): The method to call, e.g. "accelerate" or "take_off"
+            *args: Arguments for the method
+
+        Returns:
+            asyncio.Future: Resolves to the method's return value once the
+            command has run
+        """
+        if self._closed:
+            raise RuntimeError("The controller is closed.")
+        loop = asyncio.get_running_loop()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            if self.executor is not None:
+                self._loop_sink = _LoopSink(get_sink(), set_rejection_hook(None), loop)
+                set_sink(self._loop_sink)
+                set_rejection_hook(self._loop_sink.rejected)
+        await self._slots.acquire()
+        try:
+            queue = self._queues.get(index)
+            if queue is None:
+                queue = self._queues[index] = asyncio.Queue(self.queue_size)
+                self._workers.append(asyncio.ensure_future(self._serve(self.vehicles[index], queue)))
+            future = loop.create_future()
+            future.add_done_callback(_consume)
+            self._queued += 1
+            try:
+                await queue.put((command, args, future, loop.time()))
+            except BaseException:
+                self._queued -= 1
+                raise
+        except BaseException:
+            # Cancelled (or failed) before the command was queued: free its slot
+            self._slots.release()
+            raise
+        self._submitted += 1
+        self._max_queued = max(self._max_queued, self._queued)
+        return future
+
+    async def dispatch(self, index, command, *args):
+        """Submit a command and wait for its result (see submit)."""
+        return await (await self.submit(index, command, *args))
+
+    async def _serve(self, vehicle, queue):
+        """Run one vehicle's commands in order, forever."""
+        loop = asyncio.get_running_loop()
+        while True:
+            command, args, future, submitted = await queue.get()
+            self._queued -= 1
+            try:
+                method = getattr(vehicle, command)
+                if self.executor is None:
+                    result = method(*args)
+                else:
+                    result = await loop.run_in_executor(self.executor, method, *args)
+            except asyncio.CancelledError:
+                future.cancel()  # The controller is closing
+                self._cancelled += 1
+                self._slots.release()
+                queue.task_done()
+                raise
+            except Exception as error:
+                self._failed += 1
+                if not future.cancelled():
+                    future.set_exception(error)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            latency = loop.time() - submitted
+            self._latency_total += latency
+            self._latencies.append(latency)
+            self._completed += 1
+            self._slots.release()
+            queue.task_done()
+            if self.executor is None:
+                await asyncio.sleep(0)  # Let other vehicles take their turn
+
+    async def join(self):
+        """Wait until every submitted command has run."""
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+
+    async def close(self):
+        """Stop all vehicle tasks; queued commands are cancelled."""
+        self._closed = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, _, future, _ = queue.get_nowait()
+                future.cancel()
+                self._queued -= 1
+                self._cancelled += 1
+                self._slots.release()
+                queue.task_done()
+        if self._loop_sink is not None:
+            set_sink(self._loop_sink.sink)
+            set_rejection_hook(self._loop_sink.hook)
+            self._loop_sink = None
+
+    def stats(self):
+        """Return a snapshot of the controller's statistics.
+
+        Returns:
+            ControllerStats: Command counts (cancelled counts the commands
+            dropped by close()), current and peak queue depth and
+            latencies in seconds (mean over all commands, percentiles over
+            the most recent ones)
+        """
+        ordered = sorted(self._latencies)
+
+        def percentile(fraction):
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+        return ControllerStats(
+            submitted=self._submitted,
+            completed=self._completed,
+            failed=self._failed,
+            cancelled=self._cancelled,
+            in_flight=self._submitted - self._completed - self._cancelled,
+            queued=self._queued,
+            max_queued=self._max_queued,
+            mean_latency=self._latency_total / self._completed if self._completed else 0.0,
+            p50_latency=percentile(0.5),
+            p99_latency=percentile(0.99),
+        )
+
+
+async def fake_commands(vehicles, count, seed=0):
+    """Generate random but valid commands for load-testing a controller.
+
+    Args:
+        vehicles (sequence): The vehicles commands are generated for
+        count (int): Number of commands to generate
+        seed (int): Seed for the random generator
+
+    Yields:
+        tuple: (vehicle index, command, args)
+    """
+    from Vehicle_polymorphism_challenge import Boat, Plane
+
+    rng = random.Random(seed)
+    common = ("start", "accelerate", "brake", "move", "stop")
+    for _ in range(count):
+        index = rng.randrange(len(vehicles))
+        vehicle = vehicles[index]
+        if isinstance(vehicle, Boat):
+            command = rng.choice(common + ("anchor", "raise_anchor"))
+        elif isinstance(vehicle, Plane):
+            command = rng.choice(common + ("take_off", "land", "change_altitude"))
+        else:
+            command = rng.choice(common)
+        if command in ("accelerate", "brake"):
+            args = (rng.randint(10, 100),)
+        elif command == "change_altitude":
+            args = (rng.randint(-5000, 5000),)
+        else:
+            args = ()
+        yield index, command, args
+
+
+async def load_test(controller, source):
+    """Feed every command from a source into a controller and wait for them.
+
+    Args:
+        controller (FleetController): The controller under test
+        source (async iterable): Yields (vehicle index, command, args)
+
+    Returns:
+        ControllerStats: The controller's statistics after the run
+    """
+    async for index, command, args in source:
+        await controller.submit(index, command, *args)
+    await controller.join()
+    return controller.stats()
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    import event_sink
+    from Vehicle_polymorphism_challenge import Car, Boat, Plane
+
+    async def main():
+        vehicles = []
+        for i in range(3000):
+            if i % 3 == 0:
+                vehicles.append(Car("Tesla", "Model S", 2023, "red", "electric", 4))
+            elif i % 3 == 1:
+                vehicles.append(Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5))
+            else:
+                vehicles.append(Plane("Boeing", "747", 2020, "white", 45000, 4))
+
+        with event_sink.using(event_sink.NullSink()):
+            async with FleetController(vehicles, max_in_flight=500) as controller:
+                start = time.perf_counter()
+                stats = await load_test(controller, fake_commands(vehicles, 100_000, seed=1))
+                elapsed = time.perf_counter() - start
+
+        print("=== Load Test ===")
+        print(f"{stats.completed} commands in {elapsed:.2f}s ({stats.completed / elapsed:,.0f}/s)")
+        print(f"Peak queue depth: {stats.max_queued}")
+        print(f"Latency: mean {stats.mean_latency * 1000:.2f} ms, "
+              f"p50 {stats.p50_latency * 1000:.2f} ms, p99 {stats.p99_latency * 1000:.2f} ms")
+
+    asyncio.run(main())
@@ -0,0 +1,178 @@
+"""Tick-based fleet simulation sharded across worker processes.
+
+Each vehicle follows its own script of commands (method calls such as
+start, accelerate, move or stop) scheduled at given ticks. The fleet is
+split into a fixed number of shards that worker processes advance in
+rounds of ticks; after every round all shards have reached the same tick
+and their per-tick statistics are merged in shard order. Because the shard
+layout does not depend on the number of workers and statistics are merged
+from integer totals, results are identical for any worker count.
+
+Vehicles are sent to the workers by pickling, so they must be plain
+vehicles (not FleetStore views). Whatever the worker count, the simulation
+changes the vehicles it was given: the state the workers return is copied
+back into them after every round.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import event_sink
+from Vehicle_polymorphism_challenge import Boat, Plane
+
+TickStats = namedtuple("TickStats", ["tick", "running", "mean_speed", "airborne", "anchored"])
+
+# Per-shard totals for one tick: running, total speed of running vehicles,
+# planes in the air, boats at anchor
+_Totals = namedtuple("_Totals", ["running", "speed", "airborne", "anchored"])
+
+
+def _advance_shard(vehicles, commands_by_tick):
+    """Run one shard for a round of ticks (executed in a worker process).
+
+    Args:
+        vehicles (list): The shard's vehicles
+        commands_by_tick (list): For each tick of the round, a list of
+            (vehicle index, method name, args) commands
+
+    Returns:
+        tuple: The updated vehicles and one _Totals per tick
+    """
+    totals = []
+    with event_sink.using(event_sink.NullSink()):
+        for commands in commands_by_tick:
+            for index, command, args in commands:
+                getattr(vehicles[index], command)(*args)
+            running = speed = airborne = anchored = 0
+            for vehicle in vehicles:
+                if vehicle.is_running:
+                    running += 1
+                    speed += vehicle.speed
+                if isinstance(vehicle, Plane) and not vehicle.is_landed:
+                    airborne += 1
+                elif isinstance(vehicle, Boat) and vehicle.is_anchored:
+                    anchored += 1
+            totals.append(_Totals(running, speed, airborne, anchored))
+    return vehicles, totals
+
+
+class FleetSimulation:
+    """Advances a scripted fleet tick by tick on a pool of processes."""
+
+    def __init__(self, vehicles, scripts, shards=8, workers=None, ticks_per_round=100):
+        """Initialize the simulation.
+
+        Args:
+            vehicles (list): The vehicles to simulate; run() updates them in place
+            scripts (list): One script per vehicle; a script is a list of
+                (tick, method name, args) commands, e.g. (3, "accelerate", (40,))
+            shards (int): Number of fleet partitions; fixes the results
+            workers (int, optional): Worker processes; 0 runs everything in
+                this process, None lets the pool pick a default
+            ticks_per_round (int): Ticks each shard advances between merges
+        """
+        if len(scripts) != len(vehicles):
+            raise ValueError(f"Got {len(scripts)} scripts for {len(vehicles)} vehicles.")
+        self.tick = 0
+        self.workers = workers
+        self.ticks_per_round = ticks_per_round
+        shards = max(1, min(shards, len(vehicles)))
+        size = -(-len(vehicles) // shards)
+        self.shards = [list(vehicles[start:start + size]) for start in range(0, len(vehicles), size)]
+        self._scripts = []  # per shard: tick -> [(local index, command, args)]
+        for start in range(0, len(vehicles), size):
+            by_tick = {}
+            for index, script in enumerate(scripts[start:start + size]):
+                for tick, command, args in script:
+                    by_tick.setdefault(tick, []).append((index, command, tuple(args)))
+            self._scripts.append(by_tick)
+
+    @property
+    def vehicles(self):
+        """All vehicles in their original order, with their current state."""
+        return [vehicle for shard in self.shards for vehicle in shard]
+
+    def run(self, ticks):
+        """Advance the whole fleet by a number of ticks.
+
+        Args:
+            ticks (int): How many ticks to simulate
+
+        Returns:
+            list: One TickStats per simulated tick
+        """
+        stats = []
+        executor = ProcessPoolExecutor(self.workers) if self.workers != 0 else None
+        try:
+            end = self.tick + ticks
+            while self.tick < end:
+                stop = min(self.tick + self.ticks_per_round, end)
+                rounds = [
+                    (shard, [by_tick.get(tick, []) for tick in range(self.tick, stop)])
+                    for shard, by_tick in zip(self.shards, self._scripts)
+                ]
+                if executor is None:
+                    results = [_advance_shard(*work) for work in rounds]
+                else:
+                    results = list(executor.map(_advance_shard, *zip(*rounds)))
+                    for shard, (updated, _) in zip(self.shards, results):
+                        for vehicle, copy in zip(shard, updated):
+                            vehicle.__dict__.update(copy.__dict__)
+                for offset, per_shard in enumerate(zip(*(totals for _, totals in results))):
+                    stats.append(self._merge(self.tick + offset, per_shard))
+                self.tick = stop
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return stats
+
+    @staticmethod
+    def _merge(tick, per_shard):
+        """Combine the per-shard totals of one tick, in shard order."""
+        running = sum(totals.running for totals in per_shard)
+        speed = sum(totals.speed for totals in per_shard)
+        return TickStats(
+            tick=tick,
+            running=running,
+            mean_speed=speed / running if running else 0.0,
+            airborne=sum(totals.airborne for totals in per_shard),
+            anchored=sum(totals.anchored for totals in per_shard),
+        )
+
+
+# Example usage
+if __name__ == "__main__":
+    import random
+
+    from Vehicle_polymorphism_challenge import Car
+
+    def make_fleet(count, seed):
+        rng = random.Random(seed)
+        vehicles, scripts = [], []
+        for i in range(count):
+            kind = rng.choice((Car, Boat, Plane))
+            if kind is Car:
+                vehicles.append(Car("Tesla", "Model S", 2023, "red", "electric", 4))
+            elif kind is Boat:
+                vehicles.append(Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5))
+            else:
+                vehicles.append(Plane("Boeing", "747", 2020, "white", 45000, 4))
+            script = [(0, "start", ())]
+            for tick in sorted(rng.sample(range(1, 200), 20)):
+                command = rng.choice(("accelerate", "brake", "move", "anchor", "take_off", "land", "stop", "start"))
+                if command == "anchor" and kind is not Boat:
+                    command = "move"
+                elif command in ("take_off", "land") and kind is not Plane:
+                    command = "move"
+                args = (rng.randint(10, 80),) if command in ("accelerate", "brake") else ()
+                script.append((tick, command, args))
+            scripts.append(script)
+        return vehicles, scripts
+
+    serial = FleetSimulation(*make_fleet(2000, seed=7), workers=0).run(200)
+    parallel = FleetSimulation(*make_fleet(2000, seed=7), workers=4).run(200)
+
+    print("=== Fleet Statistics ===")
+    for stats in serial[::40]:
+        print(f"tick {stats.tick:3}: {stats.running} running, mean speed {stats.mean_speed:.1f} km/h, "
+              f"{stats.airborne} airborne, {stats.anchored} anchored")
+    print(f"\nSerial and parallel runs match: {serial == parallel}")
@@ -0,0 +1,337 @@
+"""Columnar storage for large fleets of vehicles.
+
+A FleetStore keeps the mutable state of many vehicles in contiguous arrays
+so that whole-fleet operations run as one pass over a few columns instead of
+one method call (and one print) per vehicle. The pass updates the selected
+rows in place, one element at a time: it saves the method calls and prints,
+it is not vectorized arithmetic. Vehicles added to a store keep
+working as normal objects: their state attributes become views into the
+store's columns.
+"""
+from array import array
+
+from Vehicle_polymorphism_challenge import Boat, Plane
+
+
+class _Column:
+    """Descriptor that redirects a vehicle attribute to a store column."""
+
+    def __init__(self, name, convert=int):
+        """Initialize the descriptor.
+
+        Args:
+            name (str): The name of the store column (and vehicle attribute)
+            convert (callable): Converts the raw column value for readers
+        """
+        self.name = name
+        self.convert = convert
+
+    def __get__(self, vehicle, owner):
+        if vehicle is None:
+            return self
+        return self.convert(getattr(vehicle._store, self.name)[vehicle._row])
+
+    def __set__(self, vehicle, value):
+        getattr(vehicle._store, self.name)[vehicle._row] = value
+
+
+class _Number(_Column):
+    """Descriptor for a numeric column that remembers whether a value is a float.
+
+    Numbers are stored as doubles next to a flag column, so a view reads back
+    exactly the int or float a plain vehicle would hold (80 stays 80, 5.0
+    stays 5.0). Ints beyond 2 ** 53, which a double cannot hold exactly, are
+    refused.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.flag = _FLAGS[name]
+
+    def __get__(self, vehicle, owner):
+        if vehicle is None:
+            return self
+        store, row = vehicle._store, vehicle._row
+        value = getattr(store, self.name)[row]
+        return value if getattr(store, self.flag)[row] else int(value)
+
+    def __set__(self, vehicle, value):
+        store, row = vehicle._store, vehicle._row
+        getattr(store, self.name)[row], getattr(store, self.flag)[row] = _stored(self.name, value)
+
+
+class _Year(_Number):
+    """Descriptor for the year column, which no fleet operation changes.
+
+    A plain vehicle accepts any year, so a value the column cannot hold (a
+    string, None, a bool, an int beyond 2 ** 53) stays in the vehicle's own
+    __dict__, and the column holds NaN for it.
+    """
+
+    def __get__(self, vehicle, owner):
+        if vehicle is not None and "year" in vehicle.__dict__:
+            return vehicle.__dict__["year"]
+        return super().__get__(vehicle, owner)
+
+    def __set__(self, vehicle, value):
+        store, row = vehicle._store, vehicle._row
+        store.year[row], store.year_is_float[row] = _stored_year(vehicle.__dict__, value)
+
+
+def _stored_year(state, value):
+    """Return the column values for a year, keeping it in ``state`` if they cannot hold it."""
+    if not isinstance(value, bool):
+        try:
+            stored = _stored("year", value)
+        except (TypeError, OverflowError):
+            pass
+        else:
+            state.pop("year", None)
+            return stored
+    state["year"] = value
+    return float("nan"), False
+
+
+def _stored(name, value):
+    """Return (column value, is-float flag) for a number, or raise like the columns used to."""
+    if isinstance(value, float):
+        return value, True
+    if not isinstance(value, int):
+        raise TypeError(f"{name} must be a number, not {type(value).__name__}")
+    if not -_EXACT <= value <= _EXACT:
+        raise OverflowError(f"{name} {value} is too large for a fleet store")
+    return value, False
+
+
+_EXACT = 2 ** 53  # Largest range of ints a double holds exactly
+
+# Column name -> (array typecode, converter for views). Numeric columns are
+# doubles with a flag column each (see _Number).
+_COLUMNS = {
+    "year": ("d", None),
+    "speed": ("d", None),
+    "is_running": ("b", bool),
+    "is_anchored": ("b", bool),
+    "is_landed": ("b", bool),
+    "altitude": ("d", None),
+    "max_altitude": ("d", None),
+    "year_is_float": ("b", bool),
+    "speed_is_float": ("b", bool),
+    "altitude_is_float": ("b", bool),
+    "max_altitude_is_float": ("b", bool),
+}
+
+# Numeric column -> its flag column
+_FLAGS = {name: name + "_is_float" for name in ("year", "speed", "altitude", "max_altitude")}
+
+# Descriptor class of each numeric column
+_DESCRIPTORS = dict.fromkeys(_FLAGS, _Number)
+_DESCRIPTORS["year"] = _Year
+
+# Defaults used for rows whose vehicle class has no such attribute
+_DEFAULTS = {"is_anchored": False, "is_landed": False, "altitude": 0, "max_altitude": 0}
+
+_view_classes = {}
+
+
+def _columns_for(cls):
+    """Return the names of the columns a vehicle class keeps in the store."""
+    names = ["year", "speed", "is_running"]
+    if issubclass(cls, Boat):
+        names.append("is_anchored")
+    if issubclass(cls, Plane):
+        names.extend(("is_landed", "altitude", "max_altitude"))
+    return names
+
+
+def _view_class(cls):
+    """Return (and cache) the store-backed subclass of a vehicle class.
+
+    The subclass keeps the original class name and methods, so printing,
+    str() and method behavior are unchanged; only where the state lives
+    differs.
+    """
+    if cls in _view_classes.values():
+        return cls
+    if cls not in _view_classes:
+        namespace = {name: _DESCRIPTORS[name](name) if name in _DESCRIPTORS
+                     else _Column(name, _COLUMNS[name][1]) for name in _columns_for(cls)}
+        namespace["__module__"] = cls.__module__
+        namespace["__doc__"] = cls.__doc__
+        _view_classes[cls] = type(cls.__name__, (cls,), namespace)
+    return _view_classes[cls]
+
+
+class FleetStore:
+    """Contiguous, column-per-attribute storage for a fleet of vehicles."""
+
+    def __init__(self, vehicles=()):
+        """Initialize the store, optionally with an initial fleet.
+
+        Args:
+            vehicles (iterable): Vehicles to add to the store
+        """
+        for name, (typecode, _) in _COLUMNS.items():
+            setattr(self, name, self._make_column(typecode))
+        self.vehicles = []
+        self.extend(vehicles)
+
+    def _make_column(self, typecode):
+        """Create an empty column; subclasses may use other buffers."""
+        return array(typecode)
+
+    def __len__(self):
+        return len(self.vehicles)
+
+    def __iter__(self):
+        return iter(self.vehicles)
+
+    def __getitem__(self, row):
+        return self.vehicles[row]
+
+    def add(self, vehicle):
+        """Move a vehicle's state into the store.
+
+        The vehicle object stays usable; afterwards its state attributes
+        read from and write to the store's columns.
+
+        Args:
+            vehicle (Vehicle): The vehicle to add
+
+        Returns:
+            int: The row of the vehicle in the store
+        """
+        if getattr(vehicle, "_store", None) is not None:
+            raise ValueError(f"{vehicle} already belongs to a fleet store.")
+        state = vehicle.__dict__
+        row = len(self.vehicles)
+        stored = _columns_for(type(vehicle))
+        values = {name: state[name] if name in stored else _DEFAULTS.get(name)
+                  for name in _COLUMNS if name not in _FLAGS.values()}
+        for name, flag in _FLAGS.items():
+            if name != "year":
+                values[name], values[flag] = _stored(name, values[name])
+        kept = {}
+        values["year"], values["year_is_float"] = _stored_year(kept, values["year"])
+        for name in _COLUMNS:
+            getattr(self, name).append(values[name])
+        for name in stored:
+            del state[name]
+        state.update(kept)
+        state["_store"] = self
+        state["_row"] = row
+        vehicle.__class__ = _view_class(type(vehicle))
+        self.vehicles.append(vehicle)
+        return row
+
+    def extend(self, vehicles):
+        """Add several vehicles to the store.
+
+        Args:
+            vehicles (iterable): The vehicles to add
+        """
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def kind_mask(self, cls):
+        """Build a mask selecting the vehicles of a given class.
+
+        Args:
+            cls (type): A vehicle class, e.g. Boat or Plane
+
+        Returns:
+            array: One flag per row, set where the vehicle is a ``cls``
+        """
+        return array("b", [isinstance(vehicle, cls) for vehicle in self.vehicles])
+
+    def _rows(self, mask):
+        """Return the rows of the running vehicles, restricted to an optional mask."""
+        if mask is None:
+            return [row for row, running in enumerate(self.is_running) if running]
+        if len(mask) != len(self.vehicles):
+            raise ValueError(f"Mask has {len(mask)} entries for a fleet of {len(self.vehicles)}.")
+        return [row for row, (running, keep) in enumerate(zip(self.is_running, mask)) if running and keep]
+
+    def accelerate(self, speed_increase, mask=None):
+        """Increase the speed of every running vehicle.
+
+        Args:
+            speed_increase (int or float): The amount to increase speed by
+            mask (sequence, optional): Per-row flags limiting which vehicles are affected
+
+        Returns:
+            int: The number of vehicles that accelerated
+        """
+        rows = self._rows(mask)
+        speed, speed_is_float = self.speed, self.speed_is_float
+        to_float = isinstance(speed_increase, float)
+        for row in rows:
+            speed[row] += speed_increase
+            if to_float:
+                speed_is_float[row] = 1
+        return len(rows)
+
+    def brake(self, speed_decrease, mask=None):
+        """Decrease the speed of every running vehicle, stopping at zero.
+
+        Args:
+            speed_decrease (int or float): The amount to decrease speed by
+            mask (sequence, optional): Per-row flags limiting which vehicles are affected
+
+        Returns:
+            int: The number of vehicles that slowed down
+        """
+        rows = self._rows(mask)
+        speed, speed_is_float = self.speed, self.speed_is_float
+        to_float = isinstance(speed_decrease, float)
+        for row in rows:
+            if speed_decrease > speed[row]:
+                # As in Vehicle.brake: braking to a standstill leaves the int 0
+                speed[row] = speed_is_float[row] = 0
+            else:
+                speed[row] -= speed_decrease
+                if to_float:
+                    speed_is_float[row] = 1
+        return len(rows)
+
+    def stop(self, mask=None):
+        """Stop the engine of every running vehicle.
+
+        Args:
+            mask (sequence, optional): Per-row flags limiting which vehicles are affected
+
+        Returns:
+            int: The number of vehicles that were stopped
+        """
+        rows = self._rows(mask)
+        speed, speed_is_float, is_running = self.speed, self.speed_is_float, self.is_running
+        for row in rows:
+            speed[row] = speed_is_float[row] = is_running[row] = 0
+        return len(rows)
+
+
+# Example usage
+if __name__ == "__main__":
+    from Vehicle_polymorphism_challenge import Car, Motorcycle
+
+    fleet = FleetStore([
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Motorcycle("Harley-Davidson", "Street Glide", 2022, "black", 1868, False),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+    ])
+
+    print("=== Starting Vehicles ===")
+    for vehicle in fleet:
+        vehicle.start()  # Existing methods still work on stored vehicles
+
+    print("\n=== Whole-Fleet Operations ===")
+    fleet.accelerate(80)
+    fleet.brake(30, mask=fleet.kind_mask(Boat))
+    for vehicle in fleet:
+        print(vehicle)
+
+    print("\n=== Stopping Vehicles ===")
+    print(f"Stopped {fleet.stop()} vehicles.")
+    for vehicle in fleet:
+        print(vehicle)
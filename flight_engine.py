@@ -0,0 +1,174 @@
+"""Batched take-off, landing and altitude changes for planes in a FleetStore.
+
+FlightEngine applies the rules of Plane.take_off, Plane.land and
+Plane.change_altitude to every plane of a fleet in one call. Instead of
+printing, each call returns one outcome code per plane.
+"""
+from array import array
+
+from Vehicle_polymorphism_challenge import Plane
+# The outcome codes returned for each plane are the ones the methods use
+from vehicle_transitions import (
+    OK, BELOW_ZERO, ABOVE_MAX, NOT_AIRBORNE, NOT_RUNNING, ALREADY_AIRBORNE, TOO_SLOW, SKIPPED, OUTCOME_NAMES,
+    TAKE_OFF_SPEED, TAKE_OFF_ALTITUDE,
+)
+
+
+class FlightEngine:
+    """Applies plane flight rules to all planes of a FleetStore at once."""
+
+    def __init__(self, store):
+        """Initialize the engine for the planes of a fleet.
+
+        Args:
+            store (FleetStore): The fleet whose planes are controlled
+        """
+        self.store = store
+        self.refresh()
+
+    def refresh(self):
+        """Re-scan the store for planes, e.g. after adding vehicles."""
+        self.rows = array("q", [row for row, vehicle in enumerate(self.store) if isinstance(vehicle, Plane)])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def planes(self):
+        """Return the planes in the order used for outcome codes."""
+        return [self.store[row] for row in self.rows]
+
+    def _checked(self, values, what):
+        """Make sure a per-plane sequence lines up with the engine's planes."""
+        if len(values) != len(self.rows):
+            raise ValueError(f"Got {len(values)} {what} for {len(self.rows)} planes.")
+        return values
+
+    def take_off(self, mask=None):
+        """Take off every plane that is running, landed and fast enough.
+
+        Args:
+            mask (sequence, optional): Per-plane flags limiting which planes try to take off
+
+        Returns:
+            array: One outcome code per plane (OK, NOT_RUNNING, ALREADY_AIRBORNE or TOO_SLOW)
+        """
+        store = self.store
+        running, landed, speed, altitude = store.is_running, store.is_landed, store.speed, store.altitude
+        if mask is None:
+            mask = (True,) * len(self.rows)
+        codes = array("b", bytes(len(self.rows)))
+        for i, (row, chosen) in enumerate(zip(self.rows, self._checked(mask, "mask flags"))):
+            if not chosen:
+                codes[i] = SKIPPED
+            elif running[row] and landed[row] and speed[row] >= TAKE_OFF_SPEED:
+                landed[row] = False
+                altitude[row] = TAKE_OFF_ALTITUDE
+                store.altitude_is_float[row] = False
+            elif not running[row]:
+                codes[i] = NOT_RUNNING
+            elif not landed[row]:
+                codes[i] = ALREADY_AIRBORNE
+            else:
+                codes[i] = TOO_SLOW
+        return codes
+
+    def land(self, mask=None):
+        """Land every plane that is running and in the air.
+
+        Args:
+            mask (sequence, optional): Per-plane flags limiting which planes try to land
+
+        Returns:
+            array: One outcome code per plane (OK, NOT_AIRBORNE or NOT_RUNNING)
+        """
+        store = self.store
+        running, landed, speed, altitude = store.is_running, store.is_landed, store.speed, store.altitude
+        if mask is None:
+            mask = (True,) * len(self.rows)
+        codes = array("b", bytes(len(self.rows)))
+        for i, (row, chosen) in enumerate(zip(self.rows, self._checked(mask, "mask flags"))):
+            if not chosen:
+                codes[i] = SKIPPED
+            elif running[row] and not landed[row]:
+                landed[row] = True
+                altitude[row] = 0
+                speed[row] = 0
+                store.altitude_is_float[row] = store.speed_is_float[row] = False
+            elif landed[row]:
+                codes[i] = NOT_AIRBORNE
+            else:
+                codes[i] = NOT_RUNNING
+        return codes
+
+    def change_altitude(self, altitude_changes):
+        """Change the altitude of every plane by its own amount.
+
+        Args:
+            altitude_changes (number or sequence): One change per plane (can be
+                positive or negative), or a single change applied to all
+
+        Returns:
+            array: One outcome code per plane (OK, BELOW_ZERO, ABOVE_MAX,
+            NOT_AIRBORNE or NOT_RUNNING)
+        """
+        if isinstance(altitude_changes, (int, float)):
+            altitude_changes = (altitude_changes,) * len(self.rows)
+        store = self.store
+        running, landed = store.is_running, store.is_landed
+        altitude, max_altitude = store.altitude, store.max_altitude
+        altitude_is_float = store.altitude_is_float
+        codes = array("b", bytes(len(self.rows)))
+        for i, (row, change) in enumerate(zip(self.rows, self._checked(altitude_changes, "altitude changes"))):
+            if running[row] and not landed[row]:
+                new_altitude = altitude[row] + change
+                if new_altitude <= 0:
+                    codes[i] = BELOW_ZERO
+                elif new_altitude > max_altitude[row]:
+                    codes[i] = ABOVE_MAX
+                else:
+                    altitude[row] = new_altitude
+                    if isinstance(change, float):
+                        altitude_is_float[row] = True
+            elif landed[row]:
+                codes[i] = NOT_AIRBORNE
+            else:
+                codes[i] = NOT_RUNNING
+        return codes
+
+
+def summarize(codes):
+    """Count how often each outcome occurs.
+
+    Args:
+        codes (sequence): Outcome codes returned by a FlightEngine call
+
+    Returns:
+        dict: Outcome name -> number of planes with that outcome
+    """
+    counts = {}
+    for code in codes:
+        name = OUTCOME_NAMES[code]
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+# Example usage
+if __name__ == "__main__":
+    from fleet_store import FleetStore
+
+    fleet = FleetStore(Plane("Boeing", "747", 2020, "white", 45000, 4) for _ in range(5))
+    engine = FlightEngine(fleet)
+
+    fleet.is_running[:] = array("b", [1, 1, 1, 1, 0])
+    fleet.accelerate(200, mask=[1, 1, 1, 0, 0])
+
+    print("=== Take-off ===")
+    print(summarize(engine.take_off()))
+
+    print("\n=== Altitude Changes ===")
+    print(summarize(engine.change_altitude([10000, 50000, -2000, 500, 500])))
+
+    print("\n=== Landing ===")
+    print(summarize(engine.land()))
+    for plane in engine.planes():
+        print(plane)
@@ -0,0 +1,417 @@
+"""Flyweight versions of the vehicle and animal classes.
+
+Large populations repeat the same descriptive values over and over: a few
+hundred make / model / year / color / fuel_type combinations cover millions
+of vehicles, and fur_color, scale_type and species take only a handful of
+values across millions of animals. The classes here keep those values in an
+immutable spec (a namedtuple) that is interned, so every instance with the
+same combination points at one shared spec. The instances themselves are
+slotted and hold only their mutable state (speed, is_running, name, age,
+weight_kg, ...) plus the reference to their spec.
+
+Descriptive attributes read through the spec (``car.make`` works as usual).
+Assigning one, e.g. ``car.color = "blue"``, gives that instance another
+interned spec; the shared spec itself never changes. Behavior methods are
+shared with the regular classes, so both produce exactly the same events.
+"""
+from collections import namedtuple
+from operator import attrgetter
+
+from Animal_kingdom_classes import Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Vehicle, Car, Motorcycle, Boat, Plane
+from compact_animals import CompactSnake
+
+VehicleSpec = namedtuple("VehicleSpec", ["make", "model", "year", "color"])
+CarSpec = namedtuple("CarSpec", VehicleSpec._fields + ("fuel_type", "doors"))
+MotorcycleSpec = namedtuple("MotorcycleSpec", VehicleSpec._fields + ("engine_size", "has_sidecar"))
+BoatSpec = namedtuple("BoatSpec", VehicleSpec._fields + ("boat_type", "length"))
+PlaneSpec = namedtuple("PlaneSpec", VehicleSpec._fields + ("max_altitude", "num_engines"))
+
+AnimalSpec = namedtuple("AnimalSpec", [])
+MammalSpec = namedtuple("MammalSpec", ["fur_color", "is_carnivore"])
+BirdSpec = namedtuple("BirdSpec", ["wingspan", "can_fly"])
+ReptileSpec = namedtuple("ReptileSpec", ["scale_type", "is_venomous"])
+LionSpec = namedtuple("LionSpec", MammalSpec._fields + ("mane_size",))
+EagleSpec = namedtuple("EagleSpec", BirdSpec._fields + ("eyesight_distance",))
+SnakeSpec = namedtuple("SnakeSpec", ReptileSpec._fields + ("length",))
+
+_specs = {}  # (spec class, spec, value types) -> the shared spec
+
+
+def intern(spec):
+    """Return the shared spec equal to ``spec``, registering it if it is new.
+
+    Specs of different classes with the same values (a MammalSpec and a
+    ReptileSpec of ("brown", False)) compare equal as tuples, and so do
+    values of different types (2023 and 2023.0, True and 1), so the class
+    and the value types are part of the key.
+    """
+    return _specs.setdefault((type(spec), spec, tuple(map(type, spec))), spec)
+
+
+def spec_count():
+    """Return the number of distinct specs interned so far."""
+    return len(_specs)
+
+
+def _spec_field(name):
+    """Property reading one field of the instance's spec; setting it re-interns."""
+    def replace(self, value):
+        self.spec = intern(self.spec._replace(**{name: value}))
+    return property(attrgetter("spec." + name), replace, doc=f"The {name} stored in the shared spec.")
+
+
+def _reads_spec(cls):
+    """Class decorator adding a property for every field of ``cls.spec_type``."""
+    for name in cls.spec_type._fields:
+        setattr(cls, name, _spec_field(name))
+    return cls
+
+
+@_reads_spec
+class FlyweightVehicle:
+    """Flyweight counterpart of Vehicle."""
+
+    __slots__ = ("spec", "speed", "is_running")
+    spec_type = VehicleSpec
+    state_machine = Vehicle.state_machine
+
+    def __init__(self, make, model, year, color):
+        """Initialize a vehicle with basic attributes.
+
+        Args:
+            make (str): The manufacturer of the vehicle
+            model (str): The model name of the vehicle
+            year (int): The year the vehicle was manufactured
+            color (str): The color of the vehicle
+        """
+        self.spec = intern(VehicleSpec(make, model, year, color))
+        self.speed = 0
+        self.is_running = False
+
+    start = Vehicle.start
+    stop = Vehicle.stop
+    move = Vehicle.move
+    accelerate = Vehicle.accelerate
+    brake = Vehicle.brake
+    __str__ = Vehicle.__str__
+
+
+@_reads_spec
+class FlyweightCar(FlyweightVehicle):
+    """Flyweight counterpart of Car."""
+
+    __slots__ = ("is_convertible",)
+    spec_type = CarSpec
+
+    def __init__(self, make, model, year, color, fuel_type, doors):
+        """Initialize a car with car-specific attributes.
+
+        Args:
+            make (str): The manufacturer of the car
+            model (str): The model name of the car
+            year (int): The year the car was manufactured
+            color (str): The color of the car
+            fuel_type (str): The type of fuel the car uses
+            doors (int): The number of doors the car has
+        """
+        self.spec = intern(CarSpec(make, model, year, color, fuel_type, doors))
+        self.speed = 0
+        self.is_running = False
+        self.is_convertible = False
+
+    move = Car.move
+    honk = Car.honk
+    park = Car.park
+
+
+@_reads_spec
+class FlyweightMotorcycle(FlyweightVehicle):
+    """Flyweight counterpart of Motorcycle."""
+
+    __slots__ = ()
+    spec_type = MotorcycleSpec
+
+    def __init__(self, make, model, year, color, engine_size, has_sidecar):
+        """Initialize a motorcycle with motorcycle-specific attributes.
+
+        Args:
+            make (str): The manufacturer of the motorcycle
+            model (str): The model name of the motorcycle
+            year (int): The year the motorcycle was manufactured
+            color (str): The color of the motorcycle
+            engine_size (int): The engine size in cc
+            has_sidecar (bool): Whether the motorcycle has a sidecar
+        """
+        self.spec = intern(MotorcycleSpec(make, model, year, color, engine_size, has_sidecar))
+        self.speed = 0
+        self.is_running = False
+
+    move = Motorcycle.move
+    pop_wheelie = Motorcycle.pop_wheelie
+    rev_engine = Motorcycle.rev_engine
+
+
+@_reads_spec
+class FlyweightBoat(FlyweightVehicle):
+    """Flyweight counterpart of Boat."""
+
+    __slots__ = ("is_anchored",)
+    spec_type = BoatSpec
+    state_machine = Boat.state_machine
+
+    def __init__(self, make, model, year, color, boat_type, length):
+        """Initialize a boat with boat-specific attributes.
+
+        Args:
+            make (str): The manufacturer of the boat
+            model (str): The model name of the boat
+            year (int): The year the boat was manufactured
+            color (str): The color of the boat
+            boat_type (str): The type of boat (e.g., sailboat, motorboat)
+            length (float): The length of the boat in meters
+        """
+        self.spec = intern(BoatSpec(make, model, year, color, boat_type, length))
+        self.speed = 0
+        self.is_running = False
+        self.is_anchored = False
+
+    move = Boat.move
+    anchor = Boat.anchor
+    raise_anchor = Boat.raise_anchor
+
+
+@_reads_spec
+class FlyweightPlane(FlyweightVehicle):
+    """Flyweight counterpart of Plane."""
+
+    __slots__ = ("altitude", "is_landed")
+    spec_type = PlaneSpec
+    state_machine = Plane.state_machine
+
+    def __init__(self, make, model, year, color, max_altitude, num_engines):
+        """Initialize a plane with plane-specific attributes.
+
+        Args:
+            make (str): The manufacturer of the plane
+            model (str): The model name of the plane
+            year (int): The year the plane was manufactured
+            color (str): The color of the plane
+            max_altitude (int): The maximum altitude in feet
+            num_engines (int): The number of engines
+        """
+        self.spec = intern(PlaneSpec(make, model, year, color, max_altitude, num_engines))
+        self.speed = 0
+        self.is_running = False
+        self.altitude = 0
+        self.is_landed = True
+
+    move = Plane.move
+    take_off = Plane.take_off
+    land = Plane.land
+    change_altitude = Plane.change_altitude
+
+
+@_reads_spec
+class FlyweightAnimal:
+    """Flyweight counterpart of Animal."""
+
+    __slots__ = ("spec", "name", "age", "weight_kg", "is_alive", "position", "velocity")
+    spec_type = AnimalSpec
+
+    def __init__(self, name, age, weight_kg):
+        """Initialize an animal with basic attributes.
+
+        Args:
+            name (str): The animal's name
+            age (int): The animal's age in years
+            weight_kg (float): The animal's weight in kilograms
+        """
+        self.spec = intern(AnimalSpec())
+        self.name = name
+        self.age = age
+        self.weight_kg = weight_kg
+        self.is_alive = True
+        self.position = (0.0, 0.0)
+        self.velocity = (0.0, 0.0)
+
+    advance = Animal.advance
+    eat = Animal.eat
+    sleep = Animal.sleep
+    make_sound = Animal.make_sound
+    move = Animal.move
+    __str__ = Animal.__str__
+
+
+def _animal_state(animal, spec, name, age, weight_kg):
+    """Set the state every animal starts with (the constructors are flat)."""
+    animal.spec = spec
+    animal.name = name
+    animal.age = age
+    animal.weight_kg = weight_kg
+    animal.is_alive = True
+    animal.position = (0.0, 0.0)
+    animal.velocity = (0.0, 0.0)
+
+
+@_reads_spec
+class FlyweightMammal(FlyweightAnimal):
+    """Flyweight counterpart of Mammal."""
+
+    __slots__ = ()
+    spec_type = MammalSpec
+    body_temperature = 37.0  # Celsius, typical for mammals
+
+    def __init__(self, name, age, weight_kg, fur_color, is_carnivore):
+        """Initialize a mammal (arguments as for Mammal)."""
+        _animal_state(self, intern(MammalSpec(fur_color, is_carnivore)), name, age, weight_kg)
+
+    give_birth = Mammal.give_birth
+    regulate_temperature = Mammal.regulate_temperature
+
+
+@_reads_spec
+class FlyweightBird(FlyweightAnimal):
+    """Flyweight counterpart of Bird."""
+
+    __slots__ = ()
+    spec_type = BirdSpec
+    has_feathers = True
+
+    def __init__(self, name, age, weight_kg, wingspan, can_fly):
+        """Initialize a bird (arguments as for Bird)."""
+        _animal_state(self, intern(BirdSpec(wingspan, can_fly)), name, age, weight_kg)
+
+    lay_eggs = Bird.lay_eggs
+    move = Bird.move
+    make_sound = Bird.make_sound
+
+
+@_reads_spec
+class FlyweightReptile(FlyweightAnimal):
+    """Flyweight counterpart of Reptile."""
+
+    __slots__ = ()
+    spec_type = ReptileSpec
+    cold_blooded = True
+
+    def __init__(self, name, age, weight_kg, scale_type, is_venomous):
+        """Initialize a reptile (arguments as for Reptile)."""
+        _animal_state(self, intern(ReptileSpec(scale_type, is_venomous)), name, age, weight_kg)
+
+    bask = Reptile.bask
+    move = Reptile.move
+    make_sound = Reptile.make_sound
+    shed_skin = Reptile.shed_skin
+
+
+@_reads_spec
+class FlyweightLion(FlyweightMammal):
+    """Flyweight counterpart of Lion."""
+
+    __slots__ = ()
+    spec_type = LionSpec
+    species = "Panthera leo"
+
+    def __init__(self, name, age, weight_kg, fur_color, mane_size=None):
+        """Initialize a lion (arguments as for Lion)."""
+        _animal_state(self, intern(LionSpec(fur_color, True, mane_size)), name, age, weight_kg)
+
+    make_sound = Lion.make_sound
+    move = Lion.move
+    hunt = Lion.hunt
+
+
+@_reads_spec
+class FlyweightEagle(FlyweightBird):
+    """Flyweight counterpart of Eagle."""
+
+    __slots__ = ()
+    spec_type = EagleSpec
+    species = "Aquila chrysaetos"  # Golden eagle
+
+    def __init__(self, name, age, weight_kg, wingspan, eyesight_distance):
+        """Initialize an eagle (arguments as for Eagle)."""
+        _animal_state(self, intern(EagleSpec(wingspan, True, eyesight_distance)), name, age, weight_kg)
+
+    make_sound = Eagle.make_sound
+    move = Eagle.move
+    hunt_from_above = Eagle.hunt_from_above
+
+
+@_reads_spec
+class FlyweightSnake(FlyweightReptile):
+    """Flyweight counterpart of Snake."""
+
+    __slots__ = ()
+    spec_type = SnakeSpec
+    species = CompactSnake.species
+
+    def __init__(self, name, age, weight_kg, scale_type, is_venomous, length):
+        """Initialize a snake (arguments as for Snake)."""
+        _animal_state(self, intern(SnakeSpec(scale_type, is_venomous, length)), name, age, weight_kg)
+
+    make_sound = Snake.make_sound
+    move = Snake.move
+    constrict = Snake.constrict
+    inject_venom = Snake.inject_venom
+
+
+FLYWEIGHT_CLASSES = {
+    Vehicle: FlyweightVehicle,
+    Car: FlyweightCar,
+    Motorcycle: FlyweightMotorcycle,
+    Boat: FlyweightBoat,
+    Plane: FlyweightPlane,
+    Animal: FlyweightAnimal,
+    Mammal: FlyweightMammal,
+    Bird: FlyweightBird,
+    Reptile: FlyweightReptile,
+    Lion: FlyweightLion,
+    Eagle: FlyweightEagle,
+    Snake: FlyweightSnake,
+}
+
+
+def to_flyweight(obj):
+    """Build the flyweight equivalent of a regular vehicle or animal.
+
+    Args:
+        obj: An instance of one of the regular classes
+
+    Returns:
+        The flyweight with the same attribute values, sharing its spec with
+        every other flyweight that has the same descriptive attributes
+    """
+    flyweight_cls = FLYWEIGHT_CLASSES[type(obj)]
+    flyweight = flyweight_cls.__new__(flyweight_cls)
+    flyweight.spec = intern(flyweight_cls.spec_type(*(getattr(obj, name) for name in flyweight_cls.spec_type._fields)))
+    for cls in flyweight_cls.__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name != "spec":
+                setattr(flyweight, name, getattr(obj, name))
+    return flyweight
+
+
+# Example usage
+if __name__ == "__main__":
+    fleet = [FlyweightCar("Tesla", "Model S", 2023, "red", "electric", 4) for _ in range(3)]
+    fleet.append(to_flyweight(Car("Tesla", "Model S", 2023, "red", "electric", 4)))
+
+    print("=== Shared Specs ===")
+    print(f"{len(fleet)} cars, {spec_count()} spec, same object: {all(car.spec is fleet[0].spec for car in fleet)}")
+
+    print("\n=== Behavior Is Unchanged ===")
+    fleet[0].start()
+    fleet[0].accelerate(60)
+    fleet[0].move()
+    print(fleet[0])
+
+    print("\n=== Repainting One Car ===")
+    fleet[1].color = "blue"
+    print(fleet[1])
+    print(f"{spec_count()} specs; the others are still {fleet[2].color}")
+
+    nagini = FlyweightSnake("Nagini", 8, 45.0, "smooth", True, 4.5)
+    print(f"\n{nagini} ({nagini.species})")
+    nagini.inject_venom("mouse")
@@ -0,0 +1,262 @@
+"""Streaming loader that turns CSV/JSONL registration dumps into objects.
+
+Each row names its class in a ``type`` column (car, motorcycle, boat, plane,
+lion, eagle, snake). Rows are validated, converted and passed to the
+class constructor one at a time, so memory use does not grow with the size
+of the file. Malformed rows are reported through a callback and skipped;
+the stream carries on with the next row.
+"""
+import csv
+import json
+import math
+import sys
+from collections import namedtuple
+from itertools import islice
+
+from Animal_kingdom_classes import Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane
+
+RowError = namedtuple("RowError", ["line", "reason", "row"])
+
+
+def _text(value):
+    value = str(value).strip()
+    if not value:
+        raise ValueError("must not be empty")
+    return value
+
+
+def _optional_text(value):
+    value = "" if value is None else str(value).strip()
+    return value or None
+
+
+def _integer(value):
+    if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"expected an integer, got {value!r}")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"expected an integer, got {value!r}") from None
+
+
+def _number(value):
+    if isinstance(value, bool):
+        raise ValueError(f"expected a number, got {value!r}")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"expected a number, got {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"expected a finite number, got {value!r}")
+    return number
+
+
+def _positive_integer(value):
+    value = _integer(value)
+    if value <= 0:
+        raise ValueError(f"must be positive, got {value}")
+    return value
+
+
+def _non_negative_integer(value):
+    value = _integer(value)
+    if value < 0:
+        raise ValueError(f"must not be negative, got {value}")
+    return value
+
+
+def _positive_number(value):
+    value = _number(value)
+    if value <= 0:
+        raise ValueError(f"must be positive, got {value}")
+    return value
+
+
+def _flag(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("true", "yes", "1"):
+        return True
+    if text in ("false", "no", "0"):
+        return False
+    raise ValueError(f"expected true or false, got {value!r}")
+
+
+_VEHICLE_FIELDS = (("make", _text), ("model", _text), ("year", _integer), ("color", _text))
+_ANIMAL_FIELDS = (("name", _text), ("age", _non_negative_integer), ("weight_kg", _positive_number))
+
+# Type column value -> (class, constructor arguments with their converters)
+SCHEMAS = {
+    "car": (Car, _VEHICLE_FIELDS + (("fuel_type", _text), ("doors", _positive_integer))),
+    "motorcycle": (Motorcycle, _VEHICLE_FIELDS + (("engine_size", _positive_integer), ("has_sidecar", _flag))),
+    "boat": (Boat, _VEHICLE_FIELDS + (("boat_type", _text), ("length", _positive_number))),
+    "plane": (Plane, _VEHICLE_FIELDS + (("max_altitude", _positive_integer), ("num_engines", _positive_integer))),
+    "lion": (Lion, _ANIMAL_FIELDS + (("fur_color", _text), ("mane_size", _optional_text))),
+    "eagle": (Eagle, _ANIMAL_FIELDS + (("wingspan", _positive_number), ("eyesight_distance", _positive_number))),
+    "snake": (Snake, _ANIMAL_FIELDS + (("scale_type", _text), ("is_venomous", _flag), ("length", _positive_number))),
+}
+
+# Fields that may be missing from a row
+_OPTIONAL = {"mane_size"}
+
+
+def read_csv(file):
+    """Yield (line number, row dict) pairs from a CSV file with a header row.
+
+    Rows the csv module cannot parse are yielded as a ValueError saying
+    why, so that the caller can report them and carry on.
+
+    Args:
+        file: An open text file
+    """
+    consumed = [0]  # Lines read so far, for locating unparsable rows
+
+    def lines():
+        for consumed[0], line in enumerate(file, 1):
+            yield line
+
+    reader = csv.DictReader(lines())
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as error:
+            yield consumed[0], ValueError(f"unreadable CSV: {error}")
+            continue
+        yield reader.line_num, row
+
+
+def read_jsonl(file):
+    """Yield (line number, row dict) pairs from a JSON Lines file.
+
+    Lines that are not JSON objects are yielded as a ValueError so that the
+    caller can report them.
+
+    Args:
+        file: An open text file
+    """
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else ValueError("not a JSON object")
+
+
+def build(row, type_field="type"):
+    """Validate one row and construct the object it describes.
+
+    Args:
+        row (dict): Field name -> raw value
+        type_field (str): The column naming the class
+
+    Returns:
+        The constructed vehicle or animal
+
+    Raises:
+        ValueError: If the type is unknown or a field is missing or invalid
+    """
+    kind = str(row.get(type_field, "")).strip().lower()
+    if kind not in SCHEMAS:
+        raise ValueError(f"unknown type {row.get(type_field)!r}")
+    cls, fields = SCHEMAS[kind]
+    arguments = []
+    for name, convert in fields:
+        value = row.get(name)
+        if (value is None or value == "") and name not in _OPTIONAL:
+            raise ValueError(f"missing field {name}")
+        try:
+            arguments.append(convert(value))
+        except ValueError as error:
+            raise ValueError(f"{name} {error}") from None
+    return cls(*arguments)
+
+
+def _report(error):
+    """Default error callback: describe the bad row on standard error."""
+    print(f"line {error.line}: {error.reason}", file=sys.stderr)
+
+
+def ingest(rows, on_error=_report, type_field="type"):
+    """Turn a stream of rows into objects, skipping malformed rows.
+
+    Args:
+        rows (iterable): (line number, row dict) pairs, e.g. from read_csv;
+            a ValueError (or None) in place of the dict marks a line that
+            could not be read
+        on_error (callable): Called with a RowError for every rejected row
+        type_field (str): The column naming the class
+
+    Yields:
+        The constructed vehicles and animals, in file order
+    """
+    for line, row in rows:
+        if row is None or isinstance(row, ValueError):
+            on_error(RowError(line, str(row) if row is not None else "not a JSON object", None))
+            continue
+        try:
+            yield build(row, type_field)
+        except ValueError as error:
+            on_error(RowError(line, str(error), row))
+
+
+def load(path, on_error=_report, type_field="type"):
+    """Stream objects from a .csv or .jsonl file.
+
+    Args:
+        path (str): The file to read; the format is taken from its extension
+        on_error (callable): Called with a RowError for every rejected row
+        type_field (str): The column naming the class
+
+    Yields:
+        The constructed vehicles and animals, in file order
+    """
+    reader = read_jsonl if path.endswith((".jsonl", ".ndjson")) else read_csv
+    with open(path, newline="", encoding="utf-8") as file:
+        yield from ingest(reader(file), on_error, type_field)
+
+
+def batches(objects, size):
+    """Group a stream of objects into lists of at most ``size`` objects.
+
+    Args:
+        objects (iterable): The objects to group
+        size (int): The batch size
+
+    Yields:
+        list: The next batch
+    """
+    iterator = iter(objects)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+# Example usage
+if __name__ == "__main__":
+    import io
+
+    dump = io.StringIO(
+        "type,make,model,year,color,fuel_type,doors,name,age,weight_kg,scale_type,is_venomous,length\n"
+        "car,Tesla,Model S,2023,red,electric,4,,,,,,\n"
+        "car,Mini,Cooper,2019,green,petrol,zero,,,,,,\n"
+        "snake,,,,,,,Nagini,8,45.0,smooth,yes,4.5\n"
+        "snake,,,,,,,Kaa,12,70.0,smooth,maybe,6.0\n"
+        "dragon,,,,,,,Smaug,171,90000,,,\n"
+    )
+    rejected = []
+    print("=== Loaded Objects ===")
+    for batch in batches(ingest(read_csv(dump), on_error=rejected.append), 2):
+        for obj in batch:
+            print(obj)
+
+    print("\n=== Rejected Rows ===")
+    for error in rejected:
+        print(f"line {error.line}: {error.reason}")
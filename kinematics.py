@@ -0,0 +1,321 @@
+"""Time-integrated kinematics and fuel use for route-cost estimates.
+
+Vehicle.accelerate and Vehicle.brake change speed in one jump. Here a
+vehicle drives a route the way a real one would. It accelerates as fast as
+its engine and grip allow against drag and rolling resistance, cruises,
+then brakes so that it stops exactly at the end of the route. Position,
+speed and the energy drawn from the fuel are integrated over time.
+
+Each vehicle's physical Profile (mass, power, drag, fuel, ...) is derived
+from the attributes the classes already have: a car's fuel_type and doors,
+a motorcycle's engine_size and sidecar, a boat's length, a plane's
+num_engines. The figures are rough but of the right order of magnitude.
+
+route_costs() estimates whole fleets. It returns one column (an array) per
+result. Vehicles with the same profile driving the same route give the same
+result, which is computed once. With adaptive=True the time step grows
+where speed changes slowly: a cruise is a single step, and so is the final
+braking at constant deceleration. Results then need a few dozen steps per
+route instead of one step per second of driving.
+"""
+from array import array
+from collections import namedtuple
+
+from Vehicle_polymorphism_challenge import Vehicle, Car, Motorcycle, Boat, Plane
+
+GRAVITY = 9.81  # m/s²
+AIR_DRAG = 0.5 * 1.2  # Half the density of air at sea level, kg/m³
+MIN_ACCELERATION = 0.01  # m/s²; below this a vehicle is at its top speed
+MIN_STEP = 1e-3  # s
+
+# Fuel type -> (unit, energy per unit in MJ, share of that energy that moves the vehicle)
+FUELS = {
+    "electric": ("kWh", 3.6, 0.85),
+    "gasoline": ("L", 34.2, 0.25),
+    "petrol": ("L", 34.2, 0.25),
+    "diesel": ("L", 38.6, 0.30),
+    "hybrid": ("L", 34.2, 0.35),
+    "jet": ("L", 34.7, 0.35),
+}
+
+# Car engine power by fuel type, W
+CAR_POWER = {"electric": 150e3, "gasoline": 110e3, "petrol": 110e3, "diesel": 100e3, "hybrid": 90e3}
+
+# The attributes profile() reads
+_PROFILE_ATTRIBUTES = ("fuel_type", "doors", "engine_size", "has_sidecar", "length", "num_engines")
+
+Profile = namedtuple("Profile", [
+    "mass",              # kg
+    "power",             # Peak power at the wheels (or propeller, or thrust), W
+    "max_acceleration",  # Grip or comfort limit, m/s²
+    "max_deceleration",  # Braking, m/s²
+    "drag",              # Aerodynamic or hydrodynamic drag force per (m/s)², N
+    "rolling",           # Rolling resistance coefficient
+    "cruise_speed",      # Default cruising speed, km/h
+    "fuel",              # Key into FUELS
+])
+
+RouteCost = namedtuple("RouteCost", ["time_s", "energy_mj", "fuel", "fuel_unit", "steps"])
+Trajectory = namedtuple("Trajectory", ["time", "position", "speed", "energy"])  # s, m, km/h, MJ
+FleetCosts = namedtuple("FleetCosts", ["time_s", "energy_mj", "fuel", "fuel_units", "steps", "trajectories"])
+
+
+def profile(vehicle):
+    """Derive the physical profile of a vehicle from its attributes.
+
+    Args:
+        vehicle (Vehicle): Any vehicle
+
+    Returns:
+        Profile: The vehicle's parameters
+    """
+    if isinstance(vehicle, Car):
+        fuel = vehicle.fuel_type.lower() if isinstance(vehicle.fuel_type, str) else None
+        if fuel not in FUELS:
+            fuel = "gasoline"  # Unknown or missing fuel types get the default car
+        mass = 1100 + 100 * max(vehicle.doors - 2, 0) + (400 if fuel == "electric" else 0)
+        return Profile(mass, CAR_POWER.get(fuel, 110e3), 4.0, 8.0, AIR_DRAG * 0.65, 0.010, 100, fuel)
+    if isinstance(vehicle, Motorcycle):
+        sidecar = 1 if vehicle.has_sidecar else 0
+        return Profile(170 + 0.1 * vehicle.engine_size + 120 * sidecar, 100 * vehicle.engine_size,
+                       5.0 - 2.0 * sidecar, 7.0, AIR_DRAG * (0.5 + 0.2 * sidecar), 0.015, 90, "gasoline")
+    if isinstance(vehicle, Boat):
+        length = vehicle.length
+        # Displacement grows with the cube of the hull length, wetted area with its square
+        return Profile(4.0 * length ** 3, 4000 * length ** 2, 1.0, 0.3, 0.4 * length ** 2, 0.0, 40, "diesel")
+    if isinstance(vehicle, Plane):
+        engines = vehicle.num_engines
+        return Profile(90_000 * engines, 15e6 * engines, 3.0, 3.0, 0.8 * engines, 0.0, 850, "jet")
+    return Profile(1300, 110e3, 4.0, 8.0, AIR_DRAG * 0.65, 0.010, 100, "gasoline")
+
+
+def _accelerate(params, target, distance, dt, adaptive, tolerance, trajectory=None):
+    """Integrate the acceleration from standstill towards ``target`` m/s.
+
+    It ends at the target speed, at the vehicle's top speed, or where the
+    vehicle must start braking to stop within ``distance`` metres.
+
+    Returns:
+        tuple: (time, distance covered, speed, work done, steps)
+    """
+    mass, power, max_acceleration, max_deceleration, drag, rolling, _, fuel = params
+    max_force = mass * max_acceleration
+    resistance = rolling * mass * GRAVITY
+    efficiency = FUELS[fuel][2]
+
+    def accelerations(v):
+        force = min(max_force, power / max(v, 1.0))
+        return force, (force - drag * v * v - resistance) / mass
+
+    t = x = v = work = 0.0
+    steps = 0
+    step = dt
+    while True:
+        force, acceleration = accelerations(v)
+        if acceleration < MIN_ACCELERATION or v >= target:
+            return t, x, v, work, steps
+        taken = min(step, (target - v) / acceleration)
+        # Midpoint rule; its difference from a plain Euler step estimates the error
+        v_mid = v + acceleration * taken / 2
+        mid_force, mid_acceleration = accelerations(v_mid)
+        if adaptive:
+            error = abs(mid_acceleration - acceleration) * taken
+            allowed = tolerance * max(v, 1.0)
+            if error > allowed and taken > MIN_STEP:
+                step = max(taken / 2, MIN_STEP)
+                continue
+            step = taken * min(4.0, 0.9 * (allowed / error) ** 0.5) if error else taken * 4.0
+        new_v = min(target, v + mid_acceleration * taken)
+        travelled = (v + new_v) / 2 * taken
+        if x + travelled + new_v * new_v / (2 * max_deceleration) > distance:
+            # The braking point comes first (the route is too short to reach
+            # cruising speed): approach it in shorter steps
+            if taken > MIN_STEP:
+                step = taken / 2
+                continue
+            return t, x, v, work, steps
+        work += mid_force * v_mid * taken
+        x += travelled
+        v = new_v
+        t += taken
+        steps += 1
+        if trajectory is not None:
+            _sample(trajectory, t, x, v, work / efficiency)
+
+
+def _sample(trajectory, t, x, v, energy):
+    trajectory.time.append(t)
+    trajectory.position.append(x)
+    trajectory.speed.append(v * 3.6)
+    trajectory.energy.append(energy / 1e6)
+
+
+def _cost(params, t, work, steps):
+    unit, energy_density, efficiency = FUELS[params.fuel]
+    energy_mj = work / efficiency / 1e6
+    return RouteCost(t, energy_mj, energy_mj / energy_density, unit, steps)
+
+
+def drive(params, distance_km, cruise_kmh=None, dt=1.0, adaptive=False, tolerance=1e-3, record=False):
+    """Integrate one vehicle driving a route from standstill to standstill.
+
+    Args:
+        params (Profile): The vehicle's profile
+        distance_km (float): The route length
+        cruise_kmh (float, optional): The speed to cruise at; defaults to
+            the profile's cruise speed. A vehicle that cannot reach it
+            cruises at its top speed instead
+        dt (float): The time step in seconds; with ``adaptive``, the first
+            step
+        adaptive (bool): Resize the steps while accelerating so that the
+            estimated speed error per step stays below ``tolerance`` (a
+            share of the speed), and cover cruising and braking in one
+            step each
+        tolerance (float): Relative speed error allowed per adaptive step
+        record (bool): Also return the trajectory
+
+    Returns:
+        tuple: (RouteCost, Trajectory or None)
+    """
+    distance = distance_km * 1000.0
+    target = (params.cruise_speed if cruise_kmh is None else cruise_kmh) / 3.6
+    efficiency = FUELS[params.fuel][2]
+    trajectory = Trajectory(array("d", [0.0]), array("d", [0.0]), array("d", [0.0]), array("d", [0.0])) \
+        if record else None
+    t, x, v, work, steps = _accelerate(params, target, distance, dt, adaptive, tolerance, trajectory)
+    if v <= 0:
+        return _cost(params, t, work, steps), trajectory  # Too short to move at all
+
+    # Cruise up to the braking point; at a steady speed one step is exact
+    cruise = distance - x - v * v / (2 * params.max_deceleration)
+    force = params.drag * v * v + params.rolling * params.mass * GRAVITY
+    while cruise > 1e-6:
+        taken = cruise / v if adaptive else min(dt, cruise / v)
+        work += force * v * taken
+        x += v * taken
+        t += taken
+        cruise -= v * taken
+        steps += 1
+        if record:
+            _sample(trajectory, t, x, v, work / efficiency)
+
+    # Brake to a stop at the end of the route; no fuel is used
+    t += 2 * (distance - x) / v
+    steps += 1
+    if record:
+        _sample(trajectory, t, distance, 0.0, work / efficiency)
+    return _cost(params, t, work, steps), trajectory
+
+
+def _per_vehicle(value, count):
+    """Turn a scalar or a sequence into a per-vehicle sequence."""
+    if value is None or isinstance(value, (int, float)):
+        return [value] * count
+    if len(value) != count:
+        raise ValueError(f"Expected {count} values, got {len(value)}.")
+    return value
+
+
+def route_costs(vehicles, distances_km, cruise_kmh=None, dt=1.0, adaptive=False, tolerance=1e-3,
+                record=False):
+    """Estimate the time and fuel every vehicle of a fleet needs for its route.
+
+    The acceleration of each profile and cruise speed is integrated once.
+    Routes long enough to reach cruising speed then cost a constant amount
+    of work each: the cruise and the braking have closed forms. Shorter
+    routes are integrated with drive().
+
+    Args:
+        vehicles (list): The vehicles
+        distances_km: One route length for all vehicles, or one per vehicle
+        cruise_kmh: One cruise speed, one per vehicle, or None for each
+            vehicle's default
+        dt, adaptive, tolerance: As for drive()
+        record (bool): Also return each vehicle's Trajectory; every route
+            is then integrated with drive() (identical routes share one)
+
+    Returns:
+        FleetCosts: Columns time_s, energy_mj and fuel (arrays), fuel_units
+            and steps (lists, one entry per vehicle), and trajectories (a
+            list, or None)
+    """
+    count = len(vehicles)
+    distances = _per_vehicle(distances_km, count)
+    speeds = _per_vehicle(cruise_kmh, count)
+    profiles = {}  # Attribute values -> Profile; a few per fleet
+    ramps = {}  # (Profile, cruise speed) -> acceleration results
+    routes = {}  # (Profile, distance, cruise speed) -> drive() results
+    time_s, energy_mj, fuel = array("d"), array("d"), array("d")
+    units, steps, trajectories = [], [], [] if record else None
+    for vehicle, distance_km, speed in zip(vehicles, distances, speeds):
+        key = (type(vehicle), *(getattr(vehicle, name, None) for name in _PROFILE_ATTRIBUTES))
+        params = profiles.get(key)
+        if params is None:
+            params = profiles[key] = profile(vehicle)
+        ramp = ramps.get((params, speed))
+        if ramp is None:
+            target = (params.cruise_speed if speed is None else speed) / 3.6
+            t, x, v, work, ramp_steps = _accelerate(params, target, float("inf"), dt, adaptive, tolerance)
+            unit, energy_density, efficiency = FUELS[params.fuel]
+            if v <= 0:
+                # The vehicle cannot move (a cruise speed of 0, or no power):
+                # leave every route to drive(), which reports it as not driven
+                minimum, ramp_time, cruise_power = float("inf"), t, 0.0
+            else:
+                brake = v * v / (2 * params.max_deceleration)
+                minimum, ramp_time = x + brake, t + 2 * brake / v
+                cruise_power = (params.drag * v * v + params.rolling * params.mass * GRAVITY) * v
+            ramp = ramps[(params, speed)] = (minimum, ramp_time, work, v, cruise_power, ramp_steps + 1,
+                                             unit, efficiency * energy_density * 1e6, efficiency * 1e6)
+        minimum, ramp_time, ramp_work, v, cruise_power, ramp_steps, unit, per_unit, per_mj = ramp
+        distance = distance_km * 1000.0
+        if record or distance < minimum:
+            route = (params, distance_km, speed)
+            result = routes.get(route)
+            if result is None:
+                result = routes[route] = drive(params, distance_km, speed, dt, adaptive, tolerance, record)
+            cost, trajectory = result
+            time_s.append(cost.time_s)
+            energy_mj.append(cost.energy_mj)
+            fuel.append(cost.fuel)
+            steps.append(cost.steps)
+            if record:
+                trajectories.append(trajectory)
+        else:
+            cruise_time = (distance - minimum) / v
+            work = ramp_work + cruise_power * cruise_time
+            time_s.append(ramp_time + cruise_time)
+            energy_mj.append(work / per_mj)
+            fuel.append(work / per_unit)
+            steps.append(ramp_steps + (1 if adaptive or not cruise_time else -int(-cruise_time // dt)))
+        units.append(unit)
+    return FleetCosts(time_s, energy_mj, fuel, units, steps, trajectories)
+
+
+# Example usage
+if __name__ == "__main__":
+    fleet = [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Car("Toyota", "Corolla", 2020, "white", "gasoline", 4),
+        Motorcycle("Harley-Davidson", "Street Glide", 2022, "black", 1868, True),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+    ]
+    distances = [100, 100, 100, 50, 1000]
+
+    print("=== Route Costs (adaptive steps) ===")
+    costs = route_costs(fleet, distances, adaptive=True)
+    for i, vehicle in enumerate(fleet):
+        print(f"{vehicle.make} {vehicle.model}: {distances[i]} km in {costs.time_s[i] / 60:.1f} min, "
+              f"{costs.fuel[i]:.1f} {costs.fuel_units[i]} ({costs.steps[i]} steps)")
+
+    print("\n=== Fixed 1 s Steps for Comparison ===")
+    fixed = route_costs(fleet, distances)
+    for i, vehicle in enumerate(fleet):
+        print(f"{vehicle.make} {vehicle.model}: {fixed.time_s[i] / 60:.1f} min, "
+              f"{fixed.fuel[i]:.1f} {fixed.fuel_units[i]} ({fixed.steps[i]} steps)")
+
+    print("\n=== Tesla Trajectory, Every 10th Step ===")
+    _, trajectory = drive(profile(fleet[0]), 1.0, record=True)
+    for t, x, v in list(zip(trajectory.time, trajectory.position, trajectory.speed))[::10]:
+        print(f"t={t:5.1f} s  x={x:6.1f} m  v={v:5.1f} km/h")
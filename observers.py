@@ -0,0 +1,87 @@
+"""Attribute-change notifications for individual objects.
+
+watch() lets an index or cache follow changes to a single animal or
+vehicle without slowing down every other instance of its class: the
+watched object is moved to a generated subclass (same name, same methods)
+whose __setattr__ reports each assignment to the registered callbacks.
+Works for both regular and __slots__ classes.
+
+The registry holds watched objects through weak references, so watching an
+object does not keep it alive, and its callbacks are dropped when it is
+garbage collected. Objects that do not support weak references (__slots__
+classes without __weakref__) are held strongly until they are unwatched.
+"""
+import weakref
+
+_callbacks = {}  # id(obj) -> (reference to obj, list of callbacks)
+_watched_classes = {}
+
+
+def _reference(obj):
+    """Return a callable giving back ``obj``; weak where the object allows it."""
+    key = id(obj)
+
+    def forget(reference):
+        if _callbacks.get(key, (None,))[0] is reference:
+            del _callbacks[key]
+
+    try:
+        return weakref.ref(obj, forget)
+    except TypeError:
+        return lambda: obj
+
+
+def _watched_class(cls):
+    """Return (and cache) the notifying subclass of a class."""
+    if cls in _watched_classes.values():
+        return cls
+    if cls not in _watched_classes:
+        base_setattr = cls.__setattr__
+
+        def __setattr__(self, name, value):
+            old = getattr(self, name, None)
+            base_setattr(self, name, value)
+            entry = _callbacks.get(id(self))
+            if entry is not None:
+                for callback in entry[1]:
+                    callback(self, name, old, value)
+
+        namespace = {
+            "__slots__": (),
+            "__setattr__": __setattr__,
+            "__module__": cls.__module__,
+            "__doc__": cls.__doc__,
+        }
+        _watched_classes[cls] = type(cls.__name__, (cls,), namespace)
+    return _watched_classes[cls]
+
+
+def watch(obj, callback):
+    """Call ``callback(obj, name, old, new)`` after each attribute assignment.
+
+    Args:
+        obj (object): The animal or vehicle to watch
+        callback (callable): Called with the object, attribute name, old value
+            (None if it was unset) and new value
+    """
+    entry = _callbacks.get(id(obj))
+    if entry is None:
+        entry = _callbacks[id(obj)] = (_reference(obj), [])
+        obj.__class__ = _watched_class(type(obj))
+    entry[1].append(callback)
+
+
+def unwatch(obj, callback):
+    """Stop calling a callback registered with watch().
+
+    Once an object has no callbacks left it returns to its original class.
+
+    Args:
+        obj (object): The watched object
+        callback (callable): The callback to remove
+    """
+    callbacks = _callbacks[id(obj)][1]
+    callbacks.remove(callback)
+    if not callbacks:
+        del _callbacks[id(obj)]
+        obj.__class__ = type(obj).__bases__[0]
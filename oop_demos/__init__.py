@@ -0,0 +1,39 @@
+"""The Animal and Vehicle class hierarchies as an importable package.
+
+The classes are loaded lazily: ``import oop_demos`` only sets up this
+module, and the animal or vehicle module is imported the first time one of
+its classes is used, e.g. ``oop_demos.Lion`` or ``from oop_demos import
+Plane``. This keeps the start-up time of the command line (see cli.py) low.
+"""
+import importlib
+
+# Class name -> submodule defining it
+_EXPORTS = {
+    "Animal": "animals",
+    "Mammal": "animals",
+    "Bird": "animals",
+    "Reptile": "animals",
+    "Lion": "animals",
+    "Eagle": "animals",
+    "Snake": "animals",
+    "Vehicle": "vehicles",
+    "Car": "vehicles",
+    "Motorcycle": "vehicles",
+    "Boat": "vehicles",
+    "Plane": "vehicles",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # Later lookups skip this function
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
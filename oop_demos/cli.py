@@ -0,0 +1,274 @@
+"""Command line entry point: run scenario files against either hierarchy.
+
+A scenario is a text file with one statement per line. A statement either
+creates an object or calls one of its methods:
+
+    # Create objects: <name> = <Class> <constructor arguments>
+    tesla = Car Tesla "Model S" 2023 red electric 4
+    simba = Lion Simba 5 190.5 golden large
+
+    # Call methods: <name>.<method> <arguments>
+    tesla.start
+    tesla.accelerate 60
+    simba.hunt zebra
+
+Arguments are separated by spaces and may be quoted. Each one is converted
+according to the type its parameter has in the method's docstring: int
+and float parameters take numbers (whole numbers become ints, others
+floats), bool ones true / false, and optional ones also none. Everything
+else stays a string, so a plane's model 747 is the text "747". Blank lines
+and lines starting with # are ignored. Every message the methods produce
+is printed as usual.
+
+Only the hierarchy a scenario uses is imported, so starting the command
+takes little more than starting Python itself.
+
+Usage:
+    oop-demos [--quiet] [--summary] SCENARIO [SCENARIO ...]
+    python -m oop_demos ...
+"""
+import sys
+
+import oop_demos
+
+_CONSTANTS = {"true": True, "false": False, "none": None}
+_USAGE = "usage: oop-demos [--quiet] [--summary] SCENARIO [SCENARIO ...]"
+
+
+class ScenarioError(Exception):
+    """A scenario line that cannot be run."""
+
+    def __init__(self, path, line, reason):
+        super().__init__(f"{path}:{line}: {reason}")
+        self.path = path
+        self.line = line
+        self.reason = reason
+
+
+def _split(line):
+    """Split a line into tokens like a shell would, dropping # comments.
+
+    (shlex does the same but importing it takes longer than the rest of
+    the start-up.)
+    """
+    tokens, current, quote, quoted = [], [], None, False
+    for char in line:
+        if quote:
+            if char == quote:
+                quote = None
+            else:
+                current.append(char)
+        elif char in "\"'":
+            quote = quoted = char
+        elif char == "#" and not current and not quoted:
+            break
+        elif char.isspace():
+            if current or quoted:
+                tokens.append("".join(current))
+                current, quoted = [], False
+        else:
+            current.append(char)
+    if quote:
+        raise ValueError("No closing quotation")
+    if current or quoted:
+        tokens.append("".join(current))
+    return tokens
+
+
+def _number(token):
+    """Convert a token to an int, or a float if it is not a whole number."""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _guess(token):
+    """Convert a token for a parameter of unknown type: number, constant or string."""
+    lowered = token.lower()
+    if lowered in _CONSTANTS:
+        return _CONSTANTS[lowered]
+    try:
+        return _number(token)
+    except ValueError:
+        return token
+
+
+_types = {}  # Code object -> parameter name -> type from the docstring, e.g. "str, optional"
+
+
+def _parameter_types(function):
+    """Return the parameters of a function or method with their documented types.
+
+    The types come from the "name (type): ..." lines of its docstring's
+    Args section; parameters without one have the type None. Functions
+    without Python code (builtins) have no known parameters.
+    """
+    function = getattr(function, "__func__", function)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return []
+    types = _types.get(code)
+    if types is None:
+        documented = {}
+        for line in (function.__doc__ or "").splitlines():
+            name, paren, rest = line.strip().partition(" (")
+            if paren and name.isidentifier() and "):" in rest:
+                documented[name] = rest.partition(")")[0]
+        names = code.co_varnames[1:code.co_argcount]  # Without self
+        types = _types[code] = [(name, documented.get(name)) for name in names]
+    return types
+
+
+def _arguments(function, tokens):
+    """Convert argument tokens for the parameters of ``function``.
+
+    Raises:
+        ValueError: If a token does not fit its parameter's type
+    """
+    arguments = []
+    for (name, kind), token in zip(_parameter_types(function), tokens):
+        if kind is None:
+            arguments.append(_guess(token))
+            continue
+        kind, _, optional = kind.partition(",")
+        lowered = token.lower()
+        if optional.strip() == "optional" and lowered == "none":
+            arguments.append(None)
+        elif kind in ("int", "float"):
+            try:
+                arguments.append(_number(token))
+            except ValueError:
+                raise ValueError(f"{name} must be a number, got {token!r}") from None
+        elif kind == "bool":
+            if lowered not in ("true", "false"):
+                raise ValueError(f"{name} must be true or false, got {token!r}")
+            arguments.append(_CONSTANTS[lowered])
+        else:
+            arguments.append(token)
+    # Tokens beyond the known parameters are guessed at
+    arguments.extend(map(_guess, tokens[len(arguments):]))
+    return arguments
+
+
+def parse(lines, path="<scenario>"):
+    """Parse scenario lines into statements.
+
+    Args:
+        lines (iterable): The scenario's lines
+        path (str): Name used in error messages
+
+    Returns:
+        list: (line number, name, class name or None, method or None, args)
+            tuples; creations have a class name, calls a method. The args
+            are still strings; run() converts them
+
+    Raises:
+        ScenarioError: If a line is malformed
+    """
+    statements = []
+    for number, line in enumerate(lines, 1):
+        try:
+            tokens = _split(line)
+        except ValueError as error:
+            raise ScenarioError(path, number, str(error)) from None
+        if not tokens:
+            continue
+        if len(tokens) >= 3 and tokens[1] == "=":
+            name, _, class_name, *args = tokens
+            if not name.isidentifier():
+                raise ScenarioError(path, number, f"invalid name {name!r}")
+            statements.append((number, name, class_name, None, args))
+        else:
+            target, *args = tokens
+            name, dot, method = target.partition(".")
+            if not dot or not name or not method.isidentifier() or method.startswith("_"):
+                raise ScenarioError(path, number, f"expected '<name> = <Class> ...' or '<name>.<method> ...', "
+                                                  f"got {line.strip()!r}")
+            statements.append((number, name, None, method, args))
+    return statements
+
+
+def run(statements, path="<scenario>", objects=None):
+    """Run parsed statements.
+
+    Args:
+        statements (list): As returned by parse()
+        path (str): Name used in error messages
+        objects (dict, optional): Name -> object; objects created by the
+            scenario are added to it
+
+    Returns:
+        int: The number of method calls made
+
+    Raises:
+        ScenarioError: If a class, object or method does not exist, an
+            argument does not fit its parameter, or a call fails with a
+            TypeError, ValueError or AttributeError
+    """
+    objects = {} if objects is None else objects
+    calls = 0
+    for number, name, class_name, method, args in statements:
+        if class_name is not None:
+            if class_name not in oop_demos.__all__:
+                raise ScenarioError(path, number, f"unknown class {class_name!r}")
+            cls = getattr(oop_demos, class_name)
+            try:
+                objects[name] = cls(*_arguments(cls.__init__, args))
+            except (TypeError, ValueError, AttributeError) as error:
+                raise ScenarioError(path, number, str(error)) from None
+            continue
+        if name not in objects:
+            raise ScenarioError(path, number, f"unknown object {name!r}")
+        function = getattr(objects[name], method, None)
+        if not callable(function):
+            raise ScenarioError(path, number, f"{type(objects[name]).__name__} has no method {method!r}")
+        try:
+            function(*_arguments(function, args))
+        except (TypeError, ValueError, AttributeError) as error:
+            raise ScenarioError(path, number, str(error)) from None
+        calls += 1
+    return calls
+
+
+def main(argv=None):
+    """Run the scenario files named on the command line.
+
+    Returns:
+        int: The exit status (0 on success, 1 if a scenario failed, 2 on
+            bad usage)
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+    quiet = "--quiet" in args
+    summary = "--summary" in args
+    paths = [arg for arg in args if arg not in ("--quiet", "--summary")]
+    if not paths or any(arg.startswith("-") and arg != "-" for arg in paths):
+        print(_USAGE, file=sys.stderr)
+        return 2
+
+    from .event_sink import NullSink, set_rejection_hook, set_sink
+    if quiet:
+        set_sink(NullSink())
+    rejected = []
+    set_rejection_hook(lambda actor, action: rejected.append(action))
+
+    objects = {}  # Shared by all scenario files, in order
+    calls = 0
+    try:
+        for path in paths:
+            if path == "-":
+                lines = sys.stdin.read().splitlines()
+            else:
+                with open(path, encoding="utf-8") as file:
+                    lines = file.read().splitlines()
+            calls += run(parse(lines, path), path, objects)
+    except (OSError, ScenarioError) as error:
+        print(f"oop-demos: {error}", file=sys.stderr)
+        return 1
+    if summary:
+        print(f"{calls} calls, {len(rejected)} rejected", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
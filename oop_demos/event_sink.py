@@ -0,0 +1,212 @@
+"""Event sinks for the messages produced by Animal and Vehicle methods.
+
+Every behavior method reports what happened by emitting an Event (actor,
+action, arguments and the human-readable message) to the current sink.
+The default sink prints each message right away, exactly as the methods
+always did. Other sinks buffer events and write them in bulk, hand them to
+a callback, or drop them for benchmarks.
+
+Branches that refuse a state transition ("You need to start ... first.")
+report through emit_rejected, which hands the event to the sink's
+write_rejected() if it has one (see transition_log.py) and also notifies the
+rejection hook if one is installed (see profiling.py).
+"""
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+
+Event = namedtuple("Event", ["actor", "action", "args", "message"])
+
+
+class ConsoleSink:
+    """Prints every message immediately (the default)."""
+
+    def write(self, event):
+        print(event.message)
+
+    def write_many(self, events):
+        if events:
+            print("\n".join(event.message for event in events))
+
+    def flush(self):
+        pass
+
+
+class NullSink:
+    """Discards every event; useful for benchmarks."""
+
+    def write(self, event):
+        pass
+
+    def write_many(self, events):
+        pass
+
+    def flush(self):
+        pass
+
+
+class CallbackSink:
+    """Passes every event to a callback as soon as it is emitted."""
+
+    def __init__(self, callback):
+        """Initialize the sink.
+
+        Args:
+            callback (callable): Called with each Event
+        """
+        self.callback = callback
+
+    def write(self, event):
+        self.callback(event)
+
+    def write_many(self, events):
+        for event in events:
+            self.callback(event)
+
+    def flush(self):
+        pass
+
+
+class BufferedSink:
+    """Collects events in a bounded buffer and writes them out in bulk."""
+
+    def __init__(self, target=None, capacity=4096):
+        """Initialize the sink.
+
+        Args:
+            target: Where flushed events go: a file-like object (messages are
+                written one per line) or a callable that receives a list of
+                Events. Defaults to standard output.
+            capacity (int): Number of events buffered before a flush
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.target = target
+        self.capacity = capacity
+        self._buffer = [None] * capacity
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def write(self, event):
+        self._buffer[self._count] = event
+        self._count += 1
+        if self._count == self.capacity:
+            self.flush()
+
+    def write_many(self, events):
+        start = 0
+        while start < len(events):
+            part = events[start:start + self.capacity - self._count]
+            self._buffer[self._count:self._count + len(part)] = part
+            self._count += len(part)
+            start += len(part)
+            if self._count == self.capacity:
+                self.flush()
+
+    def flush(self):
+        """Write all buffered events to the target."""
+        if not self._count:
+            return
+        events = self._buffer[:self._count]
+        self._buffer[:self._count] = [None] * self._count
+        self._count = 0
+        target = sys.stdout if self.target is None else self.target
+        if callable(target):
+            target(events)
+        else:
+            target.write("".join(event.message + "\n" for event in events))
+
+    def close(self):
+        """Flush remaining events; the target itself is left open."""
+        self.flush()
+
+
+_sink = ConsoleSink()
+_rejection_hook = None
+
+
+def get_sink():
+    """Return the sink that currently receives events."""
+    return _sink
+
+
+def set_sink(sink):
+    """Replace the current sink.
+
+    Args:
+        sink: The new sink (any object with write(event) and flush())
+
+    Returns:
+        The previous sink
+    """
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+@contextmanager
+def using(sink):
+    """Temporarily send events to another sink, flushing it on exit.
+
+    Args:
+        sink: The sink to use inside the ``with`` block
+    """
+    previous = set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
+        sink.flush()
+
+
+def emit(actor, action, args, message):
+    """Report an action to the current sink.
+
+    Args:
+        actor (object): The animal or vehicle performing the action
+        action (str): The name of the method that was called
+        args (tuple): The arguments the method was called with
+        message (str): The human-readable description of what happened
+    """
+    _sink.write(Event(actor, action, args, message))
+
+
+def emit_rejected(actor, action, args, message):
+    """Report a refused state transition (same arguments as emit)."""
+    write_rejected = getattr(_sink, "write_rejected", None)
+    if write_rejected is not None:
+        write_rejected(Event(actor, action, args, message))
+    else:
+        _sink.write(Event(actor, action, args, message))
+    if _rejection_hook is not None:
+        _rejection_hook(actor, action)
+
+
+def set_rejection_hook(hook):
+    """Install a function called with (actor, action) for every rejection.
+
+    Args:
+        hook (callable): The new hook, or None to remove it
+
+    Returns:
+        The previous hook
+    """
+    global _rejection_hook
+    previous, _rejection_hook = _rejection_hook, hook
+    return previous
+
+
+def emit_many(events):
+    """Report several already-built events to the current sink at once.
+
+    Args:
+        events (list): The Events to report, in order
+    """
+    write_many = getattr(_sink, "write_many", None)
+    if write_many is not None:
+        write_many(events)
+    else:
+        for event in events:
+            _sink.write(event)
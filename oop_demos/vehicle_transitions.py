@@ -0,0 +1,311 @@
+"""State machines for the vehicle commands, compiled into a lookup table.
+
+The rules deciding whether start, stop, move, accelerate, brake, anchor,
+raise_anchor, take_off, land and change_altitude are allowed are written
+down here once per class, as ordered rule lists where the first matching
+rule wins (the same order as the original if chains). Boat and Plane start
+from the Vehicle rules and override the commands they handle differently.
+
+compile_table() turns the rule lists into flat arrays indexed by machine,
+discrete state and command. The vehicle methods call check() to find out
+what a command does; validate() runs whole command scripts against the same
+table without touching any vehicle.
+
+A discrete state packs the vehicle's flags into bits (RUNNING, ANCHORED,
+LANDED). Conditions on speed and altitude cannot be tabulated, so the table
+marks those entries with a guard that check() and validate() evaluate.
+"""
+from array import array
+from collections import namedtuple
+
+# Outcome codes
+OK = 0
+BELOW_ZERO = 1
+ABOVE_MAX = 2
+NOT_AIRBORNE = 3
+NOT_RUNNING = 4
+ALREADY_AIRBORNE = 5
+TOO_SLOW = 6
+ALREADY_RUNNING = 7
+ANCHORED = 8
+ALREADY_ANCHORED = 9
+NOT_ANCHORED = 10
+UNSUPPORTED = 11
+WRONG_ARGUMENTS = 12
+SKIPPED = -1
+
+OUTCOME_NAMES = {
+    OK: "ok",
+    BELOW_ZERO: "below_zero",
+    ABOVE_MAX: "above_max",
+    NOT_AIRBORNE: "not_airborne",
+    NOT_RUNNING: "not_running",
+    ALREADY_AIRBORNE: "already_airborne",
+    TOO_SLOW: "too_slow",
+    ALREADY_RUNNING: "already_running",
+    ANCHORED: "anchored",
+    ALREADY_ANCHORED: "already_anchored",
+    NOT_ANCHORED: "not_anchored",
+    UNSUPPORTED: "unsupported",
+    WRONG_ARGUMENTS: "wrong_arguments",
+    SKIPPED: "skipped",
+}
+
+TAKE_OFF_SPEED = 120  # km/h needed to leave the ground
+TAKE_OFF_ALTITUDE = 1000  # feet reached right after take-off
+
+# Discrete state bits
+RUNNING = 1
+ANCHORED_BIT = 2
+LANDED = 4
+STATES = 8
+
+COMMANDS = ("start", "stop", "move", "accelerate", "brake", "anchor", "raise_anchor", "take_off", "land",
+            "change_altitude")
+START, STOP, MOVE, ACCELERATE, BRAKE, ANCHOR, RAISE_ANCHOR, TAKE_OFF, LAND, CHANGE_ALTITUDE = range(len(COMMANDS))
+COMMAND_CODES = {name: code for code, name in enumerate(COMMANDS)}
+ARGUMENT_COUNTS = (0, 0, 0, 1, 1, 0, 0, 0, 0, 1)  # Arguments each command takes, in COMMANDS order
+
+# Guards evaluated on speed and altitude
+NO_GUARD = 0
+SPEED_GUARD = 1  # OK at or above TAKE_OFF_SPEED, TOO_SLOW below
+ALTITUDE_GUARD = 2  # OK inside (0, max_altitude], BELOW_ZERO / ABOVE_MAX outside
+
+# A rule applies when state & mask == value; it sets and clears state bits
+Rule = namedtuple("Rule", ["mask", "value", "outcome", "sets", "clears", "guard"])
+
+
+def rule(mask, value, outcome, sets=0, clears=0, guard=NO_GUARD):
+    return Rule(mask, value, outcome, sets, clears, guard)
+
+
+ALWAYS = (0, 0)
+
+VEHICLE_RULES = {
+    "start": [rule(RUNNING, 0, OK, sets=RUNNING), rule(*ALWAYS, ALREADY_RUNNING)],
+    "stop": [rule(RUNNING, RUNNING, OK, clears=RUNNING), rule(*ALWAYS, NOT_RUNNING)],
+    "move": [rule(RUNNING, RUNNING, OK), rule(*ALWAYS, NOT_RUNNING)],
+    "accelerate": [rule(RUNNING, RUNNING, OK), rule(*ALWAYS, NOT_RUNNING)],
+    "brake": [rule(RUNNING, RUNNING, OK), rule(*ALWAYS, NOT_RUNNING)],
+}
+
+BOAT_RULES = {
+    **VEHICLE_RULES,
+    "move": [
+        rule(RUNNING | ANCHORED_BIT, RUNNING, OK),
+        rule(ANCHORED_BIT, ANCHORED_BIT, ANCHORED),
+        rule(*ALWAYS, NOT_RUNNING),
+    ],
+    "anchor": [rule(ANCHORED_BIT, 0, OK, sets=ANCHORED_BIT), rule(*ALWAYS, ALREADY_ANCHORED)],
+    "raise_anchor": [rule(ANCHORED_BIT, ANCHORED_BIT, OK, clears=ANCHORED_BIT), rule(*ALWAYS, NOT_ANCHORED)],
+}
+
+_AIRBORNE = (RUNNING | LANDED, RUNNING)
+
+PLANE_RULES = {
+    **VEHICLE_RULES,
+    "move": [rule(*_AIRBORNE, OK), rule(LANDED, LANDED, NOT_AIRBORNE), rule(*ALWAYS, NOT_RUNNING)],
+    "take_off": [
+        rule(RUNNING | LANDED, RUNNING | LANDED, OK, clears=LANDED, guard=SPEED_GUARD),
+        rule(RUNNING, 0, NOT_RUNNING),
+        rule(*ALWAYS, ALREADY_AIRBORNE),
+    ],
+    "land": [rule(*_AIRBORNE, OK, sets=LANDED), rule(LANDED, LANDED, NOT_AIRBORNE), rule(*ALWAYS, NOT_RUNNING)],
+    "change_altitude": [
+        rule(*_AIRBORNE, OK, guard=ALTITUDE_GUARD),
+        rule(LANDED, LANDED, NOT_AIRBORNE),
+        rule(*ALWAYS, NOT_RUNNING),
+    ],
+}
+
+# Machines, in table order; each vehicle class names its machine in its
+# state_machine attribute
+VEHICLE, BOAT, PLANE = range(3)
+MACHINES = (VEHICLE_RULES, BOAT_RULES, PLANE_RULES)
+
+Table = namedtuple("Table", ["outcome", "next_state", "guard"])
+
+
+def compile_table(machines=MACHINES):
+    """Compile rule lists into flat lookup arrays.
+
+    Entry ``(machine * STATES + state) * len(COMMANDS) + command`` of each
+    array holds the outcome (UNSUPPORTED if the machine has no rules for
+    the command), the state after the command and the guard to evaluate.
+
+    Args:
+        machines (sequence): One {command name: [Rule, ...]} dict per machine
+
+    Returns:
+        Table: The outcome, next_state and guard arrays
+    """
+    outcome, next_state, guard = array("b"), array("b"), array("b")
+    for rules in machines:
+        for state in range(STATES):
+            for command in COMMANDS:
+                for candidate in rules.get(command, ()):
+                    if state & candidate.mask == candidate.value:
+                        outcome.append(candidate.outcome)
+                        next_state.append((state | candidate.sets) & ~candidate.clears)
+                        guard.append(candidate.guard)
+                        break
+                else:
+                    outcome.append(UNSUPPORTED)
+                    next_state.append(state)
+                    guard.append(NO_GUARD)
+    return Table(outcome, next_state, guard)
+
+
+TABLE = compile_table()
+_OUTCOMES = TABLE.outcome
+_GUARDS = TABLE.guard
+_WIDTH = len(COMMANDS)
+
+
+def encode(vehicle):
+    """Return a vehicle's machine and discrete state."""
+    machine = vehicle.state_machine
+    state = RUNNING if vehicle.is_running else 0
+    if machine == BOAT and vehicle.is_anchored:
+        state |= ANCHORED_BIT
+    elif machine == PLANE and vehicle.is_landed:
+        state |= LANDED
+    return machine, state
+
+
+def _guarded(guard, speed, altitude, max_altitude, argument):
+    if guard == SPEED_GUARD:
+        return OK if speed >= TAKE_OFF_SPEED else TOO_SLOW
+    new_altitude = altitude + argument
+    if new_altitude <= 0:
+        return BELOW_ZERO
+    if new_altitude > max_altitude:
+        return ABOVE_MAX
+    return OK
+
+
+def check(vehicle, command, argument=0):
+    """Look up what a command would do to a vehicle, without doing it.
+
+    Args:
+        vehicle (Vehicle): The vehicle
+        command (int): The command code, e.g. TAKE_OFF
+        argument: The command's argument (only change_altitude's matters)
+
+    Returns:
+        int: The outcome code
+    """
+    machine, state = encode(vehicle)
+    index = (machine * STATES + state) * _WIDTH + command
+    guard = _GUARDS[index]
+    if guard:
+        return _guarded(guard, vehicle.speed, getattr(vehicle, "altitude", 0),
+                        getattr(vehicle, "max_altitude", 0), argument)
+    return _OUTCOMES[index]
+
+
+Violation = namedtuple("Violation", ["step", "tick", "command", "outcome"])
+
+
+def validate(vehicles, scripts):
+    """Find the first illegal command of each vehicle's script.
+
+    Runs every script against the transition table, starting from each
+    vehicle's current state and tracking speed and altitude along the way.
+    Nothing is executed on the vehicles themselves.
+
+    Args:
+        vehicles (sequence): The vehicles
+        scripts (sequence): One script per vehicle; a script is a list of
+            (tick, command name, args) tuples as used by FleetSimulation
+
+    Returns:
+        dict: Vehicle index -> Violation (step index within the script,
+            tick, command name, outcome code) for every vehicle whose script
+            contains an illegal command; an unknown command is UNSUPPORTED
+            and one given the wrong number of arguments WRONG_ARGUMENTS
+    """
+    if len(scripts) != len(vehicles):
+        raise ValueError(f"Got {len(scripts)} scripts for {len(vehicles)} vehicles.")
+    outcomes, next_states, guards = TABLE
+    codes, counts = COMMAND_CODES, ARGUMENT_COUNTS
+    violations = {}
+    for index, (vehicle, script) in enumerate(zip(vehicles, scripts)):
+        machine, state = encode(vehicle)
+        base = machine * STATES
+        speed = vehicle.speed
+        altitude = getattr(vehicle, "altitude", 0)
+        max_altitude = getattr(vehicle, "max_altitude", 0)
+        for step, (tick, name, args) in enumerate(script):
+            command = codes.get(name)
+            if command is None:
+                violations[index] = Violation(step, tick, name, UNSUPPORTED)
+                break
+            if len(args) != counts[command]:
+                violations[index] = Violation(step, tick, name, WRONG_ARGUMENTS)
+                break
+            entry = (base + state) * _WIDTH + command
+            outcome = outcomes[entry]
+            guard = guards[entry]
+            if guard:
+                outcome = _guarded(guard, speed, altitude, max_altitude, args[0] if args else 0)
+            if outcome:
+                violations[index] = Violation(step, tick, name, outcome)
+                break
+            state = next_states[entry]
+            if command == ACCELERATE:
+                speed += args[0]
+            elif command == BRAKE:
+                speed = 0 if args[0] > speed else speed - args[0]
+            elif command == CHANGE_ALTITUDE:
+                altitude += args[0]
+            elif command == TAKE_OFF:
+                altitude = TAKE_OFF_ALTITUDE
+            elif command == STOP or command == ANCHOR:
+                speed = 0
+            elif command == LAND:
+                speed = altitude = 0
+    return violations
+
+
+# Example usage
+if __name__ == "__main__":
+    import random
+    import time
+
+    from oop_demos.vehicles import Car, Boat, Plane
+
+    print("=== Compiled Table ===")
+    print(f"{len(TABLE.outcome)} entries ({len(MACHINES)} machines x {STATES} states x {len(COMMANDS)} commands)")
+
+    rng = random.Random(5)
+    vehicles, scripts = [], []
+    for i in range(100_000):
+        if i % 3 == 0:
+            vehicles.append(Car("Tesla", "Model S", 2023, "red", "electric", 4))
+            script = [(0, "start", ()), (1, "accelerate", (60,)), (2, "move", ()), (3, "brake", (20,))]
+        elif i % 3 == 1:
+            vehicles.append(Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5))
+            script = [(0, "start", ()), (1, "anchor", ()), (2, "raise_anchor", ()), (3, "move", ())]
+        else:
+            vehicles.append(Plane("Boeing", "747", 2020, "blue and white", 45000, 4))
+            script = [(0, "start", ()), (1, "accelerate", (150,)), (2, "take_off", ())]
+            script += [(tick, "change_altitude", (rng.randrange(-2000, 4000),)) for tick in range(3, 30)]
+            script.append((30, "land", ()))
+        if rng.random() < 0.01:
+            script.insert(0, (0, "move", ()))  # A few scripts move before starting
+        scripts.append(script)
+
+    commands = sum(map(len, scripts))
+    start = time.perf_counter()
+    violations = validate(vehicles, scripts)
+    elapsed = time.perf_counter() - start
+    print(f"Validated {commands:,} commands in {elapsed:.2f}s ({commands / elapsed / 1e6:.1f}M/s)")
+
+    print("\n=== First Illegal Steps ===")
+    counts = {}
+    for violation in violations.values():
+        key = (violation.command, OUTCOME_NAMES[violation.outcome])
+        counts[key] = counts.get(key, 0) + 1
+    for (command, outcome), count in sorted(counts.items()):
+        print(f"{command:>16} {outcome:<14} {count:>6} vehicles")
@@ -0,0 +1,292 @@
+from .event_sink import emit, emit_rejected
+from .vehicle_transitions import (
+    check, OK, NOT_AIRBORNE, NOT_RUNNING, ALREADY_AIRBORNE, BELOW_ZERO, ABOVE_MAX, ANCHORED,
+    VEHICLE, BOAT, PLANE, START, STOP, MOVE, ACCELERATE, BRAKE, ANCHOR, RAISE_ANCHOR, TAKE_OFF, LAND, CHANGE_ALTITUDE,
+)
+
+__all__ = ["Vehicle", "Car", "Motorcycle", "Boat", "Plane"]
+
+
+class Vehicle:
+    """Base class for all vehicles."""
+    
+    state_machine = VEHICLE  # Command rules, see vehicle_transitions.py
+    
+    def __init__(self, make, model, year, color):
+        """Initialize a vehicle with basic attributes.
+        
+        Args:
+            make (str): The manufacturer of the vehicle
+            model (str): The model name of the vehicle
+            year (int): The year the vehicle was manufactured
+            color (str): The color of the vehicle
+        """
+        self.make = make
+        self.model = model
+        self.year = year
+        self.color = color
+        self.speed = 0
+        self.is_running = False
+        
+    def start(self):
+        """Start the vehicle's engine."""
+        if check(self, START) == OK:
+            self.is_running = True
+            emit(self, "start", (), f"The {self.color} {self.year} {self.make} {self.model} has started.")
+        else:
+            emit_rejected(self, "start", (), f"The {self.make} {self.model} is already running.")
+    
+    def stop(self):
+        """Stop the vehicle's engine."""
+        if check(self, STOP) == OK:
+            self.is_running = False
+            self.speed = 0
+            emit(self, "stop", (), f"The {self.make} {self.model} has stopped.")
+        else:
+            emit_rejected(self, "stop", (), f"The {self.make} {self.model} is already off.")
+    
+    def move(self):
+        """Base method for movement - to be overridden by subclasses."""
+        if check(self, MOVE) == OK:
+            emit(self, "move", (), f"The {self.make} {self.model} is moving.")
+        else:
+            emit_rejected(self, "move", (), f"You need to start the {self.make} {self.model} first.")
+    
+    def accelerate(self, speed_increase):
+        """Increase the speed of the vehicle.
+        
+        Args:
+            speed_increase (int): The amount to increase speed by
+        """
+        if check(self, ACCELERATE) == OK:
+            self.speed += speed_increase
+            emit(self, "accelerate", (speed_increase,), f"The {self.make} {self.model} accelerates to {self.speed} km/h.")
+        else:
+            emit_rejected(self, "accelerate", (speed_increase,), f"You need to start the {self.make} {self.model} first.")
+    
+    def brake(self, speed_decrease):
+        """Decrease the speed of the vehicle.
+        
+        Args:
+            speed_decrease (int): The amount to decrease speed by
+        """
+        if check(self, BRAKE) == OK:
+            if speed_decrease > self.speed:
+                self.speed = 0
+            else:
+                self.speed -= speed_decrease
+            emit(self, "brake", (speed_decrease,), f"The {self.make} {self.model} slows down to {self.speed} km/h.")
+        else:
+            emit_rejected(self, "brake", (speed_decrease,), f"The {self.make} {self.model} is not running.")
+    
+    def __str__(self):
+        """String representation of the vehicle."""
+        status = "running" if self.is_running else "off"
+        return f"{self.year} {self.make} {self.model} ({self.color}) - {status}, {self.speed} km/h"
+
+
+class Car(Vehicle):
+    """Class representing cars, inheriting from Vehicle."""
+    
+    def __init__(self, make, model, year, color, fuel_type, doors):
+        """Initialize a car with car-specific attributes.
+        
+        Args:
+            make (str): The manufacturer of the car
+            model (str): The model name of the car
+            year (int): The year the car was manufactured
+            color (str): The color of the car
+            fuel_type (str): The type of fuel the car uses
+            doors (int): The number of doors the car has
+        """
+        super().__init__(make, model, year, color)
+        self.fuel_type = fuel_type
+        self.doors = doors
+        self.is_convertible = False
+        
+    def move(self):
+        """Override the move method for cars."""
+        if check(self, MOVE) == OK:
+            emit(self, "move", (), f"The {self.color} {self.make} {self.model} is driving on the road. 🚗")
+        else:
+            emit_rejected(self, "move", (), f"You need to start the {self.make} {self.model} first.")
+    
+    def honk(self):
+        """Cars can honk their horn."""
+        emit(self, "honk", (), f"The {self.make} {self.model} honks: BEEP BEEP!")
+    
+    def park(self):
+        """Park the car."""
+        if self.speed == 0:
+            emit(self, "park", (), f"The {self.make} {self.model} is now parked.")
+        else:
+            emit_rejected(self, "park", (), f"You need to stop the {self.make} {self.model} before parking.")
+
+
+class Motorcycle(Vehicle):
+    """Class representing motorcycles, inheriting from Vehicle."""
+    
+    def __init__(self, make, model, year, color, engine_size, has_sidecar):
+        """Initialize a motorcycle with motorcycle-specific attributes.
+        
+        Args:
+            make (str): The manufacturer of the motorcycle
+            model (str): The model name of the motorcycle
+            year (int): The year the motorcycle was manufactured
+            color (str): The color of the motorcycle
+            engine_size (int): The engine size in cc
+            has_sidecar (bool): Whether the motorcycle has a sidecar
+        """
+        super().__init__(make, model, year, color)
+        self.engine_size = engine_size
+        self.has_sidecar = has_sidecar
+        
+    def move(self):
+        """Override the move method for motorcycles."""
+        if check(self, MOVE) == OK:
+            emit(self, "move", (), f"The {self.engine_size}cc {self.make} {self.model} is zooming through traffic. 🏍️")
+        else:
+            emit_rejected(self, "move", (), f"You need to start the {self.make} {self.model} first.")
+    
+    def pop_wheelie(self):
+        """Motorcycles can pop a wheelie."""
+        if self.is_running and self.speed > 20:
+            emit(self, "pop_wheelie", (), f"The {self.make} {self.model} pops an impressive wheelie!")
+        else:
+            emit_rejected(self, "pop_wheelie", (), f"The {self.make} {self.model} needs to be going faster to pop a wheelie.")
+    
+    def rev_engine(self):
+        """Motorcycles can rev their engine."""
+        if self.is_running:
+            emit(self, "rev_engine", (), f"The {self.make} {self.model} revs loudly: VROOM VROOM!")
+        else:
+            emit_rejected(self, "rev_engine", (), f"You need to start the {self.make} {self.model} first.")
+
+
+class Boat(Vehicle):
+    """Class representing boats, inheriting from Vehicle."""
+    
+    state_machine = BOAT
+    
+    def __init__(self, make, model, year, color, boat_type, length):
+        """Initialize a boat with boat-specific attributes.
+        
+        Args:
+            make (str): The manufacturer of the boat
+            model (str): The model name of the boat
+            year (int): The year the boat was manufactured
+            color (str): The color of the boat
+            boat_type (str): The type of boat (e.g., sailboat, motorboat)
+            length (float): The length of the boat in meters
+        """
+        super().__init__(make, model, year, color)
+        self.boat_type = boat_type
+        self.length = length
+        self.is_anchored = False
+        
+    def move(self):
+        """Override the move method for boats."""
+        outcome = check(self, MOVE)
+        if outcome == OK:
+            emit(self, "move", (), f"The {self.length}m {self.boat_type} {self.make} {self.model} is sailing across the water. ⛵")
+        elif outcome == ANCHORED:
+            emit_rejected(self, "move", (), f"The {self.make} {self.model} is anchored and cannot move.")
+        else:
+            emit_rejected(self, "move", (), f"You need to start the {self.make} {self.model} first.")
+    
+    def anchor(self):
+        """Drop the boat's anchor."""
+        if check(self, ANCHOR) == OK:
+            self.is_anchored = True
+            self.speed = 0
+            emit(self, "anchor", (), f"The {self.make} {self.model} has dropped its anchor.")
+        else:
+            emit_rejected(self, "anchor", (), f"The {self.make} {self.model} is already anchored.")
+    
+    def raise_anchor(self):
+        """Raise the boat's anchor."""
+        if check(self, RAISE_ANCHOR) == OK:
+            self.is_anchored = False
+            emit(self, "raise_anchor", (), f"The {self.make} {self.model} has raised its anchor.")
+        else:
+            emit_rejected(self, "raise_anchor", (), f"The {self.make} {self.model} is not anchored.")
+
+
+class Plane(Vehicle):
+    """Class representing planes, inheriting from Vehicle."""
+    
+    state_machine = PLANE
+    
+    def __init__(self, make, model, year, color, max_altitude, num_engines):
+        """Initialize a plane with plane-specific attributes.
+        
+        Args:
+            make (str): The manufacturer of the plane
+            model (str): The model name of the plane
+            year (int): The year the plane was manufactured
+            color (str): The color of the plane
+            max_altitude (int): The maximum altitude in feet
+            num_engines (int): The number of engines
+        """
+        super().__init__(make, model, year, color)
+        self.max_altitude = max_altitude
+        self.num_engines = num_engines
+        self.altitude = 0
+        self.is_landed = True
+        
+    def move(self):
+        """Override the move method for planes."""
+        outcome = check(self, MOVE)
+        if outcome == OK:
+            emit(self, "move", (), f"The {self.make} {self.model} with {self.num_engines} engines is flying through the sky at {self.altitude} feet. ✈️")
+        elif outcome == NOT_AIRBORNE:
+            emit_rejected(self, "move", (), f"The {self.make} {self.model} needs to take off first.")
+        else:
+            emit_rejected(self, "move", (), f"You need to start the {self.make} {self.model} first.")
+    
+    def take_off(self):
+        """Take off the plane."""
+        outcome = check(self, TAKE_OFF)
+        if outcome == OK:
+            self.is_landed = False
+            self.altitude = 1000
+            emit(self, "take_off", (), f"The {self.make} {self.model} takes off and climbs to {self.altitude} feet!")
+        elif outcome == NOT_RUNNING:
+            emit_rejected(self, "take_off", (), f"You need to start the {self.make} {self.model} first.")
+        elif outcome == ALREADY_AIRBORNE:
+            emit_rejected(self, "take_off", (), f"The {self.make} {self.model} is already in the air.")
+        else:
+            emit_rejected(self, "take_off", (), f"The {self.make} {self.model} needs to reach at least 120 km/h to take off.")
+    
+    def land(self):
+        """Land the plane."""
+        outcome = check(self, LAND)
+        if outcome == OK:
+            self.is_landed = True
+            self.altitude = 0
+            self.speed = 0
+            emit(self, "land", (), f"The {self.make} {self.model} has safely landed.")
+        elif outcome == NOT_AIRBORNE:
+            emit_rejected(self, "land", (), f"The {self.make} {self.model} is already on the ground.")
+        else:
+            emit_rejected(self, "land", (), f"You need to start the {self.make} {self.model} first.")
+    
+    def change_altitude(self, altitude_change):
+        """Change the altitude of the plane.
+        
+        Args:
+            altitude_change (int): The amount to change altitude by (can be positive or negative)
+        """
+        outcome = check(self, CHANGE_ALTITUDE, altitude_change)
+        if outcome == OK:
+            self.altitude += altitude_change
+            direction = "climbs" if altitude_change > 0 else "descends"
+            emit(self, "change_altitude", (altitude_change,), f"The {self.make} {self.model} {direction} to {self.altitude} feet.")
+        elif outcome == BELOW_ZERO:
+            emit_rejected(self, "change_altitude", (altitude_change,), f"Cannot descend below 0 feet. Please land the plane.")
+        elif outcome == ABOVE_MAX:
+            emit_rejected(self, "change_altitude", (altitude_change,), f"Cannot exceed maximum altitude of {self.max_altitude} feet.")
+        elif outcome == NOT_AIRBORNE:
+            emit_rejected(self, "change_altitude", (altitude_change,), f"The {self.make} {self.model} needs to take off first.")
+        else:
+            emit_rejected(self, "change_altitude", (altitude_change,), f"You need to start the {self.make} {self.model} first.")
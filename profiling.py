@@ -0,0 +1,194 @@
+"""Runtime-switchable profiling of the Animal and Vehicle behavior methods.
+
+enable() replaces every public method of the profiled classes with a timing
+wrapper; disable() puts the original functions back, so while profiling is
+off the classes are exactly what they were and calls cost nothing extra.
+While it is on, every call is recorded under the concrete class it was made
+on, named by its module and qualified name (a Lion calling the inherited
+Animal.eat counts as "oop_demos.animals.Lion.eat", so same-named classes
+from different modules stay apart), with a latency histogram of
+power-of-two nanosecond buckets. Rejected state transitions, such as moving
+a vehicle that was never started, are counted through the event_sink
+rejection hook.
+
+batch_dispatch.dispatch() falls back to calling the wrapped methods one by
+one while profiling is on, so those calls are recorded as well.
+"""
+import functools
+from collections import namedtuple
+from contextlib import contextmanager
+from inspect import isfunction
+from time import perf_counter_ns
+
+import event_sink
+from Animal_kingdom_classes import Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Vehicle, Car, Motorcycle, Boat, Plane
+
+CLASSES = (Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake, Vehicle, Car, Motorcycle, Boat, Plane)
+BUCKETS = 64  # Bucket b counts calls that took less than 2**b nanoseconds
+
+MethodStats = namedtuple("MethodStats", ["calls", "rejected", "total_ns", "histogram"])
+
+
+class _Record:
+    __slots__ = ("calls", "rejected", "total_ns", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.rejected = 0
+        self.total_ns = 0
+        self.histogram = [0] * BUCKETS
+
+
+_records = {}  # ("module.Class", method name) -> _Record
+_installed = []  # (class, method name, original function)
+_previous_hook = None
+
+
+def _class_name(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _record(cls_name, name):
+    record = _records.get((cls_name, name))
+    if record is None:
+        record = _records[(cls_name, name)] = _Record()
+    return record
+
+
+def _timed(name, function):
+    """Wrap a method so each call's duration is recorded."""
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            record = _record(_class_name(type(self)), name)
+            record.calls += 1
+            record.total_ns += elapsed
+            record.histogram[elapsed.bit_length()] += 1
+    return wrapper
+
+
+def _on_rejection(actor, action):
+    _record(_class_name(type(actor)), action).rejected += 1
+    if _previous_hook is not None:
+        _previous_hook(actor, action)
+
+
+def is_enabled():
+    """Return True while profiling is on."""
+    return bool(_installed)
+
+
+def enable(classes=CLASSES):
+    """Start profiling the public methods of some classes.
+
+    Args:
+        classes (iterable): The classes whose own methods are wrapped;
+            inherited methods are wrapped where they are defined
+    """
+    global _previous_hook
+    if _installed:
+        raise RuntimeError("Profiling is already enabled.")
+    for cls in classes:
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and isfunction(value):
+                setattr(cls, name, _timed(name, value))
+                _installed.append((cls, name, value))
+    _previous_hook = event_sink.set_rejection_hook(_on_rejection)
+
+
+def disable():
+    """Stop profiling and restore the original methods; recorded data is kept."""
+    global _previous_hook
+    if not _installed:
+        return
+    for cls, name, function in reversed(_installed):
+        setattr(cls, name, function)
+    _installed.clear()
+    event_sink.set_rejection_hook(_previous_hook)
+    _previous_hook = None
+
+
+@contextmanager
+def profiled(classes=CLASSES):
+    """Profile the body of a ``with`` block (see enable)."""
+    enable(classes)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset():
+    """Forget everything recorded so far."""
+    _records.clear()
+
+
+def stats():
+    """Return what has been recorded so far.
+
+    Returns:
+        dict: "module.Class.method" -> MethodStats, sorted by name
+    """
+    return {
+        f"{cls_name}.{name}": MethodStats(record.calls, record.rejected, record.total_ns, tuple(record.histogram))
+        for (cls_name, name), record in sorted(_records.items())
+    }
+
+
+def percentile(method_stats, fraction):
+    """Estimate a latency percentile from a histogram.
+
+    Args:
+        method_stats (MethodStats): The method's statistics
+        fraction (float): The percentile as a fraction, e.g. 0.99
+
+    Returns:
+        int: Upper bound in nanoseconds of the bucket holding the percentile,
+            or 0 if the method was never timed
+    """
+    target = fraction * method_stats.calls
+    seen = 0
+    for bucket, count in enumerate(method_stats.histogram):
+        seen += count
+        if count and seen >= target:
+            return 1 << bucket
+    return 0
+
+
+def report():
+    """Format the recorded statistics as a table, slowest total first."""
+    rows = sorted(stats().items(), key=lambda item: item[1].total_ns, reverse=True)
+    lines = [f"{'method':<44}{'calls':>10}{'rejected':>10}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}"]
+    for key, method_stats in rows:
+        mean = method_stats.total_ns / method_stats.calls / 1000 if method_stats.calls else 0.0
+        lines.append(f"{key:<44}{method_stats.calls:>10}{method_stats.rejected:>10}{mean:>10.2f}"
+                     f"{percentile(method_stats, 0.5) / 1000:>10.2f}{percentile(method_stats, 0.99) / 1000:>10.2f}")
+    return "\n".join(lines)
+
+
+# Example usage
+if __name__ == "__main__":
+    boeing = Plane("Boeing", "747", 2020, "blue and white", 45000, 4)
+    sunseeker = Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5)
+    nagini = Snake("Nagini", 8, 45.0, "smooth", True, 4.5)
+
+    with event_sink.using(event_sink.NullSink()), profiled():
+        for _ in range(1000):
+            boeing.move()                       # rejected: not started
+            boeing.change_altitude(500)         # rejected: not started
+            sunseeker.anchor()
+            sunseeker.raise_anchor()
+            nagini.inject_venom("mouse")
+            nagini.constrict("mouse")           # rejected: venomous
+        boeing.start()
+        boeing.accelerate(150)
+        boeing.take_off()
+        for _ in range(1000):
+            boeing.change_altitude(10)
+
+    print(report())
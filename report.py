@@ -0,0 +1,343 @@
+"""Stream status reports of large populations straight to a file.
+
+write_report() turns vehicles and animals into text, CSV or JSONL rows and
+writes them in chunks, so memory use stays flat however many rows the
+report has. Text rows are the objects' own __str__ lines. Instead of
+calling __str__ once per object, the objects of a chunk that share a
+layout (all vehicles, say) are formatted with one template covering the
+whole chunk (the per-row template repeated), so no string is built per
+object. Objects whose class overrides __str__ fall back to calling it.
+
+CSV and JSONL rows hold the objects' constructor fields (the columns
+ingestion.load reads) followed by their state, so a report can be loaded
+back.
+"""
+import csv
+import io
+import math
+from collections import defaultdict
+from itertools import chain, groupby
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter, itemgetter
+
+from Animal_kingdom_classes import Animal
+from Vehicle_polymorphism_challenge import Vehicle, Boat, Plane
+from compact_animals import COMPACT_CLASSES
+from flyweight import FLYWEIGHT_CLASSES
+from ingestion import SCHEMAS, batches
+
+FORMATS = ("text", "csv", "jsonl")
+
+_STATUS = {True: "running", False: "off"}
+_JSON_CONSTANTS = {True: "true", False: "false", None: "null"}
+
+_STR = attrgetter("__str__")
+
+_KINDS = {cls: kind for kind, (cls, _) in SCHEMAS.items()}  # Class -> ingestion type
+# The compact and flyweight variants (CompactLion, FlyweightCar...) count as their regular class
+_KINDS.update({variant: _KINDS[cls] for variants in (COMPACT_CLASSES, FLYWEIGHT_CLASSES)
+               for cls, variant in variants.items() if cls in _KINDS})
+
+
+def register_kind(cls, kind):
+    """Report instances of ``cls`` and its subclasses as the ingestion type ``kind``.
+
+    Args:
+        cls (type): A class that does not derive from a registered class,
+            e.g. another compact variant of Lion
+        kind (str): A key of ingestion.SCHEMAS, e.g. "lion"
+    """
+    if kind not in SCHEMAS:
+        raise ValueError(f"Unknown type {kind!r}; expected one of {', '.join(SCHEMAS)}.")
+    _KINDS[cls] = kind
+
+
+def _kind(cls):
+    """The ingestion type name of a class, e.g. "car" (or its own name).
+
+    A class has the type of the first registered class in its MRO.
+    """
+    for klass in cls.__mro__:
+        kind = _KINDS.get(klass)
+        if kind is not None:
+            return kind
+    return cls.__name__.lower()
+
+
+def state_fields(cls):
+    """Return the names of the mutable state attributes reported for a class."""
+    if issubclass(cls, Vehicle):
+        names = ["speed", "is_running"]
+        if issubclass(cls, Boat):
+            names.append("is_anchored")
+        if issubclass(cls, Plane):
+            names.extend(("altitude", "is_landed"))
+        return names
+    return ["is_alive"]
+
+
+def class_fields(cls):
+    """Return the fields a CSV or JSONL row of ``cls`` holds, after ``type``."""
+    kind = _kind(cls)
+    if kind not in SCHEMAS:
+        return state_fields(cls)
+    schema_cls, constructor = SCHEMAS[kind]
+    return [name for name, _ in constructor] + state_fields(schema_cls)
+
+
+def default_csv_fields():
+    """Return the CSV columns used when none are given: every class's fields."""
+    fields = ["type"]
+    for cls, _ in SCHEMAS.values():
+        fields.extend(name for name in class_fields(cls) if name not in fields)
+    return fields
+
+
+def _getter(sample, fields, missing):
+    """Build a function returning the ``fields`` of objects like ``sample`` as a tuple.
+
+    It is a plain attrgetter when the objects have every field. "type" is the
+    object's ingestion type; other fields the sample lacks read as ``missing``.
+    """
+    present = [name for name in fields if name != "type" and hasattr(sample, name)]
+    if present == list(fields):
+        getter = attrgetter(*fields)
+        return getter if len(fields) > 1 else lambda obj: (getter(obj),)
+    # Pick each field out of (missing, type, *present fields)
+    prefix = (missing, _kind(type(sample)))
+    positions = [1 if name == "type" else present.index(name) + 2 if name in present else 0 for name in fields]
+    reorder = itemgetter(*positions) if len(positions) > 1 else lambda values: (values[positions[0]],)
+    if not present:
+        return lambda obj: reorder(prefix)
+    values = attrgetter(*present) if len(present) > 1 else lambda obj: (getattr(obj, present[0]),)
+    return lambda obj: reorder(prefix + values(obj))
+
+
+def _status_column(values):
+    return list(map(_STATUS.__getitem__, values))
+
+
+def _json_value(value):
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None or isinstance(value, bool):
+        return _JSON_CONSTANTS[value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return "null"  # JSON has no NaN or infinity
+    return repr(value)
+
+
+def _json_column(values):
+    """Convert a column to JSON; all-string and all-int columns take the quick path."""
+    types = set(map(type, values))
+    if types == {str}:
+        return list(map(encode_basestring_ascii, values))
+    if types == {int}:
+        return values
+    return list(map(_json_value, values))
+
+
+def _format_run(template, getter, width, converters, objects):
+    """Format a run of same-class objects with one template application.
+
+    ``converters`` maps a field position to a function converting that
+    field's column of values.
+    """
+    values = list(chain.from_iterable(map(getter, objects)))
+    for position, convert in converters.items():
+        values[position::width] = convert(values[position::width])
+    return (template * len(objects)) % tuple(values)
+
+
+class _Formatter:
+    """Turns chunks of objects into report text, caching a layout per class."""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.layouts = {}
+
+    def header(self):
+        """Return the text written before the first chunk."""
+        return ""
+
+    def layout_for(self, cls, sample):
+        layout = self.layouts.get(cls)
+        if layout is None:
+            layout = self.layouts[cls] = self.layout(sample)
+        return layout
+
+    def chunk(self, objects):
+        """Format a chunk: one run per class, interleaved back into chunk order."""
+        classes = list(map(type, objects))
+        if len(set(classes)) == 1:
+            return self.format(self.layout_for(classes[0], objects[0]), objects)
+        runs = defaultdict(list)
+        for cls, obj in zip(classes, objects):
+            runs[cls].append(obj)
+        lines = {cls: iter(self.format(self.layout_for(cls, run[0]), run).splitlines(True))
+                 for cls, run in runs.items()}
+        return "".join(map(next, map(lines.__getitem__, classes)))
+
+
+class _Text(_Formatter):
+    """Formats the objects' __str__ lines.
+
+    Layouts are keyed by the class's __str__, so a fleet of cars, boats and
+    planes is formatted as one run.
+    """
+
+    def layout(self, method):
+        if method is Vehicle.__str__:
+            template = "%s %s %s (%s) - %s, %s km/h\n"
+            fields, converters = ("year", "make", "model", "color", "is_running", "speed"), {4: _status_column}
+        elif method is Animal.__str__:
+            template = "%s, %s years old, %skg\n"
+            fields, converters = ("name", "age", "weight_kg"), {}
+        else:
+            return ()  # A __str__ of its own
+        return template, attrgetter(*fields), len(fields), converters
+
+    def format(self, layout, objects):
+        if not layout:
+            return "".join([f"{obj}\n" for obj in objects])
+        return _format_run(*layout, objects)
+
+    def chunk(self, objects):
+        # Values may contain newlines, so runs are kept in order instead of interleaved
+        methods = list(map(_STR, map(type, objects)))
+        if len(set(methods)) == 1:
+            return self.format(self.layout_for(methods[0], None), objects)
+        return "".join([self.format(self.layout_for(method, None), [obj for _, obj in run])
+                        for method, run in groupby(zip(methods, objects), itemgetter(0))])
+
+
+class _Jsonl(_Formatter):
+    """Formats JSON Lines rows; by default each holds its own class's fields."""
+
+    def layout(self, sample):
+        names = self.fields or ["type"] + class_fields(type(sample))
+        # The type is the same for the whole run, so it goes into the template
+        kind = encode_basestring_ascii(_kind(type(sample))).replace("%", "%%")
+        template = "{" + ", ".join(f'"{name}": {kind}' if name == "type" else f'"{name}": %s'
+                                   for name in names) + "}\n"
+        fields = [name for name in names if name != "type"]
+        converters = dict.fromkeys(range(len(fields)), _json_column)
+        return template, _getter(sample, fields, None), len(fields), converters
+
+    def format(self, layout, objects):
+        # Escaped JSON has no line breaks of its own, so chunk() may split the rows
+        return _format_run(*layout, objects)
+
+
+class _Csv(_Formatter):
+    """Formats CSV rows after a header; fields an object lacks are left empty."""
+
+    def __init__(self, fields):
+        super().__init__(fields or default_csv_fields())
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer, lineterminator="\n")
+
+    def header(self):
+        return ",".join(self.fields) + "\n"
+
+    def layout(self, sample):
+        return _getter(sample, self.fields, "")
+
+    def chunk(self, objects):
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        samples = dict(zip(map(type, objects), objects))  # One object per class
+        getters = {cls: self.layout_for(cls, sample) for cls, sample in samples.items()}
+        if len(getters) == 1:
+            self.writer.writerows(map(getters.popitem()[1], objects))
+        else:
+            # Quoted values may contain newlines, so rows are not split apart
+            self.writer.writerows([getters[type(obj)](obj) for obj in objects])
+        return self.buffer.getvalue()
+
+
+def _open(destination):
+    if isinstance(destination, str):
+        return open(destination, "w", encoding="utf-8", newline=""), True
+    return destination, False
+
+
+def write_report(objects, destination, format="text", fields=None, where=None, sort=None, reverse=False,
+                 chunk_size=10_000):
+    """Write a report of vehicles and animals, one row per object.
+
+    Args:
+        objects (iterable): The vehicles and animals to report; it is read
+            lazily unless ``sort`` is given
+        destination: A file name, or an open text file (opened with
+            newline="" for CSV)
+        format (str): "text", "csv" or "jsonl"
+        fields (list, optional): The CSV or JSONL columns; "type" is the
+            object's ingestion type. By default CSV rows have every class's
+            fields and JSONL rows the fields of their own class
+        where (callable, optional): Only objects for which it returns true
+            are reported
+        sort: A field name, a list of field names or a key function to
+            sort the rows by; sorting keeps one reference per object
+        reverse (bool): Sort in descending order
+        chunk_size (int): Rows formatted and written at a time
+
+    Returns:
+        int: The number of rows written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown report format {format!r}; expected one of {', '.join(FORMATS)}.")
+    if where is not None:
+        objects = filter(where, objects)
+    if sort is not None:
+        if isinstance(sort, str):
+            sort = attrgetter(sort)
+        elif not callable(sort):
+            sort = attrgetter(*sort)
+        objects = sorted(objects, key=sort, reverse=reverse)
+
+    file, owned = _open(destination)
+    try:
+        formatter = {"text": _Text, "csv": _Csv, "jsonl": _Jsonl}[format](fields)
+        file.write(formatter.header())
+        rows = 0
+        for chunk in batches(objects, chunk_size):
+            file.write(formatter.chunk(chunk))
+            rows += len(chunk)
+    finally:
+        if owned:
+            file.close()
+    return rows
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+
+    from Animal_kingdom_classes import Lion, Snake
+    from Vehicle_polymorphism_challenge import Car
+
+    population = [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Car("Toyota", "Corolla", 2020, "white", "hybrid", 4),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Lion("Simba", 5, 190.5, "golden", "large"),
+        Snake("Nagini", 8, 45.0, "smooth", True, 4.5),
+    ]
+    population[0].is_running = True
+    population[0].speed = 60
+
+    vehicles = [obj for obj in population if isinstance(obj, Vehicle)]
+    print("=== Text, Fastest First ===")
+    write_report(vehicles, sys.stdout, sort="speed", reverse=True)
+
+    print("\n=== CSV, Vehicles Built Since 2021 ===")
+    write_report(vehicles, sys.stdout, "csv", fields=["type", "make", "model", "year", "speed"],
+                 where=lambda vehicle: vehicle.year >= 2021)
+
+    print("\n=== JSONL ===")
+    write_report(population, sys.stdout, "jsonl")
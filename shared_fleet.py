@@ -0,0 +1,296 @@
+"""Fleet state in shared memory, readable by other processes without copying.
+
+SharedFleetStore is a FleetStore whose columns (year, speed, is_running,
+is_anchored, is_landed, altitude, max_altitude) live in a
+multiprocessing.shared_memory block instead of private arrays. The vehicles
+added to it keep working as normal objects, and their state attributes read
+and write the shared memory directly.
+
+Other processes attach with SharedFleetReader and read the columns as
+memoryviews. The block holds two copies of every column. The simulator
+changes one of them (the back buffer) during a tick; publish() makes it the
+front buffer that readers see, then copies it over the old front buffer,
+which becomes the new back buffer. A sequence counter in the header is odd
+while the buffers are being swapped and is advanced by two on every
+publish, so a reader can tell whether a tick was published while it was
+reading (a seqlock) and simply read again.
+
+Requires Python 3.8+ (multiprocessing.shared_memory). The sequence counter
+relies on the CPU not reordering the stores to shared memory, which holds
+on x86-64.
+"""
+import struct
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+from fleet_store import FleetStore, _COLUMNS
+
+_HEADER = struct.Struct("<QQQQ")  # sequence, front buffer, vehicle count, capacity
+_SEQUENCE, _FRONT, _COUNT, _CAPACITY = range(4)
+
+# Wide columns first so that every column stays aligned
+_LAYOUT = sorted(_COLUMNS, key=lambda name: -struct.calcsize(_COLUMNS[name][0]))
+
+FleetView = namedtuple("FleetView", ["tick", "count"] + _LAYOUT)
+
+
+def _buffer_size(capacity):
+    size = sum(struct.calcsize(_COLUMNS[name][0]) for name in _LAYOUT) * capacity
+    return (size + 7) // 8 * 8
+
+
+def _columns(buf, capacity):
+    """Cast the two buffers of a block into {column name: memoryview} dicts."""
+    buffers = []
+    offset = _HEADER.size
+    for _ in range(2):
+        views = {}
+        for name in _LAYOUT:
+            typecode = _COLUMNS[name][0]
+            size = struct.calcsize(typecode) * capacity
+            views[name] = buf[offset:offset + size].cast(typecode)
+            offset += size
+        offset = (offset + 7) // 8 * 8
+        buffers.append(views)
+    return buffers
+
+
+class _SharedColumn:
+    """A fixed-capacity column backed by the store's current back buffer."""
+
+    __slots__ = ("view", "length")
+
+    def __init__(self):
+        self.view = None  # Set by SharedFleetStore
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.view[:self.length])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.view[:self.length][index]
+        return self.view[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.view[:self.length][index] = value
+        else:
+            self.view[index] = value
+
+    def append(self, value):
+        if self.length == len(self.view):
+            raise ValueError("The shared fleet store is full.")
+        self.view[self.length] = value
+        self.length += 1
+
+
+class SharedFleetStore(FleetStore):
+    """A FleetStore whose columns live in shared memory (the writer side)."""
+
+    def __init__(self, vehicles=(), capacity=100_000, name=None):
+        """Create the shared memory block and add an initial fleet.
+
+        Args:
+            vehicles (iterable): Vehicles to add to the store
+            capacity (int): The most vehicles the store can hold
+            name (str, optional): Name of the shared memory block; a unique
+                one is chosen if omitted
+        """
+        self.capacity = capacity
+        self._memory = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER.size + 2 * _buffer_size(capacity))
+        self._header = self._memory.buf[:_HEADER.size].cast("Q")
+        self._header[_CAPACITY] = capacity
+        self._buffers = _columns(self._memory.buf, capacity)
+        self._back = 1
+        self._shared = {}
+        super().__init__(vehicles)
+        self._point_at(self._back)
+        self.publish()
+
+    @property
+    def name(self):
+        """The name readers attach to."""
+        return self._memory.name
+
+    def _make_column(self, typecode):
+        column = _SharedColumn()
+        # Columns are created in _COLUMNS order before any vehicle is added
+        name = list(_COLUMNS)[len(self._shared)]
+        column.view = self._buffers[1][name]
+        self._shared[name] = column
+        return column
+
+    def _point_at(self, back):
+        for name, column in self._shared.items():
+            column.view = self._buffers[back][name]
+
+    def publish(self):
+        """Make the current state visible to readers as a new tick.
+
+        Returns:
+            int: The tick number readers will see
+        """
+        header = self._header
+        header[_SEQUENCE] += 1  # Odd: readers wait
+        front, back = self._back, 1 - self._back
+        header[_FRONT] = front
+        header[_COUNT] = len(self.vehicles)
+        header[_SEQUENCE] += 1
+        # Continue from the published state in the other buffer
+        for name, column in self._shared.items():
+            self._buffers[back][name][:] = self._buffers[front][name]
+        self._back = back
+        self._point_at(back)
+        return header[_SEQUENCE] // 2
+
+    def close(self, unlink=True):
+        """Release the shared memory block.
+
+        Vehicles in the store must not be used afterwards.
+
+        Args:
+            unlink (bool): Also destroy the block (readers keep their mapping)
+        """
+        for views in self._buffers:
+            for view in views.values():
+                view.release()
+        for column in self._shared.values():
+            column.view = None
+        self._header.release()
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class SharedFleetReader:
+    """Consistent, zero-copy reads of a SharedFleetStore from any process."""
+
+    def __init__(self, name):
+        """Attach to a store's shared memory block.
+
+        Args:
+            name (str): The store's name
+        """
+        try:
+            self._memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 every attach is registered with the resource
+            # tracker, which then destroys the block when the reader exits
+            register, resource_tracker.register = resource_tracker.register, lambda name, rtype: None
+            try:
+                self._memory = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        self._header = self._memory.buf[:_HEADER.size].cast("Q")
+        self._buffers = _columns(self._memory.buf, self._header[_CAPACITY])
+
+    def begin(self):
+        """Start a read: return the current FleetView and its sequence number.
+
+        The view's columns are memoryviews of the front buffer; pass the
+        sequence number to changed() after reading to make sure no tick was
+        published meanwhile.
+        """
+        header = self._header
+        while True:
+            sequence = header[_SEQUENCE]
+            if not sequence & 1:
+                break
+        views = self._buffers[header[_FRONT]]
+        count = header[_COUNT]
+        return sequence, FleetView(sequence // 2, count, *(views[name][:count] for name in _LAYOUT))
+
+    def changed(self, sequence):
+        """Return True if a tick was published since begin() returned ``sequence``."""
+        return self._header[_SEQUENCE] != sequence
+
+    def read(self, function):
+        """Call a function on a consistent view, retrying if it was torn.
+
+        Args:
+            function (callable): Called with a FleetView; must not keep the
+                view's memoryviews after returning
+
+        Returns:
+            The function's result
+        """
+        while True:
+            sequence, view = self.begin()
+            try:
+                result = function(view)
+            except Exception:
+                if self.changed(sequence):
+                    continue
+                raise
+            if not self.changed(sequence):
+                return result
+
+    def close(self):
+        """Detach from the shared memory block."""
+        for views in self._buffers:
+            for view in views.values():
+                view.release()
+        self._header.release()
+        self._memory.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def _check_ticks(name, reads):
+    """Reader process for the example: every read must see one whole tick."""
+    def uniform(view):
+        return len(set(view.speed)) == 1
+
+    with SharedFleetReader(name) as reader:
+        results = [reader.read(uniform) for _ in range(reads)]
+    return sum(results), len(results)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    from Vehicle_polymorphism_challenge import Car, Boat, Plane
+
+    fleet = [Car("Tesla", "Model S", 2023, "red", "electric", 4) if i % 3 == 0
+             else Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5) if i % 3 == 1
+             else Plane("Boeing", "747", 2020, "blue and white", 45000, 4)
+             for i in range(100_000)]
+
+    with SharedFleetStore(fleet, capacity=len(fleet)) as store:
+        for vehicle in fleet:
+            vehicle.is_running = True  # Goes straight to shared memory
+        store.publish()
+
+        with ProcessPoolExecutor(4) as pool:
+            readers = [pool.submit(_check_ticks, store.name, 200) for _ in range(4)]
+            start = time.perf_counter()
+            ticks = 0
+            while not all(reader.done() for reader in readers):
+                store.accelerate(1)  # Every speed equals the tick number
+                store.publish()
+                ticks += 1
+            elapsed = time.perf_counter() - start
+            print(f"Writer published {ticks} ticks of {len(fleet):,} vehicles "
+                  f"({elapsed / ticks * 1000:.2f} ms per tick)")
+            for number, reader in enumerate(readers):
+                consistent, total = reader.result()
+                print(f"Reader {number}: {consistent}/{total} reads saw one whole tick")
+
+        print(fleet[0])
@@ -0,0 +1,283 @@
+"""Versioned binary snapshots of vehicle fleets and animal populations.
+
+A snapshot file holds a fixed-size header, one fixed-width record per object
+and a table of interned strings:
+
+    header   magic, version, record size, record count, string count and
+             the offsets of the record and string sections
+    records  kind (which class), flag bits, a bit mask telling which numbers
+             were ints, 4 string ids and 9 float64 numbers (5 in version 1)
+    strings  an offsets table followed by the UTF-8 string data; id 0 is None
+
+Which attribute goes into which flag bit, string slot or number slot is
+fixed per class by LAYOUTS. Loading memory-maps the file and only reads the
+header; records are turned into objects (and strings decoded) when they
+are accessed, so opening even a very large snapshot is nearly instant.
+
+Version 2 added animal positions and velocities; version 1 files are still
+readable and load their animals at the origin, standing still.
+"""
+import mmap
+import os
+import struct
+from array import array
+
+from Animal_kingdom_classes import Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Vehicle, Car, Motorcycle, Boat, Plane
+
+MAGIC = b"OOPSNAP\0"
+VERSION = 2
+
+_HEADER = struct.Struct("<8sHHIQQQQQ")
+_RECORDS = {1: struct.Struct("<BBBx4I5d"), 2: struct.Struct("<BBH4I9d")}
+_RECORD = _RECORDS[VERSION]
+_STRING_SLOTS = 4
+_NUMBER_SLOTS = 9
+_EXACT = 2 ** 53  # Numbers are float64s, which hold ints up to this exactly
+
+# Number slots holding one coordinate of a tuple attribute (added in version 2)
+_COORDINATES = {"x": ("position", 0), "y": ("position", 1), "vx": ("velocity", 0), "vy": ("velocity", 1)}
+
+# Kind code -> class. Append new classes at the end to keep old files readable.
+CLASSES = (Vehicle, Car, Motorcycle, Boat, Plane, Animal, Mammal, Bird, Reptile, Lion, Eagle, Snake)
+_KINDS = {cls: kind for kind, cls in enumerate(CLASSES)}
+
+_MOTION = ("x", "y", "vx", "vy")
+
+# Class -> (flag attributes, string attributes, number attributes)
+LAYOUTS = {
+    Vehicle: (("is_running",), ("make", "model", "color"), ("year", "speed")),
+    Car: (("is_running", "is_convertible"), ("make", "model", "color", "fuel_type"), ("year", "speed", "doors")),
+    Motorcycle: (("is_running", "has_sidecar"), ("make", "model", "color"), ("year", "speed", "engine_size")),
+    Boat: (("is_running", "is_anchored"), ("make", "model", "color", "boat_type"), ("year", "speed", "length")),
+    Plane: (("is_running", "is_landed"), ("make", "model", "color"),
+            ("year", "speed", "altitude", "max_altitude", "num_engines")),
+    Animal: (("is_alive",), ("name",), ("age", "weight_kg") + _MOTION),
+    Mammal: (("is_alive", "is_carnivore"), ("name", "fur_color"),
+             ("age", "weight_kg", "body_temperature") + _MOTION),
+    Bird: (("is_alive", "can_fly", "has_feathers"), ("name",), ("age", "weight_kg", "wingspan") + _MOTION),
+    Reptile: (("is_alive", "is_venomous", "cold_blooded"), ("name", "scale_type"), ("age", "weight_kg") + _MOTION),
+    Lion: (("is_alive", "is_carnivore"), ("name", "fur_color", "mane_size", "species"),
+           ("age", "weight_kg", "body_temperature") + _MOTION),
+    Eagle: (("is_alive", "can_fly", "has_feathers"), ("name", "species"),
+            ("age", "weight_kg", "wingspan", "eyesight_distance") + _MOTION),
+    Snake: (("is_alive", "is_venomous", "cold_blooded"), ("name", "scale_type", "species"),
+            ("age", "weight_kg", "length") + _MOTION),
+}
+
+
+def _snapshot_class(obj):
+    """Return the class in CLASSES that an object is saved as."""
+    for cls in type(obj).__mro__:
+        if cls in _KINDS:
+            return cls
+    raise TypeError(f"Cannot snapshot objects of type {type(obj).__name__}.")
+
+
+def save(path, objects):
+    """Write vehicles and/or animals to a snapshot file.
+
+    Args:
+        path (str): The file to write
+        objects (iterable): Instances of any class in CLASSES (subclasses
+            such as FleetStore views are saved as their base class)
+
+    Returns:
+        int: The number of records written
+
+    Raises:
+        TypeError: If an object's class cannot be snapshotted
+        ValueError: If a string attribute holds something other than a
+            string or None (e.g. a model given as the number 747), or a
+            number attribute holds an int too large to store exactly
+
+    A save that fails removes the partly written file.
+    """
+    try:
+        return _save(path, objects)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+
+def _save(path, objects):
+    strings = {None: 0}
+    pack = _RECORD.pack
+    count = 0
+    with open(path, "wb") as file:
+        file.write(bytes(_HEADER.size))
+        chunk = []
+        for obj in objects:
+            cls = _snapshot_class(obj)
+            flag_names, string_names, number_names = LAYOUTS[cls]
+            flags = 0
+            for bit, name in enumerate(flag_names):
+                if getattr(obj, name):
+                    flags |= 1 << bit
+            string_ids = [0] * _STRING_SLOTS
+            for slot, name in enumerate(string_names):
+                value = getattr(obj, name)
+                if value is not None and not isinstance(value, str):
+                    raise ValueError(f"Cannot snapshot {cls.__name__}.{name} = {value!r}: "
+                                     f"expected a string or None, got {type(value).__name__}.")
+                string_ids[slot] = strings.setdefault(value, len(strings))
+            numbers = [0.0] * _NUMBER_SLOTS
+            int_mask = 0
+            for slot, name in enumerate(number_names):
+                if name in _COORDINATES:
+                    attribute, axis = _COORDINATES[name]
+                    value = getattr(obj, attribute)[axis]
+                else:
+                    value = getattr(obj, name)
+                if isinstance(value, int):
+                    if not -_EXACT <= value <= _EXACT:
+                        raise ValueError(f"Cannot snapshot {cls.__name__}.{name} = {value}: "
+                                         f"ints beyond 2 ** 53 do not fit a float64 exactly.")
+                    int_mask |= 1 << slot
+                numbers[slot] = value
+            chunk.append(pack(_KINDS[cls], flags, int_mask, *string_ids, *numbers))
+            count += 1
+            if len(chunk) == 65536:
+                file.write(b"".join(chunk))
+                chunk = []
+        file.write(b"".join(chunk))
+
+        encoded = [value.encode("utf-8") for value in list(strings)[1:]]
+        offsets = array("Q", [0, 0])  # id 0 (None) is an empty entry
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        records_offset = _HEADER.size
+        offsets_offset = records_offset + count * _RECORD.size
+        data_offset = offsets_offset + len(offsets) * offsets.itemsize
+        file.write(offsets.tobytes())
+        file.write(b"".join(encoded))
+        file.seek(0)
+        file.write(_HEADER.pack(MAGIC, VERSION, _RECORD.size, 0, count, len(strings),
+                                records_offset, offsets_offset, data_offset))
+    return count
+
+
+class Snapshot:
+    """A memory-mapped snapshot whose records become objects on access."""
+
+    def __init__(self, path):
+        """Open a snapshot file without reading its records.
+
+        Args:
+            path (str): The snapshot file to open
+        """
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, record_size, _, self._count, string_count,
+         self._records_offset, offsets_offset, self._data_offset) = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a snapshot file.")
+        if version not in _RECORDS or record_size != _RECORDS[version].size:
+            self.close()
+            raise ValueError(f"{path} uses unsupported snapshot version {version}.")
+        self.version = version
+        self._record = _RECORDS[version]
+        self._offsets = memoryview(self._map)[offsets_offset:offsets_offset + (string_count + 1) * 8].cast("Q")
+        self._strings = {0: None}
+        self._objects = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def close(self):
+        """Release the memory map; objects already built stay usable."""
+        if getattr(self, "_offsets", None) is not None:
+            self._offsets.release()
+            self._offsets = None
+        self._map.close()
+        self._file.close()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("snapshot index out of range")
+        obj = self._objects.get(index)
+        if obj is None:
+            obj = self._objects[index] = self._build(index)
+        return obj
+
+    def _string(self, string_id):
+        """Decode (once) and return an interned string."""
+        value = self._strings.get(string_id)
+        if value is None and string_id:
+            start = self._data_offset + self._offsets[string_id]
+            stop = self._data_offset + self._offsets[string_id + 1]
+            value = self._strings[string_id] = self._map[start:stop].decode("utf-8")
+        return value
+
+    def _build(self, index):
+        """Turn one record into an object, bypassing the constructor."""
+        kind, flags, int_mask, *fields = self._record.unpack_from(
+            self._map, self._records_offset + index * self._record.size)
+        cls = CLASSES[kind]
+        flag_names, string_names, number_names = LAYOUTS[cls]
+        state = {}
+        for slot, name in enumerate(string_names):
+            state[name] = self._string(fields[slot])
+        coordinates = {}
+        if self.version == 1:
+            number_names = [name for name in number_names if name not in _COORDINATES]
+        for slot, name in enumerate(number_names):
+            value = fields[_STRING_SLOTS + slot]
+            value = int(value) if int_mask >> slot & 1 else value
+            if name in _COORDINATES:
+                coordinates[name] = value
+            else:
+                state[name] = value
+        if issubclass(cls, Animal):
+            state["position"] = (coordinates.get("x", 0.0), coordinates.get("y", 0.0))
+            state["velocity"] = (coordinates.get("vx", 0.0), coordinates.get("vy", 0.0))
+        for bit, name in enumerate(flag_names):
+            state[name] = bool(flags >> bit & 1)
+        obj = cls.__new__(cls)
+        obj.__dict__.update(state)
+        return obj
+
+
+def load(path):
+    """Open a snapshot file (see Snapshot)."""
+    return Snapshot(path)
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    animals = [Lion("Simba", 5, 190.5, "golden", "large"), Eagle("Hedwig", 3, 6.2, 2.1, 3.0),
+               Snake("Nagini", 8, 45.0, "smooth", True, 4.5)]
+    vehicles = [Car("Tesla", "Model S", 2023, "red", "electric", 4),
+                Plane("Boeing", "747", 2020, "blue and white", 45000, 4)]
+    population = [animals[i % 3] if i % 2 else vehicles[i % 2] for i in range(1_000_000)]
+
+    path = os.path.join(tempfile.mkdtemp(), "population.snap")
+    start = time.perf_counter()
+    save(path, population)
+    print(f"Saved {len(population):,} records in {time.perf_counter() - start:.2f}s "
+          f"({os.path.getsize(path) / 1e6:.1f} MB)")
+
+    start = time.perf_counter()
+    with load(path) as snapshot:
+        print(f"Opened in {(time.perf_counter() - start) * 1000:.2f} ms")
+        for index in (0, 1, 3, 5, 999_999):
+            print(f"  {index}: {snapshot[index]}")
+    os.remove(path)
@@ -0,0 +1,174 @@
+"""Uniform-grid spatial index over animal positions.
+
+SpatialIndex buckets animals into square cells by their position, so that a
+range query only looks at the cells overlapping the search circle instead
+of at every animal. It is used to find the prey an Eagle can see within its
+eyesight_distance. Indexed animals are watched (see observers.py), so the
+index follows every position change, including the ones move() makes.
+"""
+from math import floor
+
+from observers import watch, unwatch
+
+
+class SpatialIndex:
+    """Buckets animals into a uniform grid of square cells."""
+
+    def __init__(self, animals=(), cell_size=1.0):
+        """Initialize the index, optionally with an initial population.
+
+        Args:
+            animals (iterable): Animals to index
+            cell_size (float): Width of a grid cell in kilometers; works best
+                close to the typical search radius
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells = {}  # (column, row) -> {id(animal): animal}
+        self._count = 0
+        for animal in animals:
+            self.add(animal)
+
+    def __len__(self):
+        return self._count
+
+    def _cell(self, position):
+        x, y = position
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def add(self, animal):
+        """Index an animal at its current position; adding it again does nothing.
+
+        Args:
+            animal (Animal): The animal to index
+        """
+        members = self._cells.setdefault(self._cell(animal.position), {})
+        if id(animal) in members:
+            return  # The index keeps each animal's cell current
+        members[id(animal)] = animal
+        self._count += 1
+        watch(animal, self._on_change)
+
+    def remove(self, animal):
+        """Remove an animal from the index.
+
+        Args:
+            animal (Animal): The animal to remove
+        """
+        unwatch(animal, self._on_change)
+        self._discard(self._cell(animal.position), animal)
+        self._count -= 1
+
+    def close(self):
+        """Remove every animal, so the index no longer follows their moves."""
+        for members in self._cells.values():
+            for animal in members.values():
+                unwatch(animal, self._on_change)
+        self._cells.clear()
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def _discard(self, cell, animal):
+        members = self._cells[cell]
+        del members[id(animal)]
+        if not members:
+            del self._cells[cell]
+
+    def _on_change(self, animal, name, old, new):
+        """Move an animal to another cell when its position changes."""
+        if name != "position":
+            return
+        old_cell, new_cell = self._cell(old), self._cell(new)
+        if old_cell != new_cell:
+            self._discard(old_cell, animal)
+            self._cells.setdefault(new_cell, {})[id(animal)] = animal
+
+    def within(self, position, radius):
+        """Find the animals within a distance of a point.
+
+        Args:
+            position (tuple): The (x, y) center in kilometers
+            radius (float): The search radius in kilometers
+
+        Returns:
+            list: The animals at most ``radius`` away from ``position``
+        """
+        x, y = position
+        first_column, first_row = self._cell((x - radius, y - radius))
+        last_column, last_row = self._cell((x + radius, y + radius))
+        limit = radius * radius
+        found = []
+        cells = self._cells
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                members = cells.get((column, row))
+                if not members:
+                    continue
+                for animal in members.values():
+                    ax, ay = animal.position
+                    if (ax - x) * (ax - x) + (ay - y) * (ay - y) <= limit:
+                        found.append(animal)
+        return found
+
+    def prey_in_sight(self, eagle):
+        """Find the live animals an eagle can see from where it is.
+
+        Args:
+            eagle (Eagle): The hunting eagle
+
+        Returns:
+            list: Every other live animal within ``eagle.eyesight_distance``
+        """
+        return [
+            animal for animal in self.within(eagle.position, eagle.eyesight_distance)
+            if animal is not eagle and animal.is_alive
+        ]
+
+    def nearest_prey(self, eagle):
+        """Return the closest live animal the eagle can see, or None."""
+        x, y = eagle.position
+        candidates = self.prey_in_sight(eagle)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda animal: (animal.position[0] - x) ** 2 + (animal.position[1] - y) ** 2)
+
+
+def brute_force_within(animals, position, radius):
+    """Reference implementation of SpatialIndex.within that scans every animal."""
+    x, y = position
+    limit = radius * radius
+    return [
+        animal for animal in animals
+        if (animal.position[0] - x) ** 2 + (animal.position[1] - y) ** 2 <= limit
+    ]
+
+
+# Example usage
+if __name__ == "__main__":
+    from Animal_kingdom_classes import Lion, Eagle, Snake
+
+    hedwig = Eagle("Hedwig", 3, 6.2, 2.1, 3.0)
+    simba = Lion("Simba", 5, 190.5, "golden", "large")
+    nagini = Snake("Nagini", 8, 45.0, "smooth", True, 4.5)
+    simba.position = (2.0, 1.0)
+    nagini.position = (6.0, 0.0)
+    nagini.velocity = (-1.5, 0.0)
+
+    index = SpatialIndex([hedwig, simba, nagini], cell_size=3.0)
+
+    print("=== In Sight Before Moving ===")
+    print([animal.name for animal in index.prey_in_sight(hedwig)])
+
+    print("\n=== Moving ===")
+    nagini.move()
+    nagini.move()
+
+    print("\n=== In Sight After Moving ===")
+    print([animal.name for animal in index.prey_in_sight(hedwig)])
+    hedwig.hunt_from_above(index.nearest_prey(hedwig).name)
@@ -0,0 +1,11 @@
+import pytest
+
+from event_sink import CallbackSink, using
+
+
+@pytest.fixture
+def events():
+    """Collect every Event emitted inside the test instead of printing it."""
+    collected = []
+    with using(CallbackSink(collected.append)):
+        yield collected
@@ -0,0 +1,58 @@
+import pytest
+
+from Animal_kingdom_classes import Lion, Eagle
+from compact_animals import CompactLion
+from aging import AgingPopulation
+
+
+def test_census_matches_the_animals():
+    animals = [Lion("Simba", age % 15, 190.5, "golden") for age in range(60)]
+    animals += [Eagle("Hedwig", age % 20, 6.2, 2.1, 3.0) for age in range(60)]
+    population = AgingPopulation(animals, seed=3)
+    for years in (1, 5, 10):
+        population.advance(years)
+        alive = [animal for animal in animals if animal.is_alive]
+        census = population.census()
+        assert census.alive == len(alive) == population.count()
+        assert census.dead == len(animals) - len(alive)
+        assert census.total_weight_kg == pytest.approx(sum(animal.weight_kg for animal in alive))
+        assert population.count(Lion) == sum(isinstance(animal, Lion) for animal in alive)
+
+
+def test_slotted_animals_can_age():
+    lion = CompactLion("Simba", 5, 190.5, "golden", "large")
+    population = AgingPopulation([lion], seed=1)
+    population.advance(2)
+    assert lion.age == 7
+    assert type(lion).__name__ == "CompactLion"
+    lion.weight_kg = 200.0
+    assert lion.weight_kg == 200.0
+    population.detach()
+    assert type(lion) is CompactLion
+    assert (lion.age, lion.weight_kg) == (7, 200.0)
+
+
+def test_weight_is_not_rounded_between_years():
+    yearly = Lion("Kiara", 0, 1.5, "golden")
+    at_once = Lion("Kiara", 0, 1.5, "golden")
+    stepped = AgingPopulation([yearly], seed=1)
+    direct = AgingPopulation([at_once], seed=1)
+    for _ in range(4):
+        stepped.advance(1)
+        yearly.weight_kg = yearly.weight_kg  # Re-anchor on the value read
+    direct.advance(4)
+    assert at_once.weight_kg != round(at_once.weight_kg, 1)
+    assert yearly.weight_kg == pytest.approx(at_once.weight_kg, rel=1e-12)
+
+
+def test_invalid_animals_leave_the_population_and_the_animal_intact():
+    good, bad = Lion("Simba", 5, 190.5, "golden"), Lion("Scar", 5.5, 170.0, "dark")
+    later = Eagle("Hedwig", 3, 6.2, 2.1, 3.0)
+    population = AgingPopulation([good], seed=1)
+    with pytest.raises(TypeError, match="age"):
+        population.extend([bad])
+    assert type(bad) is Lion and (bad.age, bad.weight_kg, bad.is_alive) == (5.5, 170.0, True)
+    population.extend([later])
+    assert len(population.cls) == len(population.birth) == len(population.weight) == 2
+    assert population.cls[1] is Eagle
+    assert later.age == 3 and later.weight_kg == 6.2
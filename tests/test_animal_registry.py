@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from Animal_kingdom_classes import Lion, Eagle, Snake
+from animal_registry import AnimalRegistry
+
+
+def make_zoo(count=300, seed=3):
+    rng = random.Random(seed)
+    zoo = []
+    for i in range(count):
+        if i % 3 == 0:
+            zoo.append(Lion("Simba", rng.randrange(20), rng.uniform(50, 250), "golden"))
+        elif i % 3 == 1:
+            zoo.append(Eagle("Hedwig", rng.randrange(20), rng.uniform(2, 8), 2.1, 3.0))
+        else:
+            zoo.append(Snake("Nagini", rng.randrange(20), rng.uniform(5, 90), "smooth", rng.random() < 0.5, 4.5))
+    return zoo
+
+
+def scan(zoo, **criteria):
+    def matches(animal):
+        for field, wanted in criteria.items():
+            value = getattr(animal, field, None)
+            if value is None:
+                return False
+            if isinstance(wanted, tuple):
+                low, high = wanted
+                if low is not None and value < low or high is not None and value > high:
+                    return False
+            elif value != wanted:
+                return False
+        return True
+    return [animal for animal in zoo if matches(animal)]
+
+
+@pytest.mark.parametrize("criteria", [
+    {"species": "Naja naja", "age": (6, None)},
+    {"is_carnivore": True, "weight_kg": (100, 200)},
+    {"can_fly": True, "age": (None, 3)},
+    {"is_alive": True},
+])
+def test_queries_match_a_full_scan(criteria):
+    zoo = make_zoo()
+    with AnimalRegistry(zoo) as registry:
+        assert registry.query(**criteria) == scan(zoo, **criteria)
+        for animal in zoo[::7]:
+            animal.age += 5
+            animal.weight_kg /= 2
+        assert registry.query(**criteria) == scan(zoo, **criteria)
+
+
+def test_close_stops_following_the_animals():
+    zoo = make_zoo(30)
+    classes = [type(animal) for animal in zoo]
+    with AnimalRegistry(zoo) as registry:
+        assert type(zoo[0]) is not classes[0]  # Watched while registered
+    assert [type(animal) for animal in zoo] == classes
+    assert len(registry) == 0 and registry.query() == []
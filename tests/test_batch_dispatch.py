@@ -0,0 +1,105 @@
+import gc
+
+import pytest
+
+from Animal_kingdom_classes import Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane
+from batch_dispatch import dispatch
+from event_sink import using, set_rejection_hook
+
+
+class RecordingSink:
+    def __init__(self):
+        self.log = []
+
+    def write(self, event):
+        self.log.append(("ok", event.actor, event.action, event.args, event.message))
+
+    def write_rejected(self, event):
+        self.log.append(("rejected", event.actor, event.action, event.args, event.message))
+
+    def flush(self):
+        pass
+
+
+class Wandering(Lion):
+    """A subclass with its own move(), which has no batch version."""
+
+    def move(self):
+        super().move()
+
+
+def make_objects():
+    boat = Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5)
+    boat.anchor()
+    running_boat = Boat("Sunseeker", "Manhattan", 2021, "blue", "yacht", 20.0)
+    running_boat.start()
+    plane, flying = Plane("Boeing", "747", 2020, "white", 45000, 4), Plane("Airbus", "A380", 2021, "white", 43000, 4)
+    for p in (plane, flying):
+        p.start()
+    flying.accelerate(200)
+    flying.take_off()
+    car, started = Car("Tesla", "Model S", 2023, "red", "electric", 4), Car("VW", "Golf", 2019, "grey", "diesel", 4)
+    started.start()
+    return [
+        Lion("Simba", 5, 190.5, "golden", "large"), boat, car, Eagle("Hedwig", 3, 6.2, 2.1, 3.0), running_boat,
+        plane, Wandering("Nala", 4, 126.0, "golden"), started, flying,
+        Motorcycle("Ducati", "Monster", 2022, "red", 937, False), Snake("Nagini", 8, 45.0, "smooth", True, 4.5),
+    ]
+
+
+def run(method, *args, batched, preserve_order=True):
+    objects = make_objects()
+    rejections = []
+    previous = set_rejection_hook(lambda actor, action: rejections.append((objects.index(actor), action)))
+    sink = RecordingSink()
+    try:
+        with using(sink):
+            if batched:
+                dispatch(objects, method, *args, preserve_order=preserve_order)
+            else:
+                for obj in objects:
+                    getattr(obj, method)(*args)
+    finally:
+        set_rejection_hook(previous)
+    log = [(kind, objects.index(actor), action, args, message) for kind, actor, action, args, message in sink.log]
+    return log, rejections
+
+
+def test_batched_moves_log_the_same_events_as_sequential_ones():
+    assert run("move", batched=True) == run("move", batched=False)
+
+
+def test_grouped_dispatch_reports_the_same_events_per_object():
+    grouped, grouped_rejections = run("move", batched=True, preserve_order=False)
+    sequential, sequential_rejections = run("move", batched=False)
+    assert sorted(grouped) == sorted(sequential)
+    assert sorted(grouped_rejections) == sorted(sequential_rejections)
+
+
+@pytest.mark.parametrize("method, args", [("make_sound", ()), ("eat", ("meat",)), ("sleep", (8,)),
+                                          ("regulate_temperature", ()), ("bask", ()), ("shed_skin", ())])
+def test_animal_routines_match(method, args):
+    objects = [Lion("Simba", 5, 190.5, "golden", "large"), Eagle("Hedwig", 3, 6.2, 2.1, 3.0),
+               Snake("Nagini", 8, 45.0, "smooth", True, 4.5), Wandering("Nala", 4, 126.0, "golden")]
+    objects = [obj for obj in objects if hasattr(obj, method)]
+    sequential, batched = RecordingSink(), RecordingSink()
+    with using(sequential):
+        for obj in objects:
+            getattr(obj, method)(*args)
+    with using(batched):
+        dispatch(objects, method, *args, preserve_order=True)
+    assert batched.log == sequential.log
+
+
+def test_dispatch_leaves_the_garbage_collector_on_and_restores_its_thresholds():
+    seen = []
+
+    class Checking(Lion):
+        def move(self):
+            seen.append((gc.isenabled(), gc.get_threshold()[0]))
+
+    thresholds = gc.get_threshold()
+    dispatch([Checking("Simba", 5, 190.5, "golden")], "move")
+    assert seen == [(True, 100_000)]
+    assert gc.get_threshold() == thresholds
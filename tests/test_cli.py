@@ -0,0 +1,50 @@
+import pytest
+
+from event_sink import get_sink, set_rejection_hook, set_sink
+from oop_demos.cli import ScenarioError, main, parse, run
+
+
+def run_lines(*lines):
+    objects = {}
+    run(parse(lines), objects=objects)
+    return objects
+
+
+def test_arguments_follow_the_parameter_types(events):
+    objects = run_lines(
+        'boeing = Plane Boeing 747 2020 "blue and white" 45000 4',
+        "simba = Lion Simba 5 190 golden none",
+        "nagini = Snake Nagini 8 45.5 smooth true 4.5",
+        "boeing.start",
+        "boeing.accelerate 12.5",
+    )
+    boeing, simba, nagini = objects["boeing"], objects["simba"], objects["nagini"]
+    assert (boeing.model, boeing.year, boeing.max_altitude) == ("747", 2020, 45000)
+    assert (simba.weight_kg, simba.mane_size) == (190, None)
+    assert (nagini.weight_kg, nagini.is_venomous, nagini.length) == (45.5, True, 4.5)
+    assert boeing.speed == 12.5
+
+
+@pytest.mark.parametrize("line, reason", [
+    ("tesla = Car Tesla S 2023 red electric four", "doors must be a number"),
+    ("nagini = Snake Nagini 8 45.0 smooth maybe 4.5", "is_venomous must be true or false"),
+    ("simba = Lion Simba 5", "missing"),
+])
+def test_bad_arguments_are_scenario_errors(line, reason):
+    with pytest.raises(ScenarioError, match=reason):
+        run_lines(line)
+
+
+@pytest.fixture
+def restore_sink():
+    sink = get_sink()
+    yield
+    set_sink(sink)
+    set_rejection_hook(None)
+
+
+def test_errors_are_reported_without_a_traceback(tmp_path, capsys, restore_sink):
+    scenario = tmp_path / "bad.txt"
+    scenario.write_text("tesla = Car Tesla S 2023 red electric 4\ntesla.accelerate fast\n")
+    assert main(["--quiet", str(scenario)]) == 1
+    assert capsys.readouterr().err == f"oop-demos: {scenario}:2: speed_increase must be a number, got 'fast'\n"
@@ -0,0 +1,59 @@
+import pytest
+
+from Animal_kingdom_classes import Animal, Bird, Eagle, Lion, Mammal, Reptile, Snake
+from compact_animals import COMPACT_CLASSES, to_compact
+
+COMMON = [("eat", "meat"), ("sleep", 8), ("make_sound",), ("move",), ("advance",)]
+
+CASES = [
+    (Animal, ("Generic", 2, 10.0), []),
+    (Mammal, ("Bessie", 4, 500.0, "brown", False), [("give_birth",), ("regulate_temperature",)]),
+    (Bird, ("Tweety", 1, 0.1, 0.2, True), [("lay_eggs", 3)]),
+    (Reptile, ("Rex", 6, 12.0, "rough", False), [("bask",), ("shed_skin",)]),
+    (Lion, ("Simba", 5, 190.5, "golden", "large"), [("give_birth",), ("hunt", "zebra")]),
+    (Eagle, ("Hedwig", 3, 6.2, 2.1, 3.0), [("lay_eggs", 2), ("hunt_from_above", "rabbit")]),
+    (Snake, ("Nagini", 8, 45.0, "smooth", True, 4.5),
+     [("bask",), ("constrict", "mouse"), ("inject_venom", "rat")]),
+]
+
+
+def _run(animal, calls):
+    """Return str(animal) and the result of each call in order."""
+    animal.velocity = (1.0, 2.0)
+    results = [str(animal)]
+    for name, *args in calls:
+        results.append(getattr(animal, name)(*args))
+    return results + [animal.position]
+
+
+@pytest.mark.parametrize("cls, args, extra", CASES, ids=lambda case: getattr(case, "__name__", ""))
+def test_compact_classes_match_the_regular_ones(events, cls, args, extra):
+    calls = COMMON + extra
+    regular = _run(cls(*args), calls)
+    regular_messages = [event.message for event in events]
+    events.clear()
+    compact = _run(COMPACT_CLASSES[cls](*args), calls)
+    assert compact == regular
+    assert [event.message for event in events] == regular_messages
+
+
+@pytest.mark.parametrize("cls, args, extra", CASES, ids=lambda case: getattr(case, "__name__", ""))
+def test_to_compact_preserves_state(cls, args, extra):
+    animal = cls(*args)
+    animal.age += 1
+    animal.is_alive = False
+    animal.position = (3.0, 4.0)
+    compact = to_compact(animal)
+    assert type(compact) is COMPACT_CLASSES[cls]
+    state = vars(animal)
+    assert {name: getattr(compact, name) for name in state} == state
+    for name in ("species", "body_temperature", "has_feathers", "cold_blooded"):
+        assert getattr(compact, name, None) == getattr(animal, name, None)
+
+
+@pytest.mark.parametrize("cls, args, extra", CASES, ids=lambda case: getattr(case, "__name__", ""))
+def test_compact_instances_have_no_dict(cls, args, extra):
+    compact = COMPACT_CLASSES[cls](*args)
+    assert not hasattr(compact, "__dict__")
+    with pytest.raises(AttributeError):
+        compact.nickname = "Buddy"
@@ -0,0 +1,35 @@
+from array import array
+
+from Animal_kingdom_classes import Eagle, Snake
+from ecosystem import Ecosystem
+
+
+class _Rigged:
+    """Hunters go in order, always pick animal 1 and always succeed."""
+
+    def shuffle(self, items):
+        pass
+
+    def randrange(self, size):
+        return 1
+
+    def random(self):
+        return 0.0
+
+
+def test_hunters_killed_earlier_in_the_step_do_not_count():
+    ecosystem = Ecosystem([Snake("Nagini", 8, 45.0, "smooth", True, 4.5), Eagle("Hedwig", 3, 6.2, 2.1, 3.0)])
+    ecosystem.energy[:] = array("d", [1.0, 1.0])  # Both hungry
+    ecosystem._rng = _Rigged()
+    stats = ecosystem.step()
+    assert stats.inject_venom == 1
+    assert stats.hunts == 1  # The eagle was eaten before its turn
+    assert stats.alive == 1
+
+
+def test_kills_never_exceed_hunts():
+    zoo = [Snake("Kaa", 8, 20.0 + i % 30, "smooth", i % 2 == 0, 4.5) if i % 2 else Eagle("Hedwig", 3, 5.0, 2.1, 3.0)
+           for i in range(400)]
+    for stats in Ecosystem(zoo, seed=3).run(60):
+        kills = stats.hunt + stats.hunt_from_above + stats.constrict + stats.inject_venom
+        assert kills <= stats.hunts <= stats.alive + kills
@@ -0,0 +1,100 @@
+import io
+
+import pytest
+
+from Animal_kingdom_classes import Lion
+from Vehicle_polymorphism_challenge import Car
+from event_sink import (
+    BufferedSink, CallbackSink, ConsoleSink, Event, NullSink, emit, emit_many, emit_rejected, get_sink,
+    set_rejection_hook, using,
+)
+
+
+def event(number):
+    return Event(None, "eat", (number,), f"message {number}")
+
+
+def test_buffered_sink_flushes_to_a_callable_when_full():
+    batches = []
+    sink = BufferedSink(batches.append, capacity=3)
+    for number in range(7):
+        sink.write(event(number))
+    assert [[e.message for e in batch] for batch in batches] == [
+        ["message 0", "message 1", "message 2"], ["message 3", "message 4", "message 5"]]
+    assert len(sink) == 1
+    sink.close()
+    assert batches[-1] == [event(6)] and len(sink) == 0
+
+
+def test_buffered_sink_write_many_splits_at_the_capacity():
+    batches = []
+    sink = BufferedSink(batches.append, capacity=4)
+    sink.write(event(0))
+    sink.write_many([event(number) for number in range(1, 10)])
+    assert [len(batch) for batch in batches] == [4, 4]
+    sink.flush()
+    assert [e.args[0] for batch in batches for e in batch] == list(range(10))
+
+
+def test_buffered_sink_writes_lines_to_a_file():
+    file = io.StringIO()
+    sink = BufferedSink(file, capacity=100)
+    with using(sink):
+        Lion("Simba", 5, 190.5, "golden").eat("meat")
+        emit(None, "note", (), "second line")
+        assert file.getvalue() == ""
+    assert file.getvalue() == "Simba is eating meat.\nsecond line\n"
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        BufferedSink(capacity=0)
+
+
+def test_using_restores_the_sink_even_after_an_exception():
+    outer = get_sink()
+    batches = []
+    sink = BufferedSink(batches.append)
+    with pytest.raises(RuntimeError):
+        with using(sink):
+            emit(None, "eat", (), "inside")
+            assert get_sink() is sink
+            raise RuntimeError
+    assert get_sink() is outer
+    assert [[e.message for e in batch] for batch in batches] == [["inside"]]
+
+
+def test_nested_using_and_emit_many():
+    received = []
+    with using(CallbackSink(received.append)) as outer:
+        with using(NullSink()):
+            emit(None, "eat", (), "dropped")
+        assert get_sink() is outer
+        emit_many([event(1), event(2)])
+    assert [e.message for e in received] == ["message 1", "message 2"]
+
+
+def test_rejections_reach_write_rejected_and_the_hook():
+    class Sink(CallbackSink):
+        def write_rejected(self, event):
+            rejected.append(event.message)
+
+    accepted, rejected, hooked = [], [], []
+    previous = set_rejection_hook(lambda actor, action: hooked.append((actor, action)))
+    car = Car("Tesla", "Model S", 2023, "red", "electric", 4)
+    try:
+        with using(Sink(accepted.append)):
+            car.move()  # Not started: rejected
+            car.start()
+            emit_rejected(car, "honk", (), "custom")
+    finally:
+        assert set_rejection_hook(previous) is not None
+    assert [e.action for e in accepted] == ["start"]
+    assert rejected == ["You need to start the Tesla Model S first.", "custom"]
+    assert hooked == [(car, "move"), (car, "honk")]
+
+
+def test_rejections_fall_back_to_write(capsys):
+    with using(ConsoleSink()):
+        emit_rejected(None, "move", (), "refused")
+    assert capsys.readouterr().out == "refused\n"
@@ -0,0 +1,105 @@
+import asyncio
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Vehicle_polymorphism_challenge import Car
+from event_sink import using
+from fleet_controller import FleetController
+
+
+def make_cars(count):
+    return [Car("Tesla", "Model S", 2023, "red", "electric", 4) for _ in range(count)]
+
+
+def test_commands_run_in_order_per_vehicle(events):
+    async def main():
+        cars = make_cars(3)
+        async with FleetController(cars, max_in_flight=4) as controller:
+            for index in range(3):
+                await controller.submit(index, "start")
+                await controller.submit(index, "accelerate", 10)
+                await controller.submit(index, "accelerate", 5)
+        return cars, controller.stats()
+
+    cars, stats = asyncio.run(main())
+    assert [car.speed for car in cars] == [15, 15, 15]
+    assert stats.completed == stats.submitted == 9 and stats.in_flight == 0
+
+
+def test_cancelled_submit_releases_its_slot(events):
+    release = threading.Event()
+
+    class Stuck:
+        def wait(self):
+            release.wait(5)
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            controller = FleetController([Stuck()], max_in_flight=3, queue_size=1, executor=executor)
+            await controller.submit(0, "wait")
+            await asyncio.sleep(0.05)  # The first command is now running
+            await controller.submit(0, "wait")  # Fills the queue
+            pending = asyncio.ensure_future(controller.submit(0, "wait"))
+            await asyncio.sleep(0.05)  # Waiting in queue.put()
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+            release.set()
+            await controller.join()
+            free = controller._slots._value
+            await controller.close()
+        return free, controller.stats()
+
+    free, stats = asyncio.run(main())
+    assert free == 3
+    assert stats.submitted == stats.completed == 2
+
+
+def test_close_cancels_queued_commands(events):
+    async def main():
+        controller = FleetController(make_cars(1), max_in_flight=10)
+        futures = [await controller.submit(0, "start") for _ in range(5)]
+        await controller.close()
+        return futures, controller.stats()
+
+    futures, stats = asyncio.run(main())
+    assert all(future.done() for future in futures)
+    assert any(future.cancelled() for future in futures)
+    assert stats.in_flight == 0
+
+
+def test_unawaited_failures_are_retrieved(events):
+    async def main():
+        loop = asyncio.get_running_loop()
+        unretrieved = []
+        loop.set_exception_handler(lambda loop, context: unretrieved.append(context))
+        async with FleetController(make_cars(1)) as controller:
+            await controller.submit(0, "no_such_command")
+        gc.collect()
+        return unretrieved
+
+    assert asyncio.run(main()) == []
+
+
+def test_executor_events_reach_the_sink_on_the_loop_thread():
+    threads = []
+
+    class Sink:
+        def write(self, event):
+            threads.append(threading.get_ident())
+
+        def flush(self):
+            pass
+
+    async def main():
+        with ThreadPoolExecutor(4) as executor:
+            async with FleetController(make_cars(20), executor=executor) as controller:
+                for index in range(20):
+                    await controller.submit(index, "start")
+                    await controller.submit(index, "move")
+        return threading.get_ident()
+
+    with using(Sink()):
+        loop_thread = asyncio.run(main())
+    assert len(threads) == 40
+    assert set(threads) == {loop_thread}
@@ -0,0 +1,48 @@
+import pytest
+
+from Vehicle_polymorphism_challenge import Car, Boat, Plane
+from fleet_simulation import FleetSimulation
+
+
+def make_fleet():
+    vehicles, scripts = [], []
+    for index in range(12):
+        if index % 3 == 0:
+            vehicle = Car("Tesla", "Model S", 2023, "red", "electric", 4)
+        elif index % 3 == 1:
+            vehicle = Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5)
+        else:
+            vehicle = Plane("Boeing", "747", 2020, "white", 45000, 4)
+        script = [(0, "start", ()), (1, "accelerate", (40 + index,)), (3, "brake", (10,))]
+        if isinstance(vehicle, Boat):
+            script.append((5, "anchor", ()))
+        if isinstance(vehicle, Plane):
+            script += [(4, "accelerate", (100,)), (5, "take_off", ())]
+        vehicles.append(vehicle)
+        scripts.append(script)
+    return vehicles, scripts
+
+
+def state(vehicles):
+    return [(v.speed, v.is_running, getattr(v, "is_anchored", None), getattr(v, "is_landed", None),
+             getattr(v, "altitude", None)) for v in vehicles]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_run_updates_the_vehicles_it_was_given(workers, events):
+    vehicles, scripts = make_fleet()
+    simulation = FleetSimulation(vehicles, scripts, shards=3, workers=workers, ticks_per_round=2)
+    simulation.run(8)
+    assert all(a is b for a, b in zip(simulation.vehicles, vehicles))
+
+    expected, expected_scripts = make_fleet()
+    for vehicle, script in zip(expected, expected_scripts):
+        for _, command, args in sorted(script, key=lambda step: step[0]):
+            getattr(vehicle, command)(*args)
+    assert state(vehicles) == state(expected)
+
+
+def test_statistics_do_not_depend_on_the_worker_count():
+    serial = FleetSimulation(*make_fleet(), shards=3, workers=0, ticks_per_round=3).run(8)
+    parallel = FleetSimulation(*make_fleet(), shards=3, workers=2, ticks_per_round=3).run(8)
+    assert serial == parallel
@@ -0,0 +1,96 @@
+import copy
+import random
+
+import pytest
+
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane
+from fleet_store import FleetStore
+
+
+def make_fleet():
+    return [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Motorcycle("Harley-Davidson", "Street Glide", 2022, "black", 1868, False),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+    ]
+
+
+def state(vehicle):
+    """The stored attributes with their types, so 5 and 5.0 count as different."""
+    names = ("year", "speed", "is_running", "is_anchored", "is_landed", "altitude", "max_altitude")
+    return [(name, getattr(vehicle, name), type(getattr(vehicle, name))) for name in names if hasattr(vehicle, name)]
+
+
+def drive(fleet, events):
+    del events[:]
+    for method, args in [("start", ()), ("accelerate", (2.5,)), ("accelerate", (2.5,)), ("brake", (1,)),
+                         ("accelerate", (150,)), ("brake", (0.5,)), ("brake", (1000,)), ("accelerate", (130,))]:
+        for vehicle in fleet:
+            getattr(vehicle, method)(*args)
+    fleet[3].take_off()
+    fleet[3].change_altitude(250.5)
+    fleet[3].change_altitude(-0.5)
+    return [event.message for event in events]
+
+
+def test_views_behave_like_plain_vehicles(events):
+    plain, stored = make_fleet(), make_fleet()
+    FleetStore(stored)
+    assert drive(plain, events) == drive(stored, events)
+    for before, after in zip(plain, stored):
+        assert state(before) == state(after)
+        assert str(before) == str(after)
+
+
+def test_views_refuse_what_cannot_be_stored_exactly():
+    car = make_fleet()[0]
+    FleetStore([car])
+    with pytest.raises(TypeError):
+        car.speed = "fast"
+    with pytest.raises(OverflowError):
+        car.speed = 2 ** 60
+
+
+@pytest.mark.parametrize("year", ["2023", None, True, 2 ** 60, 2023.0])
+def test_views_keep_any_year_a_plain_vehicle_accepts(year):
+    car, plane = make_fleet()[0], make_fleet()[3]
+    car.year = year
+    store = FleetStore([car, plane])
+    assert car.year == year and type(car.year) is type(year)
+    plane.year = year
+    assert plane.year == year and type(plane.year) is type(year)
+    car.year = plane.year = 2020
+    assert (car.year, plane.year) == (2020, 2020) and list(store.year) == [2020, 2020]
+    assert "year" not in vars(car)
+
+
+@pytest.mark.parametrize("delta", [3, 2.5, 40, 0.25])
+def test_whole_fleet_operations_match_per_vehicle_calls(delta, events):
+    rng = random.Random(7)
+    plain = []
+    for _ in range(60):
+        vehicle = make_fleet()[rng.randrange(4)]
+        vehicle.speed = rng.choice([0, 10, 2.5, 80])
+        vehicle.is_running = rng.random() < 0.7
+        plain.append(vehicle)
+    stored = [copy.copy(vehicle) for vehicle in plain]
+    store = FleetStore(stored)
+    mask = [i % 3 != 0 for i in range(len(plain))]
+
+    store.accelerate(delta, mask=mask)
+    store.brake(delta * 3)
+    store.accelerate(delta)
+    for vehicle, chosen in zip(plain, mask):
+        if vehicle.is_running:
+            if chosen:
+                vehicle.accelerate(delta)
+            vehicle.brake(delta * 3)
+            vehicle.accelerate(delta)
+    assert [state(vehicle) for vehicle in plain] == [state(vehicle) for vehicle in stored]
+
+    store.stop()
+    for vehicle in plain:
+        if vehicle.is_running:
+            vehicle.stop()
+    assert [state(vehicle) for vehicle in plain] == [state(vehicle) for vehicle in stored]
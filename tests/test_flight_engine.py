@@ -0,0 +1,50 @@
+import random
+
+from Vehicle_polymorphism_challenge import Plane
+from fleet_store import FleetStore
+from flight_engine import FlightEngine
+from vehicle_transitions import CHANGE_ALTITUDE, LAND, SKIPPED, TAKE_OFF, check
+
+
+def random_planes(rng, count):
+    planes = []
+    for _ in range(count):
+        plane = Plane("Boeing", "747", 2020, "white", 45000, 4)
+        plane.is_running = rng.random() < 0.8
+        plane.speed = rng.choice([0, 100, 119, 120, 150.5])
+        if rng.random() < 0.5:
+            plane.is_landed, plane.altitude = False, rng.choice([1000, 20000, 44999])
+        planes.append(plane)
+    return planes
+
+
+def state(plane):
+    return [(getattr(plane, name), type(getattr(plane, name)))
+            for name in ("is_running", "is_landed", "speed", "altitude")]
+
+
+def test_engine_matches_the_plane_methods(events):
+    rng = random.Random(4)
+    plain = random_planes(rng, 300)
+    stored = random_planes(random.Random(4), 300)
+    engine = FlightEngine(FleetStore(stored))
+    seen = set()
+    for command, method in ((TAKE_OFF, "take_off"), (CHANGE_ALTITUDE, "change_altitude"), (LAND, "land"),
+                            (TAKE_OFF, "take_off"), (CHANGE_ALTITUDE, "change_altitude")):
+        if command == CHANGE_ALTITUDE:
+            changes = [rng.choice([-50000, -999, 0, 500, 0.5, 30000]) for _ in plain]
+            expected = [check(plane, command, change) for plane, change in zip(plain, changes)]
+            for plane, change in zip(plain, changes):
+                plane.change_altitude(change)
+            codes = engine.change_altitude(changes)
+        else:
+            mask = [rng.random() < 0.9 for _ in plain]
+            expected = [check(plane, command) if chosen else SKIPPED for plane, chosen in zip(plain, mask)]
+            for plane, chosen in zip(plain, mask):
+                if chosen:
+                    getattr(plane, method)()
+            codes = getattr(engine, method)(mask)
+        assert list(codes) == expected
+        seen.update(codes)
+        assert [state(plane) for plane in engine.planes()] == [state(plane) for plane in plain]
+    assert len(seen) == 8  # Every outcome of the three commands, and SKIPPED, came up
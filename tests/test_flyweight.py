@@ -0,0 +1,39 @@
+from Animal_kingdom_classes import Lion, Snake
+from Vehicle_polymorphism_challenge import Car
+from flyweight import (FlyweightCar, FlyweightMammal, FlyweightReptile, MammalSpec, ReptileSpec,
+                       to_flyweight)
+
+
+def test_equal_values_of_different_spec_classes_stay_apart():
+    mammal = FlyweightMammal("Rex", 3, 20.0, "brown", False)
+    reptile = FlyweightReptile("Kaa", 3, 20.0, "brown", False)
+    assert type(mammal.spec) is MammalSpec
+    assert type(reptile.spec) is ReptileSpec
+    assert reptile.scale_type == "brown"
+    assert mammal.fur_color == "brown"
+
+
+def test_instances_with_the_same_values_share_one_spec():
+    first = FlyweightCar("Tesla", "Model S", 2023, "red", "electric", 4)
+    second = to_flyweight(Car("Tesla", "Model S", 2023, "red", "electric", 4))
+    assert first.spec is second.spec
+    second.color = "blue"
+    assert first.color == "red" and second.color == "blue"
+
+
+def test_flyweights_emit_the_same_events_as_the_regular_classes(events):
+    regular = [Lion("Simba", 5, 190.5, "golden", "large"), Snake("Nagini", 8, 45.0, "smooth", True, 4.5)]
+    for animal in regular + [to_flyweight(animal) for animal in regular]:
+        animal.move()
+        animal.make_sound()
+        animal.eat("meat")
+    messages = [event.message for event in events]
+    assert messages[:len(messages) // 2] == messages[len(messages) // 2:]
+
+
+def test_equal_values_of_different_types_stay_apart():
+    whole = FlyweightCar("Tesla", "Model S", 2023, "red", "electric", 4)
+    decimal = FlyweightCar("Tesla", "Model S", 2023.0, "red", "electric", 4)
+    assert whole.spec is not decimal.spec
+    assert str(whole) == str(Car("Tesla", "Model S", 2023, "red", "electric", 4))
+    assert str(decimal) == str(Car("Tesla", "Model S", 2023.0, "red", "electric", 4))
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+
+import pytest
+
+from Vehicle_polymorphism_challenge import Car
+from ingestion import build, ingest, read_csv, read_jsonl
+
+CAR = {"type": "car", "make": "Tesla", "model": "Model S", "year": "2023", "color": "red",
+       "fuel_type": "electric", "doors": "4"}
+SNAKE = {"type": "snake", "name": "Nagini", "age": 8, "weight_kg": 45.0, "scale_type": "smooth",
+         "is_venomous": "yes", "length": 4.5}
+
+
+def test_valid_rows_build_objects():
+    car = build(CAR)
+    assert isinstance(car, Car) and car.year == 2023 and car.doors == 4
+    assert build(dict(CAR, year=2023.0)).year == 2023
+
+
+@pytest.mark.parametrize("row, reason", [
+    (dict(CAR, doors="4.5"), "doors"),
+    (dict(CAR, doors=4.5), "doors"),
+    (dict(CAR, year=True), "year"),
+    (dict(CAR, make=""), "missing field make"),
+    (dict(CAR, type="hovercraft"), "unknown type"),
+    (dict(SNAKE, weight_kg="nan"), "weight_kg"),
+    (dict(SNAKE, length=float("inf")), "length"),
+    (dict(SNAKE, weight_kg=-3), "weight_kg"),
+    (dict(SNAKE, age=-1), "age"),
+    (dict(SNAKE, is_venomous="maybe"), "is_venomous"),
+])
+def test_invalid_rows_are_rejected(row, reason):
+    with pytest.raises(ValueError, match=reason):
+        build(row)
+
+
+@pytest.fixture
+def small_csv_fields():
+    limit = csv.field_size_limit(50)
+    yield
+    csv.field_size_limit(limit)
+
+
+def test_malformed_csv_lines_are_reported_per_row(small_csv_fields):
+    header = ",".join(CAR)
+    dump = io.StringIO("\n".join([
+        header,
+        ",".join(CAR.values()),
+        "car,Tesla," + "x" * 100 + ",2023,red,electric,4",
+        "car,Mini,Cooper,2019,green,petrol,zero",
+        ",".join(CAR.values()),
+    ]) + "\n")
+    rejected = []
+    loaded = list(ingest(read_csv(dump), on_error=rejected.append))
+    assert len(loaded) == 2
+    assert [error.line for error in rejected] == [3, 4]
+    assert "unreadable CSV" in rejected[0].reason
+
+
+def test_jsonl_lines_that_are_not_objects_are_reported():
+    dump = io.StringIO(json.dumps(CAR) + "\n[1, 2]\n{broken\n" + json.dumps(SNAKE) + "\n")
+    rejected = []
+    loaded = list(ingest(read_jsonl(dump), on_error=rejected.append))
+    assert len(loaded) == 2
+    assert [(error.line, error.reason) for error in rejected] == [(2, "not a JSON object"), (3, "not a JSON object")]
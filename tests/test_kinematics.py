@@ -0,0 +1,39 @@
+import pytest
+
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane
+from kinematics import drive, profile, route_costs
+
+
+def make_fleet():
+    return [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Car("Toyota", "Corolla", 2020, "white", None, 4),
+        Motorcycle("Harley-Davidson", "Street Glide", 2022, "black", 1868, True),
+        Motorcycle("Homemade", "Pushbike", 2022, "black", 0, False),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+    ]
+
+
+def test_missing_fuel_type_gets_the_default_car_profile():
+    assert profile(make_fleet()[1]) == profile(Car("Toyota", "Corolla", 2020, "white", "gasoline", 4))
+
+
+@pytest.mark.parametrize("adaptive", [False, True])
+@pytest.mark.parametrize("distance_km", [0.05, 3, 250])
+def test_route_costs_match_drive(adaptive, distance_km):
+    fleet = make_fleet()
+    costs = route_costs(fleet, distance_km, adaptive=adaptive)
+    for i, vehicle in enumerate(fleet):
+        cost, _ = drive(profile(vehicle), distance_km, adaptive=adaptive)
+        assert costs.time_s[i] == pytest.approx(cost.time_s, rel=1e-9)
+        assert costs.fuel[i] == pytest.approx(cost.fuel, rel=1e-9)
+        assert costs.fuel_units[i] == cost.fuel_unit
+
+
+def test_vehicles_that_cannot_move_cost_nothing():
+    fleet = make_fleet()
+    stuck = route_costs(fleet, 10, cruise_kmh=0)
+    assert list(stuck.time_s) == [0.0] * len(fleet)
+    assert list(stuck.fuel) == [0.0] * len(fleet)
+    assert route_costs(fleet[3:4], 10).time_s[0] == drive(profile(fleet[3]), 10)[0].time_s == 0.0
@@ -0,0 +1,44 @@
+import gc
+
+from Animal_kingdom_classes import Lion
+from compact_animals import CompactLion
+import observers
+from observers import watch, unwatch
+
+
+def test_callbacks_see_every_assignment():
+    changes = []
+    lion = Lion("Simba", 5, 190.5, "golden", "large")
+    callback = lambda obj, name, old, new: changes.append((name, old, new))  # noqa: E731
+    watch(lion, callback)
+    lion.age = 6
+    unwatch(lion, callback)
+    lion.age = 7
+    assert changes == [("age", 5, 6)]
+    assert type(lion) is Lion
+
+
+def test_slotted_objects_can_be_watched():
+    changes = []
+    lion = CompactLion("Simba", 5, 190.5, "golden", "large")
+    callback = lambda obj, name, old, new: changes.append(name)  # noqa: E731
+    watch(lion, callback)
+    lion.weight_kg = 200.0
+    unwatch(lion, callback)
+    assert changes == ["weight_kg"]
+    assert id(lion) not in observers._callbacks
+
+
+def test_watching_does_not_keep_objects_alive():
+    changes = []
+    lion = Lion("Simba", 5, 190.5, "golden", "large")
+    watch(lion, lambda obj, name, old, new: changes.append(obj.name))
+    key = id(lion)
+    del lion
+    gc.collect()
+    assert key not in observers._callbacks
+    # Whatever object gets the same id next is not notified
+    for _ in range(1000):
+        other = Lion("Nala", 4, 126.0, "golden")
+        other.age = 5
+    assert changes == []
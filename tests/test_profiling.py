@@ -0,0 +1,59 @@
+import pytest
+
+from Animal_kingdom_classes import Lion
+from Vehicle_polymorphism_challenge import Plane
+from event_sink import set_rejection_hook
+import profiling
+
+
+def test_same_named_classes_are_recorded_apart(events):
+    class Animals:
+        class Lion(Lion):
+            pass
+
+    profiling.reset()
+    with profiling.profiled():
+        Lion("Simba", 5, 190.5, "golden").eat("meat")
+        Animals.Lion("Scar", 9, 170.0, "dark").eat("meat")
+        Animals.Lion("Scar", 9, 170.0, "dark").eat("meat")
+    stats = profiling.stats()
+    profiling.reset()
+    assert stats["oop_demos.animals.Lion.eat"].calls == 1
+    local = f"{__name__}.test_same_named_classes_are_recorded_apart.<locals>.Animals.Lion.eat"
+    assert stats[local].calls == 2
+
+
+def test_rejected_calls_are_counted_and_reach_the_previous_hook(events):
+    seen = []
+    previous = set_rejection_hook(lambda actor, action: seen.append(action))
+    boeing = Plane("Boeing", "747", 2020, "white", 45000, 4)
+    profiling.reset()
+    try:
+        with profiling.profiled():
+            boeing.move()
+            boeing.change_altitude(500)
+            boeing.start()
+            boeing.move()
+    finally:
+        set_rejection_hook(previous)
+    stats = profiling.stats()
+    profiling.reset()
+    assert stats["oop_demos.vehicles.Plane.move"][:2] == (2, 2)
+    assert stats["oop_demos.vehicles.Plane.change_altitude"][:2] == (1, 1)
+    assert stats["oop_demos.vehicles.Plane.start"][:2] == (1, 0)
+    assert seen == ["move", "change_altitude", "move"]
+
+
+def test_disable_restores_the_original_methods():
+    before = {cls: dict(vars(cls)) for cls in profiling.CLASSES}
+    hook = set_rejection_hook(None)
+    set_rejection_hook(hook)
+    profiling.enable()
+    assert profiling.is_enabled() and Lion.move is not before[Lion]["move"]
+    with pytest.raises(RuntimeError):
+        profiling.enable()
+    profiling.disable()
+    assert not profiling.is_enabled()
+    assert {cls: dict(vars(cls)) for cls in profiling.CLASSES} == before
+    assert set_rejection_hook(hook) is hook
+    profiling.reset()
@@ -0,0 +1,81 @@
+import io
+import json
+
+from Animal_kingdom_classes import Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Vehicle, Car, Boat, Plane
+from compact_animals import to_compact
+from flyweight import to_flyweight
+from ingestion import SCHEMAS, ingest, read_csv, read_jsonl
+import report
+from report import write_report
+
+
+def population():
+    objects = [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Lion("Simba", 5, 190.5, "golden", "large"),
+        Eagle("Hedwig", 3, 6.2, 2.1, 3.0),
+        Snake("Nagini", 8, 45.0, "smooth", True, 4.5),
+    ]
+    objects[0].is_running, objects[0].speed = True, 60
+    return objects + [to_compact(objects[3]), to_flyweight(objects[0])]
+
+
+def constructor_values(obj, kind):
+    return [getattr(obj, name) for name, _ in SCHEMAS[kind][1]]
+
+
+def test_csv_and_jsonl_reports_load_back():
+    objects = population()
+    kinds = ["car", "plane", "boat", "lion", "eagle", "snake", "lion", "car"]
+    for format, reader in (("csv", read_csv), ("jsonl", read_jsonl)):
+        file = io.StringIO()
+        assert write_report(objects, file, format) == len(objects)
+        file.seek(0)
+        rejected = []
+        loaded = list(ingest(reader(file), on_error=rejected.append))
+        assert rejected == []
+        assert [type(obj) for obj in loaded] == [SCHEMAS[kind][0] for kind in kinds]
+        assert [constructor_values(obj, kind) for obj, kind in zip(loaded, kinds)] == \
+            [constructor_values(obj, kind) for obj, kind in zip(objects, kinds)]
+
+
+def test_text_report_matches_str():
+    objects = population()
+    file = io.StringIO()
+    write_report(objects, file, chunk_size=3)
+    assert file.getvalue() == "".join(f"{obj}\n" for obj in objects)
+
+
+def test_jsonl_has_no_bare_nan_or_infinity():
+    lion, eagle = Lion("Simba", 5, 190.5, "golden", "large"), Eagle("Hedwig", 3, 6.2, 2.1, 3.0)
+    lion.weight_kg, eagle.wingspan = float("nan"), float("inf")
+    file = io.StringIO()
+    write_report([lion, eagle], file, "jsonl")
+
+    def reject(constant):
+        raise ValueError(constant)
+
+    rows = [json.loads(line, parse_constant=reject) for line in file.getvalue().splitlines()]
+    assert rows[0]["weight_kg"] is None and rows[1]["wingspan"] is None
+
+
+def test_type_follows_the_class_hierarchy_not_the_name():
+    class RaceCar(Car):
+        pass
+
+    class SportsCar(Vehicle):
+        pass
+
+    class Kart(Vehicle):
+        pass
+
+    assert report._kind(RaceCar) == "car"
+    assert report._kind(SportsCar) == "sportscar"
+    report.register_kind(Kart, "car")
+    try:
+        assert report._kind(Kart) == "car"
+    finally:
+        del report._KINDS[Kart]
@@ -0,0 +1,59 @@
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane
+from fleet_store import FleetStore
+from shared_fleet import SharedFleetReader, SharedFleetStore
+
+
+def make_fleet():
+    return [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Motorcycle("Harley-Davidson", "Street Glide", 2022, "black", 1868, False),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+    ]
+
+
+def state(vehicle):
+    names = ("year", "speed", "is_running", "is_anchored", "is_landed", "altitude", "max_altitude")
+    return [(name, getattr(vehicle, name), type(getattr(vehicle, name))) for name in names if hasattr(vehicle, name)]
+
+
+def drive(fleet, store=None):
+    for vehicle in fleet:
+        vehicle.start()
+        vehicle.accelerate(130)
+    fleet[2].anchor()
+    fleet[3].take_off()
+    fleet[3].change_altitude(2500.5)
+    if store is None:
+        for vehicle in fleet:
+            vehicle.brake(10.5)
+        fleet[0].stop()
+    else:
+        store.brake(10.5)
+        store.stop(mask=[True, False, False, False])
+    return [str(vehicle) for vehicle in fleet]
+
+
+def test_shared_store_matches_plain_and_private_stores(events):
+    plain, private, shared = make_fleet(), make_fleet(), make_fleet()
+    with SharedFleetStore(shared, capacity=8) as store:
+        lines = drive(plain)
+        assert drive(private, FleetStore(private)) == lines
+        assert drive(shared, store) == lines
+        for before, stored, in_shared in zip(plain, private, shared):
+            assert state(stored) == state(before)
+            assert state(in_shared) == state(before)
+
+
+def test_readers_see_published_ticks_only(events):
+    fleet = make_fleet()
+    with SharedFleetStore(fleet, capacity=8) as store, SharedFleetReader(store.name) as reader:
+        for vehicle in fleet:
+            vehicle.start()
+        store.accelerate(50)
+        assert reader.read(lambda view: (view.count, list(view.speed))) == (4, [0.0] * 4)
+        tick = store.publish()
+        assert reader.read(lambda view: (view.tick, list(view.speed))) == (tick, [50.0] * 4)
+        store.brake(20)
+        assert fleet[0].speed == 30
+        assert reader.read(lambda view: list(view.speed)) == [50.0] * 4
@@ -0,0 +1,68 @@
+import pytest
+
+from Animal_kingdom_classes import Lion, Eagle, Snake
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane
+from snapshot import LAYOUTS, load, save
+
+
+def population():
+    objects = [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Motorcycle("Ducati", "Monster", 2022, "red", 937, True),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+        Lion("Simba", 5, 190.5, "golden"),
+        Eagle("Hedwig", 3, 6.2, 2.1, 3.0),
+        Snake("Nagini", 8, 45.0, "smooth", True, 4.5),
+    ]
+    objects[0].is_running, objects[0].speed = True, 60.5
+    objects[3].is_landed, objects[3].altitude = False, 30000
+    objects[4].position, objects[4].velocity = (1.5, -2.0), (0.5, 0.0)
+    objects[6].is_alive = False
+    return objects
+
+
+def saved_state(obj):
+    flags, strings, numbers = LAYOUTS[type(obj)]
+    names = [name for name in flags + strings + numbers if name not in ("x", "y", "vx", "vy")]
+    state = {name: getattr(obj, name) for name in names}
+    if hasattr(obj, "position"):
+        state["position"], state["velocity"] = obj.position, obj.velocity
+    return state
+
+
+def test_snapshot_round_trip(tmp_path):
+    objects = population()
+    path = str(tmp_path / "population.snap")
+    assert save(path, objects) == len(objects)
+    with load(path) as snapshot:
+        loaded = list(snapshot)
+    assert [type(obj) for obj in loaded] == [type(obj) for obj in objects]
+    for original, copy in zip(objects, loaded):
+        assert saved_state(copy) == saved_state(original)
+        assert [type(value) for value in saved_state(copy).values()] == \
+            [type(value) for value in saved_state(original).values()]
+        assert str(copy) == str(original)
+
+
+@pytest.mark.parametrize("year", [2 ** 53 + 1, -2 ** 60])
+def test_ints_a_float64_cannot_hold_are_rejected(tmp_path, year):
+    path = tmp_path / "fleet.snap"
+    objects = population()
+    objects[3].year = year
+    with pytest.raises(ValueError, match="Plane.year"):
+        save(str(path), objects)
+    assert not path.exists()
+    objects[3].year = 2 ** 53
+    save(str(path), objects)
+    with load(str(path)) as snapshot:
+        assert snapshot[3].year == 2 ** 53
+
+
+def test_non_string_text_fields_are_rejected(tmp_path):
+    path = tmp_path / "fleet.snap"
+    objects = population()
+    objects[3].model = 747
+    with pytest.raises(ValueError, match="Plane.model"):
+        save(str(path), objects)
+    assert not path.exists()
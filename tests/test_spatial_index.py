@@ -0,0 +1,47 @@
+import random
+
+from Animal_kingdom_classes import Lion, Eagle
+from spatial_index import SpatialIndex, brute_force_within
+
+
+def make_zoo(count=400, seed=5):
+    rng = random.Random(seed)
+    zoo = []
+    for i in range(count):
+        animal = Eagle("Hedwig", 3, 6.2, 2.1, 3.0) if i % 4 == 0 else Lion("Simba", 5, 190.5, "golden")
+        animal.position = (rng.uniform(-20, 20), rng.uniform(-20, 20))
+        animal.velocity = (rng.uniform(-1, 1), rng.uniform(-1, 1))
+        zoo.append(animal)
+    return zoo
+
+
+def test_range_queries_match_a_scan_after_moves(events):
+    zoo = make_zoo()
+    rng = random.Random(1)
+    with SpatialIndex(zoo, cell_size=3.0) as index:
+        for _ in range(5):
+            for animal in zoo:
+                animal.move()
+            for _ in range(20):
+                center, radius = (rng.uniform(-25, 25), rng.uniform(-25, 25)), rng.uniform(0.5, 8)
+                found = {id(animal) for animal in index.within(center, radius)}
+                assert found == {id(animal) for animal in brute_force_within(zoo, center, radius)}
+
+
+def test_close_stops_following_the_animals():
+    zoo = make_zoo(20)
+    classes = [type(animal) for animal in zoo]
+    with SpatialIndex(zoo) as index:
+        pass
+    assert [type(animal) for animal in zoo] == classes
+    assert len(index) == 0 and index.within((0, 0), 100) == []
+
+
+def test_adding_an_animal_twice_indexes_it_once():
+    lion = make_zoo(2)[1]
+    index = SpatialIndex([lion])
+    index.add(lion)
+    assert len(index) == 1 and index.within(lion.position, 1) == [lion]
+    index.remove(lion)
+    assert len(index) == 0 and index.within(lion.position, 1) == []
+    assert type(lion) is Lion
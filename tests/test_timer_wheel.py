@@ -0,0 +1,84 @@
+import gc
+import random
+
+from timer_wheel import TimerWheel
+
+
+class Pinger:
+    def __init__(self, log, wheel, number):
+        self.log, self.wheel, self.number = log, wheel, number
+
+    def ping(self, *args):
+        self.log.append((self.wheel.now, self.number))
+
+
+def test_wheel_matches_a_reference_schedule():
+    rng = random.Random(1)
+    log = []
+    wheel = TimerWheel(now=rng.randrange(100_000))
+    start = wheel.now
+    expected = []
+    timers = []
+    for number in range(500):
+        delay = rng.choice([rng.randrange(300), rng.randrange(70_000), rng.randrange(20_000_000)])
+        every = rng.choice([None, None, rng.randrange(1000, 500_000)])
+        timers.append((wheel.schedule(Pinger(log, wheel, number), "ping", delay=delay, every=every),
+                       start + delay, every))
+    cancelled = set(rng.sample(range(len(timers)), 50))
+    end = start + 30_000_000
+    for number, (timer, due, every) in enumerate(timers):
+        if number in cancelled:
+            assert wheel.cancel(timer)
+            continue
+        while due < end:
+            expected.append((due, number))
+            if not every:
+                break
+            due += every
+    while wheel.now < end:
+        wheel.advance(min(end - wheel.now, rng.choice([1, 7, 255, 256, 1000, 70_000, 3_000_000])))
+    assert sorted(log) == sorted(expected)
+    assert [tick for tick, _ in log] == sorted(tick for tick, _ in log)
+
+
+def test_unhashable_arguments_do_not_lose_the_other_timers():
+    log = []
+    wheel = TimerWheel()
+    pingers = [Pinger(log, wheel, number) for number in range(4)]
+    wheel.schedule(pingers[0], "ping", "zebra")
+    wheel.schedule(pingers[1], "ping", ["zebra"])
+    wheel.schedule_many(pingers[2:], "ping", {"prey": "zebra"})
+    assert wheel.advance(1) == 4
+    assert sorted(log) == [(0, 0), (0, 1), (0, 2), (0, 3)]
+
+
+def test_calls_scheduled_for_now_by_a_callback_fire_in_the_same_tick():
+    log = []
+    wheel = TimerWheel()
+
+    class Chain:
+        def go(self):
+            log.append(("go", wheel.now))
+            wheel.schedule(self, "then")
+
+        def then(self):
+            log.append(("then", wheel.now))
+
+    wheel.schedule(Chain(), "go", delay=5)
+    assert wheel.advance(300) == 2
+    assert log == [("go", 5), ("then", 5)]
+    assert len(wheel) == 0
+
+
+def test_schedule_many_leaves_the_garbage_collector_on():
+    seen = []
+
+    def targets():
+        for number in range(3):
+            seen.append(gc.isenabled())
+            yield number
+
+    thresholds = gc.get_threshold()
+    TimerWheel().schedule_many(targets(), "bit_length")
+    assert seen == [True] * 3
+    assert gc.get_threshold() == thresholds
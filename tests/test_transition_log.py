@@ -0,0 +1,107 @@
+from itertools import count
+
+import pytest
+
+from Vehicle_polymorphism_challenge import Car, Boat, Plane
+from event_sink import using
+from transition_log import (
+    ACCELERATE, START, TransitionLog, capture, compact, read_records, replay, restore, snapshots,
+)
+
+
+def make_fleet():
+    return [
+        Car("Tesla", "Model S", 2023, "red", "electric", 4),
+        Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5),
+        Plane("Boeing", "747", 2020, "blue and white", 45000, 4),
+    ]
+
+
+def typed(state):
+    return [[(value, type(value)) for value in column] for column in state[1:]]
+
+
+def drive(fleet):
+    car, boat, plane = fleet
+    car.move()  # Rejected: not logged
+    car.start()
+    car.accelerate(60)
+    boat.start()
+    boat.anchor()
+    plane.start()
+    plane.accelerate(150)
+    plane.take_off()
+    plane.change_altitude(2500.5)
+    car.brake(20)
+    boat.raise_anchor()
+    boat.accelerate(12.5)
+    plane.land()
+    car.stop()
+
+
+class _Recorder:
+    def __init__(self, fleet, states):
+        self.fleet, self.states, self.ticks = fleet, states, count(1)
+
+    def write(self, event):
+        self.states[next(self.ticks)] = capture(self.fleet)
+
+    def write_rejected(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def recorded(tmp_path, events):
+    """A fleet driven through a log with a snapshot every 4 records; yields (directory, fleet, states)."""
+    fleet = make_fleet()
+    ticks = count()
+    states = {}  # Timestamp of the last record -> the fleet's state after it
+    with TransitionLog(str(tmp_path), fleet, snapshot_every=4, clock=lambda: next(ticks), buffer_records=3) as log:
+        with using(log):
+            drive(fleet)
+    # Re-drive plain vehicles one record at a time to know the state at every timestamp
+    plain = make_fleet()
+    with using(_Recorder(plain, states)):
+        drive(plain)
+    yield str(tmp_path), fleet, states
+
+
+def test_records_hold_the_accepted_transitions(recorded):
+    directory, _, _ = recorded
+    records = list(read_records(directory))
+    assert len(records) == 13
+    assert records[0][1:] == (0, START, 0.0)
+    assert records[1][1:] == (0, ACCELERATE, 60.0)
+    assert [timestamp for timestamp, *_ in records] == list(range(1, 14))
+
+
+def test_replay_matches_the_live_fleet(recorded):
+    directory, fleet, _ = recorded
+    assert typed(replay(directory)) == typed(capture(fleet))
+
+
+def test_replay_at_a_timestamp(recorded):
+    directory, _, states = recorded
+    for timestamp, state in states.items():
+        assert typed(replay(directory, timestamp)) == typed(state)
+
+
+def test_replay_after_compact(recorded):
+    directory, fleet, states = recorded
+    assert compact(directory, 9) == 8
+    assert [info.index for info in snapshots(directory)] == [8, 12]
+    for timestamp in range(9, 14):
+        assert typed(replay(directory, timestamp)) == typed(states[timestamp])
+    with pytest.raises(ValueError):
+        replay(directory, 5)
+    assert typed(replay(directory)) == typed(capture(fleet))
+
+
+def test_restore_applies_a_replayed_state(recorded):
+    directory, fleet, states = recorded
+    copy = make_fleet()
+    restore(copy, replay(directory, 7))
+    assert typed(capture(copy)) == typed(states[7])
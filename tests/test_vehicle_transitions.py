@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from Vehicle_polymorphism_challenge import Car, Motorcycle, Boat, Plane
+from event_sink import set_rejection_hook
+from vehicle_transitions import UNSUPPORTED, WRONG_ARGUMENTS, validate
+
+COMMANDS = {
+    Car: ["start", "stop", "move", "accelerate", "brake"],
+    Motorcycle: ["start", "stop", "move", "accelerate", "brake"],
+    Boat: ["start", "stop", "move", "accelerate", "brake", "anchor", "raise_anchor"],
+    Plane: ["start", "stop", "move", "accelerate", "brake", "take_off", "land", "change_altitude"],
+}
+ARGUMENTS = {
+    "accelerate": lambda rng: (rng.choice([10, 60, 125.5]),),
+    "brake": lambda rng: (rng.choice([5, 40.5, 500]),),
+    "change_altitude": lambda rng: (rng.choice([-60000, -500, 800.5, 20000, 50000]),),
+}
+
+
+def make_vehicle(cls):
+    if cls is Car:
+        return Car("Tesla", "Model S", 2023, "red", "electric", 4)
+    if cls is Motorcycle:
+        return Motorcycle("Harley-Davidson", "Street Glide", 2022, "black", 1868, False)
+    if cls is Boat:
+        return Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5)
+    return Plane("Boeing", "747", 2020, "blue and white", 45000, 4)
+
+
+def random_script(rng, cls, length):
+    names = [rng.choice(COMMANDS[cls]) for _ in range(length)]
+    return [(tick, name, ARGUMENTS[name](rng) if name in ARGUMENTS else ()) for tick, name in enumerate(names)]
+
+
+def first_rejection(vehicle, script):
+    """Run a script on a vehicle; return the step of the first rejected command, or None."""
+    rejected = []
+    previous = set_rejection_hook(lambda actor, action: rejected.append(action))
+    try:
+        for step, (_, name, args) in enumerate(script):
+            getattr(vehicle, name)(*args)
+            if rejected:
+                return step
+    finally:
+        set_rejection_hook(previous)
+    return None
+
+
+def test_validate_agrees_with_running_the_scripts(events):
+    rng = random.Random(2)
+    classes = [rng.choice(list(COMMANDS)) for _ in range(400)]
+    vehicles = [make_vehicle(cls) for cls in classes]
+    scripts = [random_script(rng, cls, rng.randrange(1, 12)) for cls in classes]
+    violations = validate(vehicles, scripts)
+    assert 0 < len(violations) < len(vehicles)
+    for index, (vehicle, script) in enumerate(zip(vehicles, scripts)):
+        step = first_rejection(vehicle, script)
+        violation = violations.get(index)
+        assert (violation.step if violation else None) == step, (type(vehicle).__name__, script)
+
+
+def test_unknown_commands_are_unsupported():
+    violations = validate([make_vehicle(Car)], [[(0, "start", ()), (1, "fly", ())]])
+    assert violations[0].step == 1 and violations[0].outcome == UNSUPPORTED
+
+
+@pytest.mark.parametrize("command, args", [("accelerate", ()), ("brake", ()), ("change_altitude", ()),
+                                           ("accelerate", (10, 20)), ("start", (1,))])
+def test_commands_with_the_wrong_number_of_arguments_are_reported(command, args):
+    script = [(0, "start", ()), (1, "accelerate", (130,)), (2, "take_off", ()), (3, command, args)]
+    violations = validate([make_vehicle(Plane)], [script])
+    assert violations[0].step == 3 and violations[0].outcome == WRONG_ARGUMENTS
@@ -0,0 +1,279 @@
+"""Hierarchical timing wheel for recurring and one-shot animal routines.
+
+A TimerWheel schedules method calls such as eat, sleep, bask, shed_skin and
+regulate_temperature on a simulated clock that counts whole ticks (minutes
+by default). Timers sit in a hierarchy of wheels of 256 slots each: level 0
+holds the timers due within the next 256 ticks, one slot per tick; level 1
+those due within 256 * 256 ticks, one slot per 256 ticks; and so on. A
+slot is a dict, so scheduling a timer and cancelling it are each O(1),
+whatever the number of pending timers.
+
+When the clock enters a new 256-tick window, the level-1 slot for that
+window is emptied into level 0 (and likewise further up), so each timer
+moves down at most once per level. The timers due on a tick are fired as
+a batch: they are grouped by method and arguments (by the identity of the
+arguments tuple when it holds unhashable values, such as a list) and passed
+to batch_dispatch.dispatch(), which builds all of their events in one go.
+Stretches of ticks with nothing due are skipped a whole window at a time,
+so fast-forwarding months of mostly idle minutes takes little time.
+"""
+from batch_dispatch import _collecting_less, dispatch
+
+SLOT_BITS = 8
+SLOTS = 1 << SLOT_BITS  # Slots per wheel
+LEVELS = 4  # 256 ** 4 ticks: about 8,000 years of minutes
+_MASK = SLOTS - 1
+_SHIFTS = [(level, SLOT_BITS * level) for level in range(1, LEVELS)]
+
+MINUTE, HOUR, DAY = 1, 60, 24 * 60  # In ticks of one minute
+
+
+class Timer:
+    """A scheduled call; returned by TimerWheel.schedule() for cancelling."""
+
+    __slots__ = ("due", "every", "target", "method", "args", "slot", "level")
+
+    def __init__(self, due, every, target, method, args):
+        self.due = due  # Tick of the next call
+        self.every = every  # Ticks between calls; None for a one-shot timer
+        self.target = target
+        self.method = method
+        self.args = args
+        self.slot = None  # The dict holding the timer while it is pending
+        self.level = None  # The wheel of that slot; LEVELS for the overflow
+
+    @property
+    def pending(self):
+        """Whether the timer will fire again."""
+        return self.slot is not None
+
+    def __repr__(self):
+        repeat = f", every {self.every}" if self.every else ""
+        return f"<Timer {self.method}{self.args} at {self.due}{repeat}>"
+
+
+class TimerWheel:
+    """Schedules method calls on objects and fires them on a simulated clock."""
+
+    def __init__(self, now=0):
+        """Initialize an empty wheel.
+
+        Args:
+            now (int): The tick the clock starts at
+        """
+        self.now = now
+        self.fired = 0  # Calls made so far
+        self._wheels = [[{} for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self._counts = [0] * LEVELS  # Pending timers per level
+        self._overflow = {}  # Timers beyond the top level
+
+    def __len__(self):
+        return sum(self._counts) + len(self._overflow)
+
+    def _place(self, timer):
+        due, now = timer.due, self.now
+        if due - now < SLOTS:
+            slot = self._wheels[0][due & _MASK]
+            level = 0
+        else:
+            for level, shift in _SHIFTS:
+                if (due >> shift) - (now >> shift) < SLOTS:
+                    slot = self._wheels[level][(due >> shift) & _MASK]
+                    break
+            else:
+                slot, level = self._overflow, LEVELS
+        slot[timer] = None
+        timer.slot, timer.level = slot, level
+        if level < LEVELS:
+            self._counts[level] += 1
+
+    def schedule(self, target, method, *args, delay=0, every=None):
+        """Call ``target.method(*args)`` after ``delay`` ticks.
+
+        Args:
+            target: The animal (or any object) to call the method on
+            method (str): The method name, e.g. "eat"
+            *args: Arguments for every call
+            delay (int): Ticks until the first call; 0 means the current tick
+                (fired by the next advance(), or still within the tick being
+                fired when a firing callback schedules it)
+            every (int, optional): Repeat the call every this many ticks
+
+        Returns:
+            Timer: Pass it to cancel() to stop the calls
+        """
+        if delay < 0:
+            raise ValueError("A timer cannot be scheduled in the past.")
+        if every is not None and every <= 0:
+            raise ValueError("The interval of a recurring timer must be positive.")
+        timer = Timer(self.now + delay, every, target, method, args)
+        self._place(timer)
+        return timer
+
+    def schedule_many(self, targets, method, *args, delay=0, every=None, spread=0):
+        """Schedule the same call for many objects.
+
+        Args:
+            targets (iterable): The objects
+            method, *args, delay, every: As for schedule()
+            spread (int): Stagger the first calls over this many ticks, so
+                that e.g. a daily routine does not fire for every animal at
+                the same minute
+
+        Returns:
+            list: The Timers, in the order of ``targets``
+        """
+        timers = []
+        now, place = self.now, self._place
+        with _collecting_less():
+            for index, target in enumerate(targets):
+                timer = Timer(now + delay + (index % spread if spread else 0), every, target, method, args)
+                place(timer)
+                timers.append(timer)
+        return timers
+
+    def cancel(self, timer):
+        """Stop a timer; returns False if it was not pending."""
+        slot = timer.slot
+        if slot is None:
+            return False
+        del slot[timer]
+        timer.slot = None
+        if timer.level < LEVELS:
+            self._counts[timer.level] -= 1
+        return True
+
+    def _cascade(self, level):
+        """Move the timers of the level's slot for the current window down."""
+        slot = self._wheels[level][(self.now >> (SLOT_BITS * level)) & _MASK]
+        if not slot:
+            return
+        timers = list(slot)
+        slot.clear()
+        self._counts[level] -= len(timers)
+        for timer in timers:
+            self._place(timer)
+
+    def _fire(self, slot):
+        """Fire the timers of a level-0 slot, grouped into batches."""
+        timers = list(slot)
+        slot.clear()
+        self._counts[0] -= len(timers)
+        batches = {}  # (method, args or their id) -> (args, targets)
+        for timer in timers:
+            timer.slot = None
+            key = (timer.method, timer.args)
+            try:
+                batch = batches.get(key)
+            except TypeError:
+                # Unhashable arguments: group only the timers sharing the args
+                # tuple (as schedule_many's timers do)
+                key = (timer.method, id(timer.args))
+                batch = batches.get(key)
+            if batch is None:
+                batch = batches[key] = (timer.args, [])
+            batch[1].append(timer.target)
+            if timer.every:
+                timer.due += timer.every
+                self._place(timer)
+        for (method, _), (args, targets) in batches.items():
+            dispatch(targets, method, *args)
+        self.fired += len(timers)
+        return len(timers)
+
+    def advance(self, ticks=1):
+        """Run the clock forward, firing every timer that falls due.
+
+        The timers of the current tick fire first; the clock then stops
+        ``ticks`` later, before firing that tick's timers.
+
+        Args:
+            ticks (int): How far to move the clock
+
+        Returns:
+            int: The number of calls made
+        """
+        end = self.now + ticks
+        fired = 0
+        wheel0, counts = self._wheels[0], self._counts
+        while self.now < end:
+            if counts[0]:
+                slot = wheel0[self.now & _MASK]
+                while slot:  # Callbacks may schedule more calls for this tick
+                    fired += self._fire(slot)
+                self.now += 1
+            else:
+                # Nothing due in this window: jump to the next one
+                self.now = min(end, ((self.now >> SLOT_BITS) + 1) << SLOT_BITS)
+            if self.now & _MASK == 0 and self.now <= end:
+                self._enter_window()
+        return fired
+
+    def _enter_window(self):
+        """Cascade the higher levels' slots for the window the clock entered."""
+        now = self.now
+        if self._overflow and now & ((1 << (SLOT_BITS * LEVELS)) - 1) == 0:
+            timers = list(self._overflow)
+            self._overflow.clear()
+            for timer in timers:
+                self._place(timer)
+        # Highest level first, so its timers can drop through the levels below
+        top = 1
+        while top < LEVELS - 1 and now & ((1 << (SLOT_BITS * (top + 1))) - 1) == 0:
+            top += 1
+        for level in range(top, 0, -1):
+            if self._counts[level]:
+                self._cascade(level)
+
+    def next_due(self):
+        """Return the tick of the next timer that will fire, or None."""
+        if not len(self):
+            return None
+        return min(timer.due for level in self._wheels for slot in level for timer in slot) \
+            if sum(self._counts) else min(timer.due for timer in self._overflow)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    from Animal_kingdom_classes import Lion, Eagle, Snake
+    from event_sink import NullSink, using
+
+    simba = Lion("Simba", 5, 190.5, "golden", "large")
+    nagini = Snake("Nagini", 8, 45.0, "smooth", True, 4.5)
+
+    wheel = TimerWheel()
+    wheel.schedule(simba, "eat", "zebra", delay=7 * HOUR, every=DAY)
+    wheel.schedule(simba, "sleep", 16, delay=9 * HOUR, every=DAY)
+    wheel.schedule(nagini, "bask", delay=10 * HOUR, every=DAY)
+    shedding = wheel.schedule(nagini, "shed_skin", delay=30 * DAY)
+    wheel.schedule(simba, "regulate_temperature", delay=12 * HOUR)
+
+    print("=== First Two Days ===")
+    wheel.advance(2 * DAY)
+
+    print("\n=== Shedding Cancelled ===")
+    print(wheel.cancel(shedding), shedding.pending, f"{len(wheel)} timers pending")
+
+    print("\n=== A Month for 10,000 Animals ===")
+    zoo = []
+    for i in range(10_000):
+        if i % 3 == 0:
+            zoo.append(Lion("Simba", 5, 190.5, "golden", "large"))
+        elif i % 3 == 1:
+            zoo.append(Eagle("Hedwig", 3, 6.2, 2.1, 3.0))
+        else:
+            zoo.append(Snake("Nagini", 8, 45.0, "smooth", True, 4.5))
+    wheel = TimerWheel()
+    start = time.perf_counter()
+    wheel.schedule_many(zoo, "eat", "meat", delay=6 * HOUR, every=DAY, spread=HOUR)
+    wheel.schedule_many(zoo, "sleep", 10, delay=20 * HOUR, every=DAY, spread=2 * HOUR)
+    wheel.schedule_many(zoo[2::3], "bask", delay=9 * HOUR, every=DAY, spread=3 * HOUR)
+    wheel.schedule_many(zoo[::3], "regulate_temperature", delay=0, every=4 * HOUR, spread=4 * HOUR)
+    wheel.schedule_many(zoo[2::3], "shed_skin", delay=45 * DAY, spread=30 * DAY)
+    print(f"Scheduled {len(wheel):,} timers in {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    with using(NullSink()):
+        fired = wheel.advance(30 * DAY)
+    print(f"Fast-forwarded 30 days ({30 * DAY:,} ticks): {fired:,} calls in {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,426 @@
+"""Append-only log of vehicle state transitions with snapshots and replay.
+
+TransitionLog is an event sink that records every accepted start, stop,
+accelerate, brake, anchor, raise_anchor, take_off, land and change_altitude
+of a fleet as a fixed-width binary record (timestamp, vehicle id, operation,
+argument). Rejected transitions are reported through write_rejected() (see
+event_sink.emit_rejected) and are not logged. Every ``snapshot_every``
+records the fleet's state is written to a snapshot file, so replay() only
+has to re-apply the records after the nearest snapshot before the requested
+time. compact() drops the records and snapshots that are no longer needed.
+
+A log directory holds:
+
+    transitions.log       header (magic, version, index of the first
+                          record) followed by the records
+    snapshot-<n>.state    the fleet's state after the first n records
+
+Vehicle ids are positions in the list given to TransitionLog. Only changes
+made through the vehicle methods are logged; state set directly (for
+example through a FleetStore) is not.
+"""
+import os
+import struct
+import time
+from array import array
+from collections import namedtuple
+
+MAGIC = b"OOPTLOG\0"
+SNAPSHOT_MAGIC = b"OOPTSNP\0"
+VERSION = 1
+LOG_NAME = "transitions.log"
+
+_LOG_HEADER = struct.Struct("<8sHxxxxxxQ")
+_RECORD = struct.Struct("<dIBxxxd")  # timestamp, vehicle id, operation, argument
+_SNAPSHOT_HEADER = struct.Struct("<8sHxxIQd")  # magic, version, vehicles, record index, timestamp
+
+# Operation codes; append new ones at the end to keep old logs readable
+OPERATIONS = ("start", "stop", "accelerate", "brake", "anchor", "raise_anchor", "take_off", "land", "change_altitude")
+START, STOP, ACCELERATE, BRAKE, ANCHOR, RAISE_ANCHOR, TAKE_OFF, LAND, CHANGE_ALTITUDE = range(len(OPERATIONS))
+_CODES = {name: code for code, name in enumerate(OPERATIONS)}
+
+TAKE_OFF_ALTITUDE = 1000
+
+FleetState = namedtuple("FleetState", ["timestamp", "speed", "is_running", "is_anchored", "is_landed", "altitude"])
+SnapshotInfo = namedtuple("SnapshotInfo", ["index", "timestamp", "path"])
+
+
+def _log_path(directory):
+    return os.path.join(directory, LOG_NAME)
+
+
+def _snapshot_path(directory, index):
+    return os.path.join(directory, f"snapshot-{index:012d}.state")
+
+
+def capture(vehicles, timestamp=0.0):
+    """Read the logged state of a fleet.
+
+    Args:
+        vehicles (sequence): The vehicles, in id order
+        timestamp (float): Time the state is taken at
+
+    Returns:
+        FleetState: One list per attribute; is_anchored is False for
+            vehicles that are not boats, is_landed and altitude are
+            False/0 for vehicles that are not planes
+    """
+    return FleetState(
+        timestamp,
+        [v.speed for v in vehicles],
+        [bool(v.is_running) for v in vehicles],
+        [bool(getattr(v, "is_anchored", False)) for v in vehicles],
+        [bool(getattr(v, "is_landed", False)) for v in vehicles],
+        [getattr(v, "altitude", 0) for v in vehicles],
+    )
+
+
+def restore(vehicles, state):
+    """Set a fleet's attributes from a FleetState.
+
+    Args:
+        vehicles (sequence): The vehicles, in id order
+        state (FleetState): The state to apply
+    """
+    for i, vehicle in enumerate(vehicles):
+        vehicle.speed = _number(state.speed[i])
+        vehicle.is_running = bool(state.is_running[i])
+        if hasattr(vehicle, "is_anchored"):
+            vehicle.is_anchored = bool(state.is_anchored[i])
+        if hasattr(vehicle, "is_landed"):
+            vehicle.is_landed = bool(state.is_landed[i])
+            vehicle.altitude = _number(state.altitude[i])
+
+
+def _number(value):
+    """Turn whole floats read back from a file into ints."""
+    return int(value) if isinstance(value, float) and value.is_integer() else value
+
+
+def _write_snapshot(directory, index, state):
+    path = _snapshot_path(directory, index)
+    with open(path + ".tmp", "wb") as file:
+        file.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, VERSION, len(state.speed), index, state.timestamp))
+        file.write(array("d", state.speed).tobytes())
+        file.write(array("d", state.altitude).tobytes())
+        file.write(array("b", state.is_running).tobytes())
+        file.write(array("b", state.is_anchored).tobytes())
+        file.write(array("b", state.is_landed).tobytes())
+    os.replace(path + ".tmp", path)
+
+
+def _read_snapshot(path):
+    with open(path, "rb") as file:
+        magic, version, count, index, timestamp = _SNAPSHOT_HEADER.unpack(file.read(_SNAPSHOT_HEADER.size))
+        if magic != SNAPSHOT_MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a supported transition snapshot.")
+        columns = []
+        for typecode in "ddbbb":
+            column = array(typecode)
+            column.fromfile(file, count)
+            columns.append(column.tolist())
+    speed, altitude, is_running, is_anchored, is_landed = columns
+    return index, FleetState(timestamp, speed, is_running, is_anchored, is_landed, altitude)
+
+
+def snapshots(directory):
+    """List the snapshots in a log directory.
+
+    Returns:
+        list: SnapshotInfo for each snapshot, oldest first
+    """
+    found = []
+    for name in sorted(os.listdir(directory)):
+        if name.startswith("snapshot-") and name.endswith(".state"):
+            path = os.path.join(directory, name)
+            with open(path, "rb") as file:
+                _, _, _, index, timestamp = _SNAPSHOT_HEADER.unpack(file.read(_SNAPSHOT_HEADER.size))
+            found.append(SnapshotInfo(index, timestamp, path))
+    return found
+
+
+def _read_log_header(file, path):
+    magic, version, base = _LOG_HEADER.unpack(file.read(_LOG_HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a supported transition log.")
+    return base
+
+
+class TransitionLog:
+    """Event sink that appends a fleet's accepted transitions to a log."""
+
+    def __init__(self, directory, vehicles, snapshot_every=100_000, clock=time.time, forward=None,
+                 buffer_records=8192):
+        """Start a new log for a fleet, beginning with a snapshot of its state.
+
+        Args:
+            directory (str): Where the log and snapshots are written; it must
+                not already contain a log
+            vehicles (sequence): The fleet; a vehicle's id is its position
+            snapshot_every (int): Records between snapshots
+            clock (callable): Returns the timestamp of each record; must not
+                go backwards (e.g. time.time or a simulation tick counter)
+            forward: Another sink that every event is passed on to, or None
+            buffer_records (int): Records buffered before a write to disk
+        """
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.vehicles = list(vehicles)
+        self.snapshot_every = snapshot_every
+        self.clock = clock
+        self.forward = forward
+        self.buffer_records = buffer_records
+        self._ids = {id(vehicle): i for i, vehicle in enumerate(self.vehicles)}
+        self._file = open(_log_path(directory), "xb")
+        self._file.write(_LOG_HEADER.pack(MAGIC, VERSION, 0))
+        self._buffer = []
+        self.count = 0  # Records logged, including compacted ones
+        _write_snapshot(directory, 0, capture(self.vehicles, clock()))
+
+    def write(self, event):
+        if self.forward is not None:
+            self.forward.write(event)
+        code = _CODES.get(event.action)
+        if code is None:
+            return
+        vehicle_id = self._ids.get(id(event.actor))
+        if vehicle_id is None:
+            return
+        timestamp = self.clock()
+        self._buffer.append(_RECORD.pack(timestamp, vehicle_id, code, event.args[0] if event.args else 0.0))
+        self.count += 1
+        if len(self._buffer) >= self.buffer_records:
+            self._write_buffer()
+        if self.count % self.snapshot_every == 0:
+            self._write_buffer()
+            _write_snapshot(self.directory, self.count, capture(self.vehicles, timestamp))
+
+    def write_rejected(self, event):
+        if self.forward is None:
+            return
+        write_rejected = getattr(self.forward, "write_rejected", None)
+        if write_rejected is not None:
+            write_rejected(event)
+        else:
+            self.forward.write(event)
+
+    def write_many(self, events):
+        for event in events:
+            self.write(event)
+
+    def _write_buffer(self):
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer = []
+
+    def flush(self):
+        """Write buffered records to disk and flush the forward sink."""
+        self._write_buffer()
+        self._file.flush()
+        if self.forward is not None:
+            self.forward.flush()
+
+    def snapshot(self):
+        """Write a snapshot of the fleet's current state now."""
+        self.flush()
+        _write_snapshot(self.directory, self.count, capture(self.vehicles, self.clock()))
+
+    def compact(self, timestamp=None):
+        """Drop the records and snapshots older than a snapshot (see compact)."""
+        self.flush()
+        self._file.close()
+        try:
+            compact(self.directory, timestamp)
+        finally:
+            self._file = open(_log_path(self.directory), "ab")
+
+    def close(self):
+        """Flush and close the log file."""
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def _nearest_snapshot(directory, timestamp):
+    candidates = snapshots(directory)
+    if timestamp is not None:
+        candidates = [info for info in candidates if info.timestamp <= timestamp]
+    if not candidates:
+        raise ValueError(f"No snapshot in {directory} at or before {timestamp}.")
+    return candidates[-1]
+
+
+def read_records(directory, start=0):
+    """Yield the records of a log as (timestamp, vehicle id, operation, argument).
+
+    Args:
+        directory (str): The log directory
+        start (int): Index of the first record to read; it must not have
+            been compacted away
+    """
+    path = _log_path(directory)
+    with open(path, "rb") as file:
+        base = _read_log_header(file, path)
+        if start < base:
+            raise ValueError(f"Record {start} was compacted away; the log starts at record {base}.")
+        file.seek(_LOG_HEADER.size + (start - base) * _RECORD.size)
+        while True:
+            data = file.read(_RECORD.size * 65536)
+            if not data:
+                return
+            yield from _RECORD.iter_unpack(data[:len(data) - len(data) % _RECORD.size])
+
+
+def replay(directory, timestamp=None):
+    """Rebuild a fleet's state at a point in time.
+
+    Starts from the latest snapshot taken at or before ``timestamp`` and
+    applies the records that follow it up to ``timestamp``.
+
+    Args:
+        directory (str): The log directory
+        timestamp (float): The point in time, or None for the latest state
+
+    Returns:
+        FleetState: The state of every vehicle (see restore); the flag
+            columns hold bools and speed and altitude numbers, with whole
+            numbers as ints
+    """
+    info = _nearest_snapshot(directory, timestamp)
+    index, state = _read_snapshot(info.path)
+    speed, running, anchored, landed, altitude = (state.speed, state.is_running, state.is_anchored,
+                                                  state.is_landed, state.altitude)
+    last = state.timestamp
+    limit = float("inf") if timestamp is None else timestamp
+    for when, vehicle, operation, argument in read_records(directory, index):
+        if when > limit:
+            break
+        last = when
+        if operation == ACCELERATE:
+            speed[vehicle] += argument
+        elif operation == CHANGE_ALTITUDE:
+            altitude[vehicle] += argument
+        elif operation == BRAKE:
+            current = speed[vehicle]
+            speed[vehicle] = 0 if argument > current else current - argument
+        elif operation == START:
+            running[vehicle] = True
+        elif operation == STOP:
+            running[vehicle] = False
+            speed[vehicle] = 0
+        elif operation == ANCHOR:
+            anchored[vehicle] = True
+            speed[vehicle] = 0
+        elif operation == RAISE_ANCHOR:
+            anchored[vehicle] = False
+        elif operation == TAKE_OFF:
+            landed[vehicle] = False
+            altitude[vehicle] = TAKE_OFF_ALTITUDE
+        elif operation == LAND:
+            landed[vehicle] = True
+            altitude[vehicle] = 0
+            speed[vehicle] = 0
+    # Snapshot columns come back as 0/1 and floats, logged ones as bools and sums
+    return FleetState(last if timestamp is None else timestamp, list(map(_number, speed)), list(map(bool, running)),
+                      list(map(bool, anchored)), list(map(bool, landed)), list(map(_number, altitude)))
+
+
+def compact(directory, timestamp=None):
+    """Drop everything that precedes a snapshot.
+
+    Records before the latest snapshot taken at or before ``timestamp`` (the
+    latest snapshot overall if None) are removed from the log, along with
+    every older snapshot. Replays from that snapshot on are unaffected.
+
+    Args:
+        directory (str): The log directory
+        timestamp (float): Keep the history from this point in time on
+
+    Returns:
+        int: The number of records removed
+    """
+    keep = _nearest_snapshot(directory, timestamp)
+    path = _log_path(directory)
+    with open(path, "rb") as source:
+        base = _read_log_header(source, path)
+        if keep.index <= base:
+            removed = 0
+        else:
+            source.seek(_LOG_HEADER.size + (keep.index - base) * _RECORD.size)
+            with open(path + ".tmp", "wb") as target:
+                target.write(_LOG_HEADER.pack(MAGIC, VERSION, keep.index))
+                while True:
+                    data = source.read(1 << 20)
+                    if not data:
+                        break
+                    target.write(data)
+            removed = keep.index - base
+    if removed:
+        os.replace(path + ".tmp", path)
+    for info in snapshots(directory):
+        if info.index < keep.index:
+            os.remove(info.path)
+    return removed
+
+
+# Example usage
+if __name__ == "__main__":
+    import random
+    import tempfile
+    from itertools import count
+
+    import event_sink
+    from Vehicle_polymorphism_challenge import Car, Boat, Plane
+
+    rng = random.Random(3)
+    fleet = []
+    for i in range(1000):
+        if i % 3 == 0:
+            fleet.append(Car("Tesla", "Model S", 2023, "red", "electric", 4))
+        elif i % 3 == 1:
+            fleet.append(Boat("Sunseeker", "Predator", 2021, "white", "yacht", 24.5))
+        else:
+            fleet.append(Plane("Boeing", "747", 2020, "blue and white", 45000, 4))
+
+    directory = tempfile.mkdtemp()
+    ticks = count()
+    commands = ("start", "accelerate", "brake", "anchor", "raise_anchor", "take_off", "land", "change_altitude")
+    with TransitionLog(directory, fleet, snapshot_every=250_000, clock=lambda: next(ticks)) as log, \
+            event_sink.using(log):
+        for _ in range(1_000_000):
+            vehicle = rng.choice(fleet)
+            command = getattr(vehicle, rng.choice(commands), None)
+            if command is None:
+                continue
+            if command.__name__ in ("accelerate", "brake"):
+                command(rng.randrange(10, 80))
+            elif command.__name__ == "change_altitude":
+                command(rng.randrange(-3000, 5000))
+            else:
+                command()
+        expected = capture(fleet)
+        print(f"Logged {log.count:,} accepted transitions, {len(snapshots(directory))} snapshots")
+
+    start = time.perf_counter()
+    state = replay(directory)
+    print(f"Latest state replayed in {(time.perf_counter() - start) * 1000:.1f} ms: "
+          f"{'matches' if state[1:] == expected[1:] else 'DIFFERS FROM'} the live fleet")
+
+    # Replaying up to just before the second snapshot starts from the first
+    # one, so it applies a full interval of records
+    before = snapshots(directory)[1]
+    start = time.perf_counter()
+    replay(directory, before.timestamp - 0.5)
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {before.index - 1:,} records in {elapsed * 1000:.1f} ms "
+          f"({(before.index - 1) / elapsed / 1e6:.1f}M records/s)")
+
+    print(f"Compaction removed {compact(directory):,} records")
+    print(f"Replay after compaction still matches: {replay(directory)[1:] == expected[1:]}")
@@ -0,0 +1,2 @@
+# Moved to oop_demos/vehicle_transitions.py; kept so existing imports keep working
+from oop_demos.vehicle_transitions import *  # noqa: F401,F403